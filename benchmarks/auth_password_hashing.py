@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+""" Login throughput of the auth service for each password hashing cost setting.
+
+Creates a user in a temporary SQLite database and, for each hashing setting (the legacy
+single SHA-256 and scrypt with increasing `n`), stores its password hash and calls
+`UserServices.user_exists` concurrently from several request threads, with the hashes
+computed in the `HashingPool` worker processes. It prints the logins per second and the
+p50/p95 login latencies.
+
+Usage:
+    python3 benchmarks/auth_password_hashing.py [--logins 200] [--threads 8] [--workers 2]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+SETTINGS: List[Dict] = [
+    {'algorithm': 'sha256'},
+    {'algorithm': 'scrypt', 'n': 4096},
+    {'algorithm': 'scrypt', 'n': 16384},
+    {'algorithm': 'scrypt', 'n': 32768},
+]
+
+
+def run(schema, cfg, logins: int, threads: int) -> Dict:
+    """ Logs the benchmark user in concurrently and measures the throughput.
+
+    Args:
+        - schema (Schema): The database handler.
+        - cfg (AuthConfiguration): The configuration with the hashing setting to measure.
+        - logins (int): The number of logins.
+        - threads (int): The number of concurrent request threads.
+
+    Returns:
+        - Dict: The results of the run (`seconds` and `latencies`).
+
+    Raises:
+        - RuntimeError: If a login is rejected.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dms2223auth.service import UserServices
+
+    def login(_: int) -> float:
+        start: float = time.perf_counter()
+        if not UserServices.user_exists('user', 'password', schema, cfg):
+            raise RuntimeError('The login was rejected')
+        return time.perf_counter() - start
+
+    start: float = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        latencies: List[float] = list(executor.map(login, range(logins)))
+    return {'seconds': time.perf_counter() - start, 'latencies': latencies}
+
+
+def main() -> None:
+    """ Runs the benchmark with each hashing setting and prints the results.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dms2223auth.data.config import AuthConfiguration
+    from dms2223auth.data.db import Schema
+    from dms2223auth.data.db.resultsets import Users
+    from dms2223auth.service import UserServices
+    from dms2223auth.service.hashingpool import HashingPool
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--logins', type=int, default=200)
+    parser.add_argument('--threads', type=int, default=8, help='Concurrent request threads')
+    parser.add_argument('--workers', type=int, default=2, help='Hashing worker processes')
+    args = parser.parse_args()
+
+    HashingPool.configure(args.workers)
+    with tempfile.TemporaryDirectory() as directory:
+        cfg: AuthConfiguration = AuthConfiguration()
+        cfg.set_db_connection_string(
+            'sqlite:///' + os.path.join(directory, 'dms2223auth.sqlite3.db'))
+        schema: Schema = Schema(cfg)
+        UserServices.create_user('user', 'password', schema, cfg)
+        for setting in SETTINGS:
+            cfg.set_password_hashing({**cfg.get_password_hashing(), **setting})
+            password_hash: str = Users.password_hasher(
+                cfg.get_password_hashing(), cfg.get_password_salt()).hash('password', 'user')
+            session = schema.new_session()
+            try:
+                Users.update_password_hash(
+                    session, 'user', Users.get_password_hash(session, 'user'), password_hash)
+            finally:
+                schema.remove_session()
+            run(schema, cfg, args.threads, args.threads)  # Warm up the worker processes
+            result: Dict = run(schema, cfg, args.logins, args.threads)
+            latencies: List[float] = sorted(result['latencies'])
+            name: str = ' '.join(f'{key}={value}' for key, value in setting.items())
+            print(f'{name:>24}: {args.logins / result["seconds"]:8.1f} logins/s, '
+                  f'p50 {statistics.median(latencies) * 1000:7.1f} ms, '
+                  f'p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:7.1f} ms')
+    HashingPool.configure(0)
+
+
+if __name__ == '__main__':
+    main()
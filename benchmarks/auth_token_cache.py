@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+""" Throughput microbenchmark of the auth service user token verification.
+
+Calls `dms2223auth.presentation.rest.security.verify_token` in a loop, within an
+application context set up like `bin/dms2223auth` does (over an in-memory SQLite
+database, where the current token version of each user is looked up), with the token cache
+disabled and enabled. The workload cycles over a set of distinct valid tokens, as issued to
+concurrent users, and the cache hit rate of each run is printed with the results.
+
+Usage:
+    python3 benchmarks/auth_token_cache.py [--calls 100000] [--tokens 100] [--capacity 4096]
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List
+
+
+def sign_tokens(secret: str, count: int) -> List[str]:
+    """ Signs user tokens like the authentication service does.
+
+    Args:
+        - secret (str): The JWS secret.
+        - count (int): The number of distinct tokens.
+
+    Returns:
+        - List[str]: The JWS user tokens, valid for an hour.
+    """
+    # pylint: disable=import-outside-toplevel
+    from authlib.jose import JsonWebSignature  # type: ignore
+
+    jws: JsonWebSignature = JsonWebSignature()
+    return [
+        jws.serialize_compact(
+            {'alg': 'HS256'},
+            json.dumps({'user': f'user{n}', 'sub': f'user{n}', 'exp': time.time() + 3600})
+            .encode('UTF-8'),
+            secret.encode('UTF-8')
+        ).decode('ascii')
+        for n in range(count)
+    ]
+
+
+def run(db: Any, calls: int, tokens: int, capacity: int) -> Dict:
+    """ Verifies tokens in a loop and measures the throughput.
+
+    Args:
+        - db (Schema): The authentication service database schema.
+        - calls (int): The number of verifications.
+        - tokens (int): The number of distinct tokens verified.
+        - capacity (int): The token cache capacity (zero disables the cache).
+
+    Returns:
+        - Dict: The results of the run (`calls`, `seconds` and the cache `hit_rate`).
+    """
+    # pylint: disable=import-outside-toplevel
+    from flask import Flask, current_app
+    from authlib.jose import JsonWebSignature  # type: ignore
+    from dms2223auth.data.config import AuthConfiguration
+    from dms2223auth.presentation.rest.security import verify_token
+    from dms2223auth.service.tokencache import TokenCache
+
+    cfg: AuthConfiguration = AuthConfiguration()
+    TokenCache.configure(capacity, 30.0)
+    app: Flask = Flask(__name__)
+    with app.app_context():
+        current_app.db = db
+        current_app.cfg = cfg
+        current_app.jws = JsonWebSignature()
+        issued: List[str] = sign_tokens(cfg.get_jws_secret(), tokens)
+        hits: int = TokenCache.get_metrics()['hits']
+        start: float = time.perf_counter()
+        for n in range(calls):
+            verify_token(issued[n % tokens])
+        seconds: float = time.perf_counter() - start
+    # The cache counters are kept across runs, so only the hits of this one are counted
+    hits = TokenCache.get_metrics()['hits'] - hits
+    return {'calls': calls, 'seconds': seconds, 'hit_rate': hits / calls if calls > 0 else 0.0}
+
+
+def main() -> None:
+    """ Runs the benchmark with and without the cache and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--calls', type=int, default=100000)
+    parser.add_argument('--tokens', type=int, default=100, help='Distinct tokens verified')
+    parser.add_argument('--capacity', type=int, default=4096, help='Token cache capacity')
+    args = parser.parse_args()
+
+    # pylint: disable=import-outside-toplevel
+    from dms2223auth.data.config import AuthConfiguration
+    from dms2223auth.data.db import Schema
+
+    cfg: AuthConfiguration = AuthConfiguration()
+    cfg.set_db_connection_string('sqlite://')
+    db: Schema = Schema(cfg)
+    for name, capacity in (('without cache', 0), ('with cache', args.capacity)):
+        result: Dict = run(db, args.calls, args.tokens, capacity)
+        print(f"{name:>14}: {result['calls'] / result['seconds']:10.0f} verifications/s, "
+              f"hit rate {result['hit_rate']:6.1%}")
+
+
+if __name__ == '__main__':
+    main()
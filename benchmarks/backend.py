@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+""" Backend REST API benchmark suite.
+
+Builds the backend application with `create_app` from `bin/dms2223backend` over
+synthetic SQLite datasets of the given sizes, signing a user token with the configured
+JWS secret so that it is verified locally as in production (the current token version
+of the user is answered by a stand-in of the authentication service).
+Then it drives every operation in `openapi/spec.yml` through the test client. For each
+operation it records the p50/p95/p99 latency, the SQL statements per request and the
+peak memory allocated while serving a request.
+
+The results are written as a JSON baseline. When an earlier baseline is passed with
+`--compare`, p95 latencies that got slower than the tolerance are reported and the
+script exits with status 1. With `--check-statements N`, the service runs in the
+statement log `test` mode, so the operations running the same SQL statement more than N
+times in a request answer with status 500 and the statement is logged.
+
+Usage:
+    python3 benchmarks/backend.py [--sizes 10000 100000 1000000] [--requests 100]
+        [--output benchmarks/backend-baseline.json] [--compare OLD.json] [--tolerance 0.2]
+        [--check-statements N]
+"""
+
+import argparse
+import importlib.machinery
+import importlib.util
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+ROOT_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR: str = os.path.join(ROOT_DIR, 'components', 'dms2223backend')
+API_KEY: str = 'benchmark-api-key'
+
+
+def synthetic_records(rows: int) -> Iterator[Dict]:
+    """ Generates a synthetic dataset.
+
+    The rows are split into 10% discussions, 40% answers, 40% comments and 10% reports
+    (equally divided among discussion, answer and comment reports).
+
+    Args:
+        - rows (int): The approximate total number of rows.
+
+    Returns:
+        - Iterator[Dict]: The records, in the `BulkLoader` format.
+    """
+    counts: Dict[str, int] = dataset_counts(rows)
+    for i in range(1, counts['discussion'] + 1):
+        yield {'type': 'discussion', 'id': i, 'title': f'Discussion {i}',
+               'content': f'Synthetic discussion number {i}'}
+    for i in range(1, counts['answer'] + 1):
+        yield {'type': 'answer', 'id': i, 'discussionid': (i - 1) % counts['discussion'] + 1,
+               'content': f'Synthetic answer number {i}'}
+    for i in range(1, counts['comment'] + 1):
+        answerid: int = (i - 1) % counts['answer'] + 1
+        yield {'type': 'comment', 'id': i, 'answerid': answerid,
+               'discussionid': (answerid - 1) % counts['discussion'] + 1,
+               'content': f'Synthetic comment number {i}'}
+    for i in range(1, counts['report'] + 1):
+        yield {'type': 'report', 'discussionid': (i - 1) % counts['discussion'] + 1,
+               'reason': f'Synthetic report number {i}'}
+        yield {'type': 'reportanswer', 'answerid': (i - 1) % counts['answer'] + 1,
+               'reason': f'Synthetic report number {i}'}
+        yield {'type': 'reportcomment', 'commentid': (i - 1) % counts['comment'] + 1,
+               'reason': f'Synthetic report number {i}'}
+
+
+def dataset_counts(rows: int) -> Dict[str, int]:
+    """ Gets the number of records of each kind in a synthetic dataset.
+
+    Args:
+        - rows (int): The approximate total number of rows.
+
+    Returns:
+        - Dict[str, int]: The number of discussions, answers, comments and reports of each kind.
+    """
+    return {
+        'discussion': max(1, rows // 10),
+        'answer': max(1, rows * 4 // 10),
+        'comment': max(1, rows * 4 // 10),
+        'report': max(1, rows // 30),
+    }
+
+
+def resolve(spec: Dict, node: Dict) -> Dict:
+    """ Resolves a local `$ref` of the specification.
+
+    Args:
+        - spec (Dict): The OpenAPI specification.
+        - node (Dict): A node that may be a reference.
+
+    Returns:
+        - Dict: The referenced node, or the node itself.
+    """
+    while '$ref' in node:
+        target: Any = spec
+        for part in node['$ref'].lstrip('#/').split('/'):
+            target = target[part]
+        node = target
+    return node
+
+
+def sample_value(spec: Dict, schema: Dict) -> Any:
+    """ Builds a sample value for a JSON schema.
+
+    Args:
+        - spec (Dict): The OpenAPI specification.
+        - schema (Dict): The schema of the value.
+
+    Returns:
+        - Any: A value valid for simple schemas.
+    """
+    schema = resolve(spec, schema)
+    if schema.get('type') == 'object':
+        return {name: sample_value(spec, prop)
+                for name, prop in schema.get('properties', {}).items()}
+    if schema.get('type') == 'array':
+        return []
+    if schema.get('type') == 'integer':
+        return 1
+    if schema.get('type') == 'boolean':
+        return True
+    return 'Benchmark text'
+
+
+def build_requests(spec: Dict,
+                   counts: Dict[str, int]) -> List[Tuple[str, str, str, Optional[Dict]]]:
+    """ Builds one request for every operation in the specification.
+
+    Path ids point to records in the middle of the dataset; optional query parameters
+    are left to their defaults.
+
+    Args:
+        - spec (Dict): The OpenAPI specification.
+        - counts (Dict[str, int]): The number of records of each kind in the dataset.
+
+    Returns:
+        - List[Tuple[str, str, str, Optional[Dict]]]: The operation id, HTTP method, URL
+          and JSON body of each request.
+    """
+    path_ids: Dict[str, int] = {
+        'QuestionIdPathParam': counts['discussion'] // 2 + 1,
+        'AnswerIdPathParam': counts['answer'] // 2 + 1,
+        'CommentIdPathParam': counts['comment'] // 2 + 1,
+    }
+    base_url: str = spec['servers'][0]['url']
+    out: List[Tuple[str, str, str, Optional[Dict]]] = []
+    for path, operations in spec['paths'].items():
+        for method, operation in operations.items():
+            if method not in ('get', 'post', 'put', 'delete', 'head', 'patch'):
+                continue
+            url: str = path
+            for parameter in operation.get('parameters', []):
+                name: str = parameter.get('$ref', '').split('/')[-1]
+                parameter = resolve(spec, parameter)
+                if parameter['in'] == 'path':
+                    url = url.replace('{' + parameter['name'] + '}', str(path_ids[name]))
+            body: Optional[Dict] = None
+            content: Dict = operation.get('requestBody', {}).get('content', {})
+            if 'application/json' in content:
+                body = sample_value(spec, content['application/json']['schema'])
+            out.append((operation['operationId'], method.upper(), base_url + url, body))
+    return out
+
+
+def load_create_app():
+    """ Loads the `create_app` function of the backend executable script.
+
+    Returns:
+        - Callable: The `create_app` function.
+    """
+    path: str = os.path.join(BACKEND_DIR, 'bin', 'dms2223backend')
+    loader = importlib.machinery.SourceFileLoader('dms2223backend_bin', path)
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module.create_app
+
+
+def sign_token(secret: str) -> str:
+    """ Signs a user token like the authentication service does.
+
+    Args:
+        - secret (str): The JWS secret.
+
+    Returns:
+        - str: The JWS user token, valid for a day, of a user with every role.
+    """
+    # pylint: disable=import-outside-toplevel
+    from authlib.jose import JsonWebSignature  # type: ignore
+    from dms2223common.data import Role
+
+    payload: Dict = {
+        'user': 'benchmark', 'sub': 'benchmark', 'exp': time.time() + 86400,
+        'roles': [role.name for role in Role], 'ver': 0
+    }
+    return JsonWebSignature().serialize_compact(
+        {'alg': 'HS256'}, json.dumps(payload).encode('UTF-8'), secret.encode('UTF-8')
+    ).decode('ascii')
+
+
+def build_auth_service() -> object:
+    """ Builds a stand-in for the backend `AuthService` that answers the current token
+    version of the benchmark user, so the authentication service is not needed.
+
+    Returns:
+        - object: The authentication service stand-in.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dms2223common.data import Role
+    from dms2223common.data.rest import ResponseData
+
+    class TokenOwnerAuthService():
+        """ Authentication service stand-in.
+        """
+
+        def get_token_owner(self, token: str) -> ResponseData:
+            """ Gets the owner of a token. """
+            response: ResponseData = ResponseData()
+            response.set_successful(bool(token))
+            response.set_content(
+                {'username': 'benchmark', 'roles': [role.name for role in Role], 'ver': 0})
+            return response
+
+    return TokenOwnerAuthService()
+
+
+def send(client: Any, method: str, url: str, body: Optional[Dict], token: str) -> int:
+    """ Sends a request through the application test client.
+
+    Args:
+        - client (Any): The test client.
+        - method (str): The HTTP method.
+        - url (str): The request URL.
+        - body (Optional[Dict]): The JSON body, if any.
+        - token (str): The user token.
+
+    Returns:
+        - int: The response status code.
+    """
+    headers: Dict = {'Authorization': f'Bearer {token}', 'X-ApiKey-Backend': API_KEY}
+    kwargs: Dict = {'headers': headers}
+    if body is not None:
+        kwargs['json'] = body
+    return client.open(url, method=method, **kwargs).status_code
+
+
+def run_dataset(rows: int, requests: int, check_statements: int = 0) -> Dict:
+    """ Benchmarks every operation over a synthetic dataset, in the current process.
+
+    Args:
+        - rows (int): The approximate number of rows of the dataset.
+        - requests (int): The number of timed requests per operation.
+        - check_statements (int): If positive, the service runs in the statement log `test`
+          mode, and the requests running the same statement more than these times fail.
+
+    Returns:
+        - Dict: The benchmark results of the dataset.
+    """
+    # pylint: disable=import-outside-toplevel
+    import yaml
+    from sqlalchemy import event  # type: ignore
+    from sqlalchemy.engine import Engine  # type: ignore
+    from dms2223backend.data.config import BackendConfiguration
+    from dms2223backend.data.db import Schema
+    from dms2223backend.data.db.bulkloader import BulkLoader
+
+    statements: List[int] = [0]
+    event.listen(Engine, 'before_cursor_execute',
+                 lambda *args: statements.__setitem__(0, statements[0] + 1))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cfg: BackendConfiguration = BackendConfiguration()
+        cfg.set_db_connection_string('sqlite:///' + os.path.join(tmp_dir, 'benchmark.db'))
+        cfg.set_authorized_api_keys([API_KEY])
+        if check_statements > 0:
+            cfg.set_statement_log({
+                **cfg.get_statement_log(), 'mode': 'test', 'repeat_threshold': check_statements
+            })
+        db: Schema = Schema(cfg)
+        start: float = time.perf_counter()
+        loaded: int = BulkLoader(db, 10000).load(synthetic_records(rows))
+        seed_seconds: float = time.perf_counter() - start
+
+        token: str = sign_token(cfg.get_jws_secret())
+        app = load_create_app()(cfg, db)
+        app.app.authservice = build_auth_service()
+        client = app.app.test_client()
+
+        spec_path: str = os.path.join(BACKEND_DIR, 'dms2223backend', 'openapi', 'spec.yml')
+        with open(spec_path, 'r', encoding='UTF-8') as stream:
+            spec: Dict = yaml.safe_load(stream)
+
+        operations: Dict[str, Dict] = {}
+        for operation_id, method, url, body in build_requests(spec, dataset_counts(rows)):
+            status: int = send(client, method, url, body, token)  # Warm-up
+            latencies: List[float] = []
+            statements[0] = 0
+            for _ in range(requests):
+                start = time.perf_counter()
+                send(client, method, url, body, token)
+                latencies.append((time.perf_counter() - start) * 1000)
+            queries: float = statements[0] / requests
+            tracemalloc.start()
+            send(client, method, url, body, token)
+            peak: int = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            percentiles: List[float] = statistics.quantiles(latencies, n=100, method='inclusive')
+            operations[operation_id.split('.')[-2] + '.' + operation_id.split('.')[-1]] = {
+                'method': method,
+                'url': url,
+                'status': status,
+                'p50_ms': round(percentiles[49], 3),
+                'p95_ms': round(percentiles[94], 3),
+                'p99_ms': round(percentiles[98], 3),
+                'queries_per_request': round(queries, 2),
+                'peak_memory_kib': round(peak / 1024, 1),
+            }
+        db.remove_session()
+    return {
+        'rows': loaded,
+        'seed_seconds': round(seed_seconds, 2),
+        'peak_rss_mib': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'operations': operations,
+    }
+
+
+def compare(baseline: Dict, results: Dict, tolerance: float) -> List[str]:
+    """ Compares the p95 latencies with those of a baseline.
+
+    Args:
+        - baseline (Dict): The baseline results.
+        - results (Dict): The current results.
+        - tolerance (float): The allowed relative slowdown (e.g., 0.2 for 20%).
+
+    Returns:
+        - List[str]: A description of every regression found.
+    """
+    regressions: List[str] = []
+    for size, dataset in results['datasets'].items():
+        old_dataset: Optional[Dict] = baseline.get('datasets', {}).get(size)
+        if old_dataset is None:
+            continue
+        for operation, metrics in dataset['operations'].items():
+            old: Optional[Dict] = old_dataset['operations'].get(operation)
+            if old is None or old['p95_ms'] <= 0:
+                continue
+            ratio: float = metrics['p95_ms'] / old['p95_ms']
+            if ratio > 1 + tolerance:
+                regressions.append(
+                    f'{size} rows, {operation}: p95 {old["p95_ms"]:.2f} ms -> '
+                    f'{metrics["p95_ms"]:.2f} ms ({(ratio - 1) * 100:+.0f}%)')
+    return regressions
+
+
+def main() -> None:
+    """ Runs the benchmark suite.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000],
+                        help='Dataset sizes, in rows.')
+    parser.add_argument('--requests', type=int, default=100,
+                        help='Timed requests per operation (at least 2).')
+    parser.add_argument('--output', default=os.path.join(ROOT_DIR, 'benchmarks',
+                                                         'backend-baseline.json'))
+    parser.add_argument('--compare', help='Baseline JSON file to compare the results with.')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed relative p95 slowdown when comparing (default: 0.2).')
+    parser.add_argument('--check-statements', type=int, default=0, metavar='N',
+                        help='Fail (status 500) the requests running the same statement more '
+                             'than N times.')
+    args = parser.parse_args()
+    if args.requests < 2:
+        parser.error('--requests must be at least 2 to compute the latency percentiles')
+
+    results: Dict = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'requests_per_operation': args.requests,
+        'datasets': {},
+    }
+    # Each dataset uses a fresh process, as the ORM classes can only be mapped once
+    context = multiprocessing.get_context('spawn')
+    for size in args.sizes:
+        with context.Pool(1) as pool:
+            dataset: Dict = pool.apply(run_dataset, (size, args.requests, args.check_statements))
+        results['datasets'][str(size)] = dataset
+        print(f"{size} rows (seeded in {dataset['seed_seconds']} s, "
+              f"peak RSS {dataset['peak_rss_mib']} MiB)")
+        for operation, metrics in dataset['operations'].items():
+            print(f"  {operation:<40} {metrics['status']:>3} "
+                  f"p50 {metrics['p50_ms']:8.2f} ms  p95 {metrics['p95_ms']:8.2f} ms  "
+                  f"p99 {metrics['p99_ms']:8.2f} ms  {metrics['queries_per_request']:6.2f} q/req  "
+                  f"{metrics['peak_memory_kib']:9.1f} KiB")
+
+    with open(args.output, 'w', encoding='UTF-8') as stream:
+        json.dump(results, stream, indent=2)
+    print('Results written to ' + args.output)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='UTF-8') as stream:
+            regressions: List[str] = compare(json.load(stream), results, args.tolerance)
+        for regression in regressions:
+            print('REGRESSION: ' + regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
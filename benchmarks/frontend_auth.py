@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+""" Authentication service requests per frontend page view.
+
+Simulates a user session browsing the frontend, one page view every few seconds of
+simulated time, and counts the requests each page view makes to the authentication
+service to test the session token. It compares the previous behaviour (refreshing the
+token against the authentication service on every page view) with the current
+`WebAuth.test_token`, which checks the token expiration locally and only refreshes it
+inside the configured refresh window, taking the user roles from the new token claims, or
+when the roles of its user changed (the current token version of the user is asked once
+per `token_version_ttl` of wall time, so once in the whole simulation).
+
+Usage:
+    python3 benchmarks/frontend_auth.py [--views 2000] [--interval 5] [--ttl 3600] [--window 300]
+"""
+
+import argparse
+import base64
+import json
+from typing import Callable, Dict, List
+
+
+class SimulatedClock():
+    """ Clock advanced by the simulation instead of the wall time.
+    """
+
+    def __init__(self):
+        """ Constructor method.
+        """
+        self.now: float = 1_700_000_000.0
+
+    def time(self) -> float:
+        """ Gets the simulated time.
+
+        Returns:
+            - float: The simulated timestamp.
+        """
+        return self.now
+
+
+def build_auth_service(clock: SimulatedClock, ttl: int, requests: List[int]) -> object:
+    """ Builds a stand-in for the frontend `AuthService` that counts the requests.
+
+    Args:
+        - clock (SimulatedClock): The simulated clock used to issue the tokens.
+        - ttl (int): The lifetime of the issued tokens, in seconds.
+        - requests (List[int]): A one-item list where the request count is accumulated.
+
+    Returns:
+        - object: The authentication service stand-in.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dms2223common.data.rest import ResponseData
+
+    def issue_token() -> str:
+        payload: bytes = json.dumps({
+            'user': 'user', 'sub': 'user', 'exp': clock.time() + ttl,
+            'roles': ['DISCUSSION'], 'ver': 0
+        }).encode('UTF-8')
+        return 'eyJhbGciOiJIUzI1NiJ9.' + base64.urlsafe_b64encode(payload).decode('ascii') \
+            .rstrip('=') + '.signature'
+
+    class CountingAuthService():
+        """ Authentication service stand-in.
+        """
+
+        def auth(self, token: str) -> ResponseData:
+            """ Refreshes a token. """
+            requests[0] += 1
+            response: ResponseData = ResponseData()
+            response.set_successful(bool(token))
+            response.set_content(issue_token())
+            return response
+
+        def get_token_owner(self, token: str) -> ResponseData:
+            """ Gets the owner of a token. """
+            requests[0] += 1
+            response: ResponseData = ResponseData()
+            response.set_successful(bool(token))
+            response.set_content({'username': 'user', 'roles': ['DISCUSSION'], 'ver': 0})
+            return response
+
+    CountingAuthService.issue_token = staticmethod(issue_token)  # type: ignore
+    return CountingAuthService()
+
+
+def simulate(test_token: Callable, auth_service: object, clock: SimulatedClock,
+             views: int, interval: float) -> None:
+    """ Simulates a user browsing the frontend.
+
+    Args:
+        - test_token (Callable): The token test run at the start of every page view.
+        - auth_service (object): The authentication service stand-in.
+        - clock (SimulatedClock): The simulated clock.
+        - views (int): The number of page views.
+        - interval (float): Simulated seconds between page views.
+
+    Raises:
+        - RuntimeError: If the session is rejected.
+    """
+    # pylint: disable=import-outside-toplevel
+    from flask import Flask, session
+
+    app: Flask = Flask(__name__)
+    app.secret_key = 'benchmark'
+    state: Dict = {
+        'user': 'user',
+        'token': auth_service.issue_token(),  # type: ignore
+        'roles': ['DISCUSSION']
+    }
+    for _ in range(views):
+        with app.test_request_context('/'):
+            session.update(state)
+            if not test_token(auth_service):
+                raise RuntimeError('The session was rejected')
+            state = dict(session)
+        clock.now += interval
+
+
+def main() -> None:
+    """ Runs the simulation with the previous and the current token test.
+    """
+    # pylint: disable=import-outside-toplevel
+    from flask import session
+    from dms2223frontend.presentation.web import webauth
+    from dms2223frontend.presentation.web import WebAuth
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--views', type=int, default=2000)
+    parser.add_argument('--interval', type=float, default=5, help='Seconds between views')
+    parser.add_argument('--ttl', type=int, default=3600, help='Token lifetime in seconds')
+    parser.add_argument('--window', type=float, default=300, help='Refresh window in seconds')
+    args = parser.parse_args()
+
+    def previous_test_token(auth_service) -> bool:
+        response = auth_service.auth(session.get('token'))
+        if not response.is_successful():
+            return False
+        session['token'] = response.get_content()
+        return True
+
+    clock: SimulatedClock = SimulatedClock()
+    webauth.time = clock  # type: ignore
+    WebAuth.configure(args.window)
+    for name, test_token in (('previous', previous_test_token),
+                             ('current', WebAuth.test_token)):
+        requests: List[int] = [0]
+        auth_service: object = build_auth_service(clock, args.ttl, requests)
+        simulate(test_token, auth_service, clock, args.views, args.interval)
+        print(f'{name:>9}: {requests[0]:6d} auth service requests in {args.views} page views '
+              f'({requests[0] / args.views:.3f} per page view)')
+
+
+if __name__ == '__main__':
+    main()
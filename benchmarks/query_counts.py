@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+""" SQL statement count checks of the backend service operations.
+
+Builds the backend `Schema` over an in-memory SQLite database, seeds it with discussions,
+answers and comments, and counts the statements each checked operation issues through a
+`before_cursor_execute` listener. The discussion listing cache is disabled, so every call
+reaches the database. The script exits with status 1 if any operation issues a different
+number of statements than expected (e.g., one per listed discussion).
+
+Usage:
+    python3 benchmarks/query_counts.py [--discussions 60]
+"""
+
+import argparse
+import sys
+from typing import Any, Callable, List, Tuple
+
+
+def count_statements(engine: Any, operation: Callable[[], Any]) -> int:
+    """ Counts the statements an operation issues.
+
+    Args:
+        - engine (Engine): The SQLAlchemy engine the operation uses.
+        - operation (Callable[[], Any]): The operation.
+
+    Returns:
+        - int: The number of statements sent to the database.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import event  # type: ignore
+
+    statements: List[int] = [0]
+
+    def count(*args) -> None:
+        # pylint: disable=unused-argument
+        statements[0] += 1
+
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        operation()
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
+    return statements[0]
+
+
+def main() -> None:
+    """ Runs the checks and prints their results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--discussions', type=int, default=60,
+                        help='Discussions seeded, each with two answers with a comment.')
+    args = parser.parse_args()
+
+    # pylint: disable=import-outside-toplevel
+    from dms2223backend.data.config import BackendConfiguration
+    from dms2223backend.data.db import Schema
+    from dms2223backend.service import AnswersServices, CommentsServices, DiscussionsServices
+
+    cfg: BackendConfiguration = BackendConfiguration()
+    cfg.set_db_connection_string('sqlite://')
+    db: Schema = Schema(cfg)
+    DiscussionsServices.configure_listing_cache(0, 1)
+    for number in range(args.discussions):
+        discussion = DiscussionsServices.create_discussion(
+            f'Discussion {number}', 'Content', db)
+        for _ in range(2):
+            answer = AnswersServices.answer(discussion['id'], 'Answer', db)
+            CommentsServices.comment(discussion['id'], answer['id'], 'Comment', db)
+    # A thread whose answers have more comments than fit in it
+    thread = DiscussionsServices.create_discussion('Thread', 'Content', db)
+    for _ in range(3):
+        answer = AnswersServices.answer(thread['id'], 'Answer', db)
+        for _ in range(15):
+            CommentsServices.comment(thread['id'], answer['id'], 'Comment', db)
+
+    engine = db.new_session().get_bind()
+    first_page = DiscussionsServices.list_discussions(db, 50)
+    checks: List[Tuple[str, Callable[[], Any], int]] = [
+        ('list_discussions (first page)', lambda: DiscussionsServices.list_discussions(db, 50),
+         1),
+        ('list_discussions (next page)',
+         lambda: DiscussionsServices.list_discussions(db, 50, first_page['next_cursor']), 1),
+        ('get_thread', lambda: DiscussionsServices.get_thread(thread['id'], db), 3),
+    ]
+    failures: int = 0
+    for name, operation, expected in checks:
+        statements: int = count_statements(engine, operation)
+        status: str = 'ok' if statements == expected else 'FAIL'
+        failures += statements != expected
+        print(f'{status:>4}  {name:<40} {statements} statements (expected {expected})')
+    db.remove_session()
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
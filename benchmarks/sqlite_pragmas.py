@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+""" Write throughput benchmark of the SQLite pragma profile.
+
+Runs the same concurrent write workload (several threads creating discussions, one
+commit per row) against a fresh SQLite database file with the SQLite defaults and with
+the pragma profile configured by default in `BackendConfiguration`, and prints the
+throughput and the number of "database is locked" errors of each run.
+
+Usage:
+    python3 benchmarks/sqlite_pragmas.py [--threads 8] [--rows 250]
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+def run_workload(db_path: str, pragmas: Optional[Dict], threads: int, rows: int) -> Dict:
+    """ Runs the write workload in the current process.
+
+    Args:
+        - db_path (str): The path of the SQLite database file.
+        - pragmas (Optional[Dict]): The pragma profile, or `None` to use the configured one.
+        - threads (int): The number of concurrent writer threads.
+        - rows (int): The number of rows each thread writes.
+
+    Returns:
+        - Dict: The results of the run (`rows`, `seconds`, `locked_errors`).
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy.exc import OperationalError  # type: ignore
+    from dms2223backend.data.config import BackendConfiguration
+    from dms2223backend.data.db import Schema
+    from dms2223backend.data.db.resultsets import Discussions
+
+    cfg: BackendConfiguration = BackendConfiguration()
+    cfg.set_db_connection_string('sqlite:///' + db_path)
+    if pragmas is not None:
+        cfg.set_sqlite_pragmas(pragmas)
+    schema: Schema = Schema(cfg)
+
+    written: List[int] = []
+    locked: List[int] = []
+
+    def writer(number: int) -> None:
+        done: int = 0
+        errors: int = 0
+        for i in range(rows):
+            session = schema.new_session()
+            try:
+                Discussions.create(session, f'Title {number}-{i}', 'Benchmark content')
+                done += 1
+            except OperationalError:
+                session.rollback()
+                errors += 1
+        schema.remove_session()
+        written.append(done)
+        locked.append(errors)
+
+    workers: List[threading.Thread] = [
+        threading.Thread(target=writer, args=(n,)) for n in range(threads)
+    ]
+    start: float = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    seconds: float = time.perf_counter() - start
+    return {'rows': sum(written), 'seconds': seconds, 'locked_errors': sum(locked)}
+
+
+def main() -> None:
+    """ Runs the benchmark for both profiles and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--rows', type=int, default=250, help='Rows written by each thread')
+    args = parser.parse_args()
+
+    profiles: Dict[str, Optional[Dict]] = {
+        'sqlite defaults': {},
+        'configured profile': None,
+    }
+    # Each run uses a fresh process, as the ORM classes can only be mapped once
+    context = multiprocessing.get_context('spawn')
+    for name, pragmas in profiles.items():
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path: str = os.path.join(tmp_dir, 'benchmark.sqlite3.db')
+            with context.Pool(1) as pool:
+                result: Dict = pool.apply(
+                    run_workload, (db_path, pragmas, args.threads, args.rows))
+        print(f"{name:>20}: {result['rows']:6d} rows in {result['seconds']:7.2f} s "
+              f"({result['rows'] / result['seconds']:8.1f} rows/s), "
+              f"{result['locked_errors']} 'database is locked' errors")
+
+
+if __name__ == '__main__':
+    main()
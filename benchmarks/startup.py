@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+""" Time to first request of the service entry points.
+
+Starts `bin/dms2223auth`, `bin/dms2223backend` and `bin/dms2223frontend` (development
+server) with a temporary configuration, cache directory and SQLite database, and measures
+the time from the process start until it answers its first HTTP request. The first start
+of each service is cold (a new database and an empty specification cache); the following
+ones start against the deployed schema and the cached specification.
+
+Usage:
+    python3 benchmarks/startup.py [--runs 5] [--timeout 60]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List, Tuple
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Service name, port and URL answered once the service is ready
+SERVICES: List[Tuple[str, int, str]] = [
+    ('dms2223auth', 14000, '/api/v1/'),
+    ('dms2223backend', 15000, '/api/v1/'),
+    ('dms2223frontend', 18080, '/login'),
+]
+
+
+def write_config(config_home: str, directory: str, name: str, port: int) -> None:
+    """ Writes the configuration file of a service.
+
+    Args:
+        - config_home (str): The directory used as `XDG_CONFIG_HOME`.
+        - directory (str): The directory where the databases are created.
+        - name (str): The service name.
+        - port (int): The service port.
+    """
+    os.makedirs(os.path.join(config_home, name), exist_ok=True)
+    with open(os.path.join(config_home, name, 'config.yml'), 'w', encoding='UTF-8') as stream:
+        stream.write(
+            f"db_connection_string: 'sqlite:///{os.path.join(directory, name)}.db'\n"
+            f"service_host: '127.0.0.1'\n"
+            f"service_port: {port}\n"
+            f"debug: false\n"
+        )
+
+
+def time_to_first_request(name: str, port: int, path: str, env: Dict[str, str],
+                          timeout: float) -> float:
+    """ Starts a service and waits until it answers a request.
+
+    Args:
+        - name (str): The service name.
+        - port (int): The service port.
+        - path (str): The URL path requested.
+        - env (Dict[str, str]): The environment of the service process.
+        - timeout (float): Seconds to wait for the service.
+
+    Returns:
+        - float: Seconds from the process start to the first response.
+
+    Raises:
+        - RuntimeError: If the service does not answer in time.
+    """
+    start: float = time.perf_counter()
+    process = subprocess.Popen(  # pylint: disable=consider-using-with
+        [sys.executable, os.path.join(ROOT, 'components', name, 'bin', name)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(f'http://127.0.0.1:{port}{path}', timeout=1):
+                    pass
+                return time.perf_counter() - start
+            except urllib.error.HTTPError:
+                return time.perf_counter() - start
+            except OSError as ex:
+                if process.poll() is not None:
+                    raise RuntimeError(f'{name} exited with status {process.returncode}') from ex
+                time.sleep(0.01)
+        raise RuntimeError(f'{name} did not answer in {timeout} seconds')
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main() -> None:
+    """ Starts every service several times and prints the times to first request.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5, help='Warm starts of each service')
+    parser.add_argument('--timeout', type=float, default=60)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        env: Dict[str, str] = {
+            **os.environ,
+            'XDG_CONFIG_HOME': os.path.join(directory, 'config'),
+            'XDG_CACHE_HOME': os.path.join(directory, 'cache'),
+        }
+        for name, port, path in SERVICES:
+            write_config(env['XDG_CONFIG_HOME'], directory, name, port)
+            cold: float = time_to_first_request(name, port, path, env, args.timeout)
+            warm: List[float] = [
+                time_to_first_request(name, port, path, env, args.timeout)
+                for _ in range(args.runs)
+            ]
+            print(f'{name:>16}: cold {cold * 1000:7.1f} ms, '
+                  f'warm median {statistics.median(warm) * 1000:7.1f} ms '
+                  f'(min {min(warm) * 1000:7.1f} ms)')
+
+
+if __name__ == '__main__':
+    main()
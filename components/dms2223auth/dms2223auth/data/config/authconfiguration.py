@@ -25,12 +25,33 @@ class AuthConfiguration(ServiceConfiguration):
         ServiceConfiguration.__init__(self)
 
         self.set_db_connection_string('sqlite:////tmp/dms2223auth.sqlite3.db')
+        self.set_sqlite_pragmas({
+            'busy_timeout': 5000,
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'cache_size': -16000,
+            'mmap_size': 134217728,
+            'temp_store': 'MEMORY'
+        })
         self.set_service_host('127.0.0.1')
         self.set_service_port(4000)
         self.set_debug_flag(True)
         self.set_password_salt('This salt should be changed ASAP')
         self.set_jws_secret('This JWS secret should be changed ASAP')
         self.set_jws_ttl(3600)
+        self.set_password_hashing({
+            'algorithm': 'scrypt',
+            'n': 16384,
+            'r': 8,
+            'p': 1,
+            'workers': 2
+        })
+        self.set_token_cache_size(4096)
+        self.set_token_cache_ttl(30)
+        self.set_role_cache({
+            'ttl': 30,
+            'max_entries': 4096
+        })
         self.set_authorized_api_keys([])
 
     def _set_values(self, values: Dict) -> None:
@@ -43,12 +64,23 @@ class AuthConfiguration(ServiceConfiguration):
 
         if 'db_connection_string' in values:
             self.set_db_connection_string(values['db_connection_string'])
+        if 'sqlite_pragmas' in values:
+            self.set_sqlite_pragmas({**self.get_sqlite_pragmas(), **values['sqlite_pragmas']})
         if 'salt' in values:
             self.set_password_salt(values['salt'])
+        if 'password_hashing' in values:
+            self.set_password_hashing(
+                {**self.get_password_hashing(), **values['password_hashing']})
         if 'jws_secret' in values:
             self.set_jws_secret(values['jws_secret'])
         if 'jws_ttl' in values:
             self.set_jws_ttl(values['jws_ttl'])
+        if 'token_cache_size' in values:
+            self.set_token_cache_size(values['token_cache_size'])
+        if 'token_cache_ttl' in values:
+            self.set_token_cache_ttl(values['token_cache_ttl'])
+        if 'role_cache' in values:
+            self.set_role_cache({**self.get_role_cache(), **values['role_cache']})
 
     def set_db_connection_string(self, db_connection_string: str) -> None:
         """ Sets the db_connection_string configuration value.
@@ -70,6 +102,34 @@ class AuthConfiguration(ServiceConfiguration):
 
         return str(self._values['db_connection_string'])
 
+    def set_sqlite_pragmas(self, sqlite_pragmas: Dict) -> None:
+        """ Sets the SQLite pragmas applied on every new database connection.
+
+        Args:
+            - sqlite_pragmas (Dict): A dictionary of pragma names and values. A `None` value
+              leaves that pragma with the SQLite default.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if not isinstance(sqlite_pragmas, dict):
+            raise ValueError('The SQLite pragmas must be a dictionary.')
+        for name, value in sqlite_pragmas.items():
+            if not str(name).isidentifier():
+                raise ValueError('Invalid SQLite pragma name: ' + str(name))
+            if value is not None and not str(value).lstrip('-').isalnum():
+                raise ValueError('Invalid value for the SQLite pragma ' + str(name))
+        self._values['sqlite_pragmas'] = sqlite_pragmas
+
+    def get_sqlite_pragmas(self) -> Dict:
+        """ Gets the SQLite pragmas applied on every new database connection.
+
+        Returns:
+            - Dict: A dictionary with the pragma names and values.
+        """
+
+        return self._values['sqlite_pragmas']
+
     def set_password_salt(self, salt: str) -> None:
         """ Sets the password salt configuration value.
 
@@ -90,6 +150,39 @@ class AuthConfiguration(ServiceConfiguration):
 
         return str(self._values['salt'])
 
+    def set_password_hashing(self, password_hashing: Dict) -> None:
+        """ Sets the password hashing scheme, its cost parameters and the hashing pool size.
+
+        Args:
+            - password_hashing (Dict): A dictionary with the scheme (`algorithm`, `scrypt` or
+              the legacy `sha256`), the scrypt cost parameters (`n`, a power of two, `r` and
+              `p`) and the number of hashing worker processes (`workers`, zero hashes in
+              the request threads).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if not isinstance(password_hashing, dict):
+            raise ValueError('The password hashing settings must be a dictionary.')
+        if not isinstance(password_hashing.get('algorithm'), str):
+            raise ValueError('A password hashing algorithm name is required.')
+        for name, minimum in (('n', 2), ('r', 1), ('p', 1), ('workers', 0)):
+            value = password_hashing.get(name)
+            if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+                raise ValueError('Invalid value for the password hashing setting ' + name)
+        if password_hashing['n'] & (password_hashing['n'] - 1) != 0:
+            raise ValueError('The password hashing setting n must be a power of two.')
+        self._values['password_hashing'] = password_hashing
+
+    def get_password_hashing(self) -> Dict:
+        """ Gets the password hashing scheme, its cost parameters and the hashing pool size.
+
+        Returns:
+            - Dict: A dictionary with the `algorithm`, `n`, `r`, `p` and `workers` values.
+        """
+
+        return self._values['password_hashing']
+
     def set_jws_secret(self, secret: str) -> None:
         """ Sets the JWS secret key configuration value.
 
@@ -129,3 +222,75 @@ class AuthConfiguration(ServiceConfiguration):
         """
 
         return int(self._values['jws_ttl'])
+
+    def set_token_cache_size(self, size: int) -> None:
+        """ Sets the maximum number of verified tokens kept in memory.
+
+        Args:
+            - size: An integer with the configuration value. Zero disables the cache.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if int(size) < 0:
+            raise ValueError('The token cache size cannot be negative.')
+        self._values['token_cache_size'] = int(size)
+
+    def get_token_cache_size(self) -> int:
+        """ Gets the maximum number of verified tokens kept in memory.
+
+        Returns:
+            - int: An integer with the value of token_cache_size.
+        """
+
+        return int(self._values['token_cache_size'])
+
+    def set_token_cache_ttl(self, ttl: float) -> None:
+        """ Sets the maximum seconds a verified token is kept in memory.
+
+        Args:
+            - ttl: A number with the configuration value. Zero disables the cache.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl < 0:
+            raise ValueError('The token cache time to live must be a non-negative number.')
+        self._values['token_cache_ttl'] = ttl
+
+    def get_token_cache_ttl(self) -> float:
+        """ Gets the maximum seconds a verified token is kept in memory.
+
+        Returns:
+            - float: A number with the value of token_cache_ttl.
+        """
+
+        return float(self._values['token_cache_ttl'])
+
+    def set_role_cache(self, role_cache: Dict) -> None:
+        """ Sets the bounds of the in-process cache of user role sets.
+
+        Args:
+            - role_cache (Dict): A dictionary with the seconds the role set of a user is kept
+              (`ttl`, zero disables the cache) and the maximum number of users whose roles are
+              kept (`max_entries`).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if not isinstance(role_cache, dict):
+            raise ValueError('The role cache settings must be a dictionary.')
+        for name in ('ttl', 'max_entries'):
+            value = role_cache.get(name)
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                raise ValueError('Invalid value for the role cache setting ' + name)
+        self._values['role_cache'] = role_cache
+
+    def get_role_cache(self) -> Dict:
+        """ Gets the bounds of the in-process cache of user role sets.
+
+        Returns:
+            - Dict: A dictionary with the `ttl` and `max_entries` values.
+        """
+
+        return self._values['role_cache']
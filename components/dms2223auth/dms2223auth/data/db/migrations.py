@@ -0,0 +1,64 @@
+""" Migrations class module.
+"""
+
+from typing import Callable, List
+from sqlalchemy import MetaData, inspect, text  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+
+class Migrations():
+    """ Monostate class holding the migration steps of the service database.
+
+    `create_all` only creates the tables that do not exist yet, so any change to a table
+    already deployed (e.g., a new column) needs a migration step. The steps are applied by
+    `SchemaMigrations`, once and in order.
+    """
+
+    @staticmethod
+    def _add_token_version(connection: Connection, metadata: MetaData) -> None:
+        """ Migration step 1: adds the users' token version column.
+
+        Args:
+            - connection (Connection): The connection where the step is run.
+            - metadata (MetaData): The metadata with the current table definitions.
+        """
+        if 'users' not in metadata.tables:
+            return
+        existing: List[str] = [
+            column['name'] for column in inspect(connection).get_columns('users')
+        ]
+        if 'token_version' not in existing:
+            connection.execute(text(
+                'ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0'
+            ))
+
+    @staticmethod
+    def _widen_password(connection: Connection, metadata: MetaData) -> None:
+        """ Migration step 2: widens the users' password column to fit salted KDF hashes.
+
+        SQLite does not enforce the length of text columns, so it is left unchanged there.
+
+        Args:
+            - connection (Connection): The connection where the step is run.
+            - metadata (MetaData): The metadata with the current table definitions.
+        """
+        dialect: str = connection.dialect.name
+        if 'users' not in metadata.tables or dialect == 'sqlite':
+            return
+        if dialect in ('mysql', 'mariadb'):
+            connection.execute(text('ALTER TABLE users MODIFY password VARCHAR(255) NOT NULL'))
+        else:
+            connection.execute(text('ALTER TABLE users ALTER COLUMN password TYPE VARCHAR(255)'))
+
+    @staticmethod
+    def steps() -> List[Callable[[Connection, MetaData], None]]:
+        """ Gets the migration steps, in the order they must be applied.
+
+        New steps must always be appended at the end of the list.
+
+        Returns:
+            - List[Callable[[Connection, MetaData], None]]: The migration step functions.
+        """
+        return [
+            Migrations._add_token_version,
+            Migrations._widen_password,
+        ]
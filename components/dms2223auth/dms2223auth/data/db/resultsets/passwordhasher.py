@@ -0,0 +1,259 @@
+""" Password hasher classes module.
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import os
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+class PasswordHasher(ABC):
+    """ Base class of the password hashing schemes.
+
+    Hashers are picklable, so they can be run in a pool of worker processes.
+    """
+
+    @abstractmethod
+    def identifies(self, password_hash: str) -> bool:
+        """ Determines whether a stored hash was generated by this scheme.
+
+        Args:
+            - password_hash (str): The stored password hash.
+
+        Returns:
+            - bool: `True` if this hasher can verify the hash. `False` otherwise.
+        """
+
+    @abstractmethod
+    def hash(self, password: str, username: str) -> str:
+        """ Hashes a password.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password.
+
+        Returns:
+            - str: The password hash to be stored.
+        """
+
+    @abstractmethod
+    def verify(self, password: str, username: str, password_hash: str) -> bool:
+        """ Checks a password against a stored hash generated by this scheme.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password.
+            - password_hash (str): The stored password hash.
+
+        Returns:
+            - bool: `True` if the password matches the hash. `False` otherwise.
+        """
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """ Determines whether a hash generated by this scheme uses outdated parameters.
+
+        Args:
+            - password_hash (str): The stored password hash.
+
+        Returns:
+            - bool: `True` if the password should be hashed again. `False` otherwise.
+        """
+        return not self.identifies(password_hash)
+
+
+class Sha256PasswordHasher(PasswordHasher):
+    """ Legacy scheme: a single SHA-256 of the password, the username and the configured salt.
+    """
+
+    def __init__(self, salt: str = ''):
+        """ Constructor method.
+
+        Args:
+            - salt (str): The salt shared by every password (the `salt` configuration value).
+        """
+        self.__salt: str = salt
+
+    def identifies(self, password_hash: str) -> bool:
+        """ Determines whether a stored hash was generated by this scheme.
+
+        Args:
+            - password_hash (str): The stored password hash.
+
+        Returns:
+            - bool: `True` if the hash is a SHA-256 hexadecimal digest. `False` otherwise.
+        """
+        if len(password_hash) != 64:
+            return False
+        try:
+            bytes.fromhex(password_hash)
+        except ValueError:
+            return False
+        return True
+
+    def hash(self, password: str, username: str) -> str:
+        """ Hashes a password.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password.
+
+        Returns:
+            - str: The hexadecimal SHA-256 digest.
+        """
+        return hashlib.sha256(bytes(password + username + self.__salt, 'utf-8')).hexdigest()
+
+    def verify(self, password: str, username: str, password_hash: str) -> bool:
+        """ Checks a password against a stored hash generated by this scheme.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password.
+            - password_hash (str): The stored password hash.
+
+        Returns:
+            - bool: `True` if the password matches the hash. `False` otherwise.
+        """
+        return hmac.compare_digest(self.hash(password, username), password_hash)
+
+
+class ScryptPasswordHasher(PasswordHasher):
+    """ Memory-hard scheme: scrypt with a random salt per password.
+
+    Hashes are stored as `scrypt$<n>$<r>$<p>$<salt>$<key>`, with the salt and the derived
+    key encoded in base64, so the cost parameters can be raised without invalidating the
+    existing hashes.
+    """
+
+    __PREFIX = 'scrypt'
+
+    def __init__(self, n: int = 16384, r: int = 8, p: int = 1,
+                 salt_size: int = 16, key_size: int = 32):
+        """ Constructor method.
+
+        Args:
+            - n (int): CPU/memory cost; a power of two greater than one.
+            - r (int): Block size.
+            - p (int): Parallelization.
+            - salt_size (int): Bytes of the random salt of each password.
+            - key_size (int): Bytes of the derived key.
+
+        Raises:
+            - ValueError: If the cost parameters are not valid.
+        """
+        if n < 2 or n & (n - 1) != 0:
+            raise ValueError('The scrypt cost n must be a power of two greater than one.')
+        if r < 1 or p < 1:
+            raise ValueError('The scrypt block size r and parallelization p must be positive.')
+        self.__n: int = n
+        self.__r: int = r
+        self.__p: int = p
+        self.__salt_size: int = salt_size
+        self.__key_size: int = key_size
+
+    @staticmethod
+    def __derive(password: str, salt: bytes, n: int, r: int, p: int, key_size: int) -> bytes:
+        """ Derives the key of a password.
+
+        Args:
+            - password (str): The password string.
+            - salt (bytes): The password salt.
+            - n (int): CPU/memory cost.
+            - r (int): Block size.
+            - p (int): Parallelization.
+            - key_size (int): Bytes of the derived key.
+
+        Returns:
+            - bytes: The derived key.
+        """
+        return hashlib.scrypt(
+            password.encode('utf-8'), salt=salt, n=n, r=r, p=p,
+            # Room for the 128 * n * r bytes scrypt needs, plus some slack
+            maxmem=256 * n * r * p + 1024 * 1024, dklen=key_size
+        )
+
+    def __parse(self, password_hash: str) -> Optional[Tuple[int, int, int, bytes, bytes]]:
+        """ Splits a stored hash into its parameters, salt and key.
+
+        Args:
+            - password_hash (str): The stored password hash.
+
+        Returns:
+            - Optional[Tuple[int, int, int, bytes, bytes]]: The `n`, `r` and `p` parameters,
+              the salt and the key, or `None` if the hash was not generated by this scheme.
+        """
+        fields = password_hash.split('$')
+        if len(fields) != 6 or fields[0] != ScryptPasswordHasher.__PREFIX:
+            return None
+        try:
+            return (int(fields[1]), int(fields[2]), int(fields[3]),
+                    base64.b64decode(fields[4], validate=True),
+                    base64.b64decode(fields[5], validate=True))
+        except (ValueError, binascii.Error):
+            return None
+
+    def identifies(self, password_hash: str) -> bool:
+        """ Determines whether a stored hash was generated by this scheme.
+
+        Args:
+            - password_hash (str): The stored password hash.
+
+        Returns:
+            - bool: `True` if this hasher can verify the hash. `False` otherwise.
+        """
+        return self.__parse(password_hash) is not None
+
+    def hash(self, password: str, username: str) -> str:
+        """ Hashes a password with a new random salt.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password (not used; the salt
+              is already unique).
+
+        Returns:
+            - str: The password hash to be stored.
+        """
+        salt: bytes = os.urandom(self.__salt_size)
+        key: bytes = ScryptPasswordHasher.__derive(
+            password, salt, self.__n, self.__r, self.__p, self.__key_size)
+        return '$'.join([
+            ScryptPasswordHasher.__PREFIX, str(self.__n), str(self.__r), str(self.__p),
+            base64.b64encode(salt).decode('ascii'), base64.b64encode(key).decode('ascii')
+        ])
+
+    def verify(self, password: str, username: str, password_hash: str) -> bool:
+        """ Checks a password against a stored hash, using the parameters stored with it.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password (not used).
+            - password_hash (str): The stored password hash.
+
+        Returns:
+            - bool: `True` if the password matches the hash. `False` otherwise.
+        """
+        parsed = self.__parse(password_hash)
+        if parsed is None:
+            return False
+        n, r, p, salt, key = parsed
+        return hmac.compare_digest(
+            ScryptPasswordHasher.__derive(password, salt, n, r, p, len(key)), key)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """ Determines whether a hash was not generated with the current parameters.
+
+        Args:
+            - password_hash (str): The stored password hash.
+
+        Returns:
+            - bool: `True` if the password should be hashed again. `False` otherwise.
+        """
+        parsed = self.__parse(password_hash)
+        if parsed is None:
+            return True
+        n, r, p, salt, key = parsed
+        return (n, r, p, len(salt), len(key)) != \
+            (self.__n, self.__r, self.__p, self.__salt_size, self.__key_size)
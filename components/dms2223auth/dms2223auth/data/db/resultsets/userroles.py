@@ -1,12 +1,12 @@
 """ UserRoles class module.
 """
 
-from typing import Optional, List
+from typing import Iterable, Optional, List, Set
 from sqlalchemy.orm import Session  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
 from dms2223common.data import Role
-from dms2223auth.data.db.results import UserRole
+from dms2223auth.data.db.results import User, UserRole
 from dms2223auth.data.db.exc import UserNotFoundError
 
 
@@ -41,6 +41,7 @@ class UserRoles():
         try:
             new_user_role = UserRole(username, role)
             session.add(new_user_role)
+            UserRoles.__bump_token_version(session, username)
             session.commit()
             return new_user_role
         except IntegrityError as ex:
@@ -73,11 +74,77 @@ class UserRoles():
             return
         try:
             session.delete(user_role)
+            UserRoles.__bump_token_version(session, username)
             session.commit()
         except:
             session.rollback()
             raise
 
+    @staticmethod
+    def set_roles(session: Session, username: str, roles: Iterable[Role]) -> List[UserRole]:
+        """ Replaces the roles of a user with the given ones.
+
+        Only the differences with the current roles are written: missing roles are inserted
+        and extra ones deleted, all of it in a single transaction.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+            - roles (Iterable[Role]): The roles the user must have.
+
+        Raises:
+            - ValueError: If the username is missing.
+            - UserNotFoundError: If the user does not exist.
+
+        Returns:
+            - List[UserRole]: The `UserRole` registers of the user after the change.
+        """
+        if not username:
+            raise ValueError('A username is required.')
+        try:
+            if session.get(User, username) is None:
+                raise UserNotFoundError()
+            current: List[UserRole] = UserRoles.list_all_for_user(session, username)
+            target: Set[Role] = set(roles)
+            granted: Set[Role] = {user_role.role for user_role in current}
+            revoked: List[UserRole] = [
+                user_role for user_role in current if user_role.role not in target
+            ]
+            new_user_roles: List[UserRole] = [
+                UserRole(username, role) for role in target - granted
+            ]
+            for user_role in revoked:
+                session.delete(user_role)
+            session.add_all(new_user_roles)
+            if revoked or new_user_roles:
+                UserRoles.__bump_token_version(session, username)
+            session.commit()
+        except:
+            session.rollback()
+            raise
+        return [
+            user_role for user_role in current if user_role.role in target
+        ] + new_user_roles
+
+    @staticmethod
+    def __bump_token_version(session: Session, username: str) -> None:
+        """ Increments the token version of a user whose roles are being changed.
+
+        Tokens carry the version they were issued with, so those issued before the change
+        can be told apart and their role claims replaced.
+
+        Args:
+            - session (Session): The session object, with the role change not committed yet.
+            - username (str): The user name string.
+        """
+        session.query(User).filter_by(username=username).update(
+            {User.token_version: User.token_version + 1},  # type: ignore
+            synchronize_session=False
+        )
+
     @staticmethod
     def find_role(session: Session, username: str, role: Role) -> Optional[UserRole]:
         """ Finds a role for a user.
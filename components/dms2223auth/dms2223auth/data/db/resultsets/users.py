@@ -2,17 +2,29 @@
 """
 
 import hashlib
-from typing import List
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
-from dms2223auth.data.db.results import User
+from dms2223common.data import Role
+from dms2223auth.data.db.results import User, UserRole
 from dms2223auth.data.db.exc import UserExistsError
+from dms2223auth.data.db.resultsets.passwordhasher import \
+    PasswordHasher, Sha256PasswordHasher, ScryptPasswordHasher
 
 
 class Users():
     """ Class responsible of table-level users operations.
     """
+
+    # Password hashing schemes, by algorithm name, built from the hashing settings and salt
+    __password_hashers: Dict[str, Callable[[Dict, str], PasswordHasher]] = {
+        'sha256': lambda settings, salt: Sha256PasswordHasher(salt),
+        'scrypt': lambda settings, salt: ScryptPasswordHasher(
+            settings['n'], settings['r'], settings['p']),
+    }
+
     @staticmethod
     def create(session: Session, username: str, password_hash: str) -> User:
         """ Creates a new user record.
@@ -57,6 +69,96 @@ class Users():
         query = session.query(User)
         return query.all()
 
+    @staticmethod
+    def __page_query(session: Session, limit: int,
+                     after: Optional[str] = None, prefix: Optional[str] = None):
+        """ Builds the query of a page of users sorted by username.
+
+        The prefix filter is turned into a username range, so it is served by the primary
+        key index like the cursor is.
+
+        Args:
+            - session (Session): The session object.
+            - limit (int): The maximum number of users returned.
+            - after (Optional[str]): Only users with a username greater than this are returned.
+            - prefix (Optional[str]): Only users with a username starting with this are returned.
+
+        Returns:
+            - Query: The query of the users in the page.
+        """
+        query = session.query(User)
+        if after is not None:
+            query = query.filter(User.username > after)  # type: ignore
+        if prefix:
+            query = query.filter(User.username >= prefix)  # type: ignore
+            upper_bound: Optional[str] = Users.__prefix_upper_bound(prefix)
+            if upper_bound is not None:
+                query = query.filter(User.username < upper_bound)  # type: ignore
+        return query.order_by(User.username).limit(limit)  # type: ignore
+
+    @staticmethod
+    def __prefix_upper_bound(prefix: str) -> Optional[str]:
+        """ Finds the least string greater than every string starting with a prefix.
+
+        Args:
+            - prefix (str): The prefix.
+
+        Returns:
+            - Optional[str]: The prefix with its last character incremented, once the
+              trailing characters that cannot be incremented (U+10FFFF) are dropped, or
+              `None` if the prefix is made only of those characters (no bound is needed).
+              Surrogates (U+D800 to U+DFFF) cannot be encoded, so they are skipped.
+        """
+        stem: str = prefix.rstrip(chr(sys.maxunicode))
+        if not stem:
+            return None
+        following: int = ord(stem[-1]) + 1
+        if 0xD800 <= following <= 0xDFFF:
+            following = 0xE000
+        return stem[:-1] + chr(following)
+
+    @staticmethod
+    def list_page(session: Session, limit: int,
+                  after: Optional[str] = None, prefix: Optional[str] = None) -> List[User]:
+        """Lists a page of users sorted by username.
+
+        Args:
+            - session (Session): The session object.
+            - limit (int): The maximum number of users returned.
+            - after (Optional[str]): Only users with a username greater than this are returned.
+            - prefix (Optional[str]): Only users with a username starting with this are returned.
+
+        Returns:
+            - List[User]: A list of `User` registers.
+        """
+        return Users.__page_query(session, limit, after, prefix).all()
+
+    @staticmethod
+    def list_page_with_roles(session: Session, limit: int,
+                             after: Optional[str] = None, prefix: Optional[str] = None
+                             ) -> List[Tuple[str, Optional[Role]]]:
+        """Lists a page of users sorted by username, together with their roles.
+
+        The roles are fetched joining the page of users with the user roles, in a single
+        query.
+
+        Args:
+            - session (Session): The session object.
+            - limit (int): The maximum number of users returned.
+            - after (Optional[str]): Only users with a username greater than this are returned.
+            - prefix (Optional[str]): Only users with a username starting with this are returned.
+
+        Returns:
+            - List[Tuple[str, Optional[Role]]]: The username and role pairs, sorted by username.
+              Users without roles have a single pair with a `None` role.
+        """
+        page = (Users.__page_query(session, limit, after, prefix)
+                .with_entities(User.username).subquery())  # type: ignore
+        query = (session.query(page.c.username, UserRole.role)  # type: ignore
+                 .outerjoin(UserRole, UserRole.username == page.c.username)  # type: ignore
+                 .order_by(page.c.username))
+        return [tuple(row) for row in query.all()]
+
     @staticmethod
     def user_exists(session: Session, username: str, password_hash: str) -> bool:
         """ Determines whether a user exists or not.
@@ -90,3 +192,89 @@ class Users():
             - str: A string with the hashed password.
         """
         return hashlib.sha256(bytes(password + suffix + salt, 'utf-8')).hexdigest()
+
+    @staticmethod
+    def register_password_hasher(algorithm: str,
+                                 factory: Callable[[Dict, str], PasswordHasher]) -> None:
+        """ Registers a password hashing scheme.
+
+        Args:
+            - algorithm (str): The name used to select the scheme in the hashing settings.
+            - factory (Callable[[Dict, str], PasswordHasher]): Function building the hasher
+              from the hashing settings and the configured salt.
+        """
+        Users.__password_hashers[algorithm] = factory
+
+    @staticmethod
+    def password_hasher(settings: Dict, salt: str = '') -> PasswordHasher:
+        """ Builds the password hasher selected in the hashing settings.
+
+        Args:
+            - settings (Dict): The hashing settings, with the scheme name (key `algorithm`)
+              and its cost parameters.
+            - salt (str): The salt shared by every password (used by the legacy scheme).
+
+        Raises:
+            - ValueError: If the algorithm is unknown or its parameters are not valid.
+
+        Returns:
+            - PasswordHasher: The password hasher.
+        """
+        factory = Users.__password_hashers.get(settings.get('algorithm', ''))
+        if factory is None:
+            raise ValueError('Unknown password hashing algorithm.')
+        return factory(settings, salt)
+
+    @staticmethod
+    def legacy_password_hasher(salt: str = '') -> PasswordHasher:
+        """ Builds the hasher of the passwords stored before the hashing was configurable.
+
+        Args:
+            - salt (str): The salt shared by every password.
+
+        Returns:
+            - PasswordHasher: The legacy password hasher (compatible with `hash_password`).
+        """
+        return Sha256PasswordHasher(salt)
+
+    @staticmethod
+    def get_password_hash(session: Session, username: str) -> Optional[str]:
+        """ Gets the stored password hash of a user.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+
+        Returns:
+            - Optional[str]: The password hash, or `None` if the user does not exist.
+        """
+        user: Optional[User] = session.get(User, username)
+        return user.password if user is not None else None
+
+    @staticmethod
+    def update_password_hash(session: Session, username: str,
+                             old_password_hash: str, new_password_hash: str) -> bool:
+        """ Replaces the stored password hash of a user, unless it has changed meanwhile.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+            - old_password_hash (str): The password hash expected to be stored.
+            - new_password_hash (str): The new password hash.
+
+        Returns:
+            - bool: `True` if the hash was replaced. `False` if the stored one was not the
+              expected one.
+        """
+        try:
+            updated: int = session.query(User).filter_by(
+                username=username, password=old_password_hash
+            ).update({User.password: new_password_hash}, synchronize_session=False)  # type: ignore
+            session.commit()
+        except:
+            session.rollback()
+            raise
+        return updated > 0
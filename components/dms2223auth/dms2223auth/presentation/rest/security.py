@@ -7,7 +7,8 @@ from typing import Dict, Optional
 from flask import current_app
 from authlib.jose import JsonWebSignature  # type: ignore
 from connexion.exceptions import Unauthorized  # type: ignore
-from dms2223auth.service import UserServices
+from dms2223auth.service import UserServices, RoleServices
+from dms2223auth.service.tokencache import TokenCache
 from dms2223auth.data.config import AuthConfiguration
 
 
@@ -56,6 +57,11 @@ def verify_credentials(username: str, password: str) -> Optional[Dict]:
 def verify_token(token: str) -> Dict:
     """Callback testing a JWS user token.
 
+    The claims of verified tokens are kept in the token cache until they expire, so
+    repeated calls with the same token skip the signature check. If the user roles have
+    changed since the token was issued (its `ver` claim is not the current user token
+    version), the role claims of the token are replaced with the current ones.
+
     Args:
         - token (str): The JWS user token received.
 
@@ -63,26 +69,51 @@ def verify_token(token: str) -> Dict:
         - Unauthorized: When the token is incorrect.
 
     Returns:
-        - Dict: A dictionary with the user name (key `user`) if the credentials are correct.
+        - Dict: A dictionary with the user name (key `user`), the role names (key `roles`)
+          and the token version (key `ver`) if the credentials are correct.
     """
     with current_app.app_context():
-        token_bytes: bytes = token.encode('ascii')
-        cfg: AuthConfiguration = current_app.cfg
-        jws: JsonWebSignature = current_app.jws
-        try:
-            data: Dict = jws.deserialize_compact(
-                token_bytes,
-                bytes(cfg.get_jws_secret(), 'UTF-8')
-            )
-            payload: Dict = json.loads(data['payload'].decode('UTF-8'))
-        except Exception as ex:
-            raise Unauthorized from ex
-        if 'user' not in payload:
-            raise Unauthorized('Invalid token')
-        if time.time() > payload['exp']:
-            raise Unauthorized('Expired token')
-        return {
-            'sub': payload['sub'],
-            'user': payload['user'],
-            'exp': payload['exp']
-        }
+        claims: Dict = TokenCache.get(token, lambda: _verify_signed_token(token))
+        return dict(claims)
+
+
+def _verify_signed_token(token: str) -> Dict:
+    """Checks the signature and expiration of a JWS user token, updating its role claims if
+    they are outdated.
+
+    Args:
+        - token (str): The JWS user token received.
+
+    Raises:
+        - Unauthorized: When the token is incorrect.
+
+    Returns:
+        - Dict: A dictionary with the token claims.
+    """
+    token_bytes: bytes = token.encode('ascii')
+    cfg: AuthConfiguration = current_app.cfg
+    jws: JsonWebSignature = current_app.jws
+    try:
+        data: Dict = jws.deserialize_compact(
+            token_bytes,
+            bytes(cfg.get_jws_secret(), 'UTF-8')
+        )
+        payload: Dict = json.loads(data['payload'].decode('UTF-8'))
+    except Exception as ex:
+        raise Unauthorized from ex
+    expiration: Optional[float] = payload.get('exp')
+    if 'user' not in payload or not isinstance(expiration, (int, float)):
+        raise Unauthorized('Invalid token')
+    if time.time() > expiration:
+        raise Unauthorized('Expired token')
+    claims: Dict = {
+        'sub': payload['sub'],
+        'user': payload['user'],
+        'exp': expiration,
+        'roles': payload.get('roles', []),
+        'ver': payload.get('ver')
+    }
+    current: Dict = RoleServices.get_token_claims(payload['user'], current_app.db)
+    if claims['ver'] != current['ver']:
+        claims.update(current)
+    return claims
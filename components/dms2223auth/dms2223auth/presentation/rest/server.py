@@ -8,6 +8,7 @@ from http import HTTPStatus
 from flask import current_app
 from authlib.jose import JsonWebSignature  # type: ignore
 from dms2223auth.data.config.authconfiguration import AuthConfiguration
+from dms2223auth.service import RoleServices
 
 
 def health_test() -> Tuple[None, Optional[int]]:
@@ -22,6 +23,9 @@ def health_test() -> Tuple[None, Optional[int]]:
 def login(token_info: Dict) -> Tuple[str, Optional[int]]:
     """Generates a user token if the user validation was passed.
 
+    The token embeds the current user roles (claim `roles`) and token version (claim
+    `ver`), so services can authorize requests without looking the roles up.
+
     Args:
         - token_info (Dict): A dictionary of information provided by the security schema handlers.
 
@@ -36,12 +40,15 @@ def login(token_info: Dict) -> Tuple[str, Optional[int]]:
             user = token_info['user_token']['user']
         elif 'user_credentials' in token_info:
             user = token_info['user_credentials']['user']
+        claims: Dict = RoleServices.get_token_claims(user, current_app.db)
         token: bytes = jws.serialize_compact(
             {'alg': 'HS256'},
             bytes(json.dumps({
                 'user': user,
                 'sub': user,
-                'exp': (time.time() + cfg.get_jws_ttl())
+                'exp': (time.time() + cfg.get_jws_ttl()),
+                'roles': claims['roles'],
+                'ver': claims['ver']
             }), 'UTF-8'),
             bytes(cfg.get_jws_secret(), 'UTF-8')
         )
@@ -50,8 +57,16 @@ def login(token_info: Dict) -> Tuple[str, Optional[int]]:
 def get_token_owner(token_info: Dict) -> Tuple[Dict, Optional[int]]:
     """Gets the user associated to a given token.
 
+    Args:
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
     Returns:
-        - Tuple[Dict, Optional[int]]: A tuple with the user info and code 200 OK.
+        - Tuple[Dict, Optional[int]]: A tuple with the user info (the user name, its current
+          role names and its current token version) and code 200 OK.
     """
     username: str = token_info['user_token']['user']
-    return ({'username': username}, HTTPStatus.OK.value)
+    return ({
+        'username': username,
+        'roles': token_info['user_token']['roles'],
+        'ver': token_info['user_token']['ver']
+    }, HTTPStatus.OK.value)
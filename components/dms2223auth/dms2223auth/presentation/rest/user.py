@@ -1,23 +1,38 @@
 """ REST API controllers responsible of handling the user operations.
 """
 
-from typing import Tuple, Union, Optional, List, Dict
+from typing import Tuple, Union, Optional, Dict
 from http import HTTPStatus
 from flask import current_app
 from dms2223auth.data.db.exc import UserExistsError
-from dms2223auth.service import UserServices, RoleServices
+from dms2223auth.service import UserServices
 from dms2223common.data.role import Role
+from dms2223common.presentation.security import token_has_role
 
 
-def list_users() -> Tuple[List[Dict], Optional[int]]:
-    """Lists the existing users.
+def list_users(limit: int = 50, after: Optional[str] = None, prefix: Optional[str] = None,
+               with_roles: bool = False) -> Tuple[Union[Dict, str], Optional[int]]:
+    """Lists a page of the existing users.
+
+    Args:
+        - limit (int): The maximum number of users in the page.
+        - after (Optional[str]): The cursor returned with the previous page, if any.
+        - prefix (Optional[str]): Only users with a username starting with this are listed.
+        - with_roles (bool): Whether to include the roles of each user.
 
     Returns:
-        - Tuple[List[Dict], Optional[int]]: A tuple with a list of dictionaries for the users' data
-          and a code 200 OK.
+        - Tuple[Union[Dict, str], Optional[int]]: On success, a tuple with a dictionary holding
+          the users' data and the next page cursor, and a code 200 OK. On error, a description
+          message and code:
+            - 400 BAD REQUEST when the page limit is not valid.
     """
     with current_app.app_context():
-        users: List[Dict] = UserServices.list_users(current_app.db)
+        try:
+            users: Dict = UserServices.list_users(
+                current_app.db, limit, after, prefix, with_roles
+            )
+        except ValueError:
+            return ('The page limit must be a positive number', HTTPStatus.BAD_REQUEST.value)
     return (users, HTTPStatus.OK.value)
 
 
@@ -36,10 +51,7 @@ def create_user(body: Dict, token_info: Dict) -> Tuple[Union[Dict, str], Optiona
             - 409 CONFLICT if an existing user already has all or part of the unique user's data.
     """
     with current_app.app_context():
-        if not RoleServices.has_role(
-                token_info['user_token']['user'],
-                Role.ADMINISTRATION, current_app.db
-            ):
+        if not token_has_role(token_info, Role.ADMINISTRATION):
             return (
                 'Current user has not enough privileges to create a user',
                 HTTPStatus.FORBIDDEN.value
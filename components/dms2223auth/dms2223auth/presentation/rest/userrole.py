@@ -6,7 +6,9 @@ from http import HTTPStatus
 from flask import current_app
 from dms2223auth.data.db.exc import UserNotFoundError
 from dms2223auth.service import RoleServices
+from dms2223auth.service.tokencache import TokenCache
 from dms2223common.data import Role
+from dms2223common.presentation.security import token_has_role
 
 
 def user_has_role(username: str, rolename: str) -> Tuple[Optional[str], Optional[int]]:
@@ -43,10 +45,7 @@ def list_user_roles(username: str, token_info: Dict) -> Tuple[Union[List[str], s
             - 403 FORBIDDEN if the requesting user has no rights to list the roles.
     """
     with current_app.app_context():
-        if (not RoleServices.has_role(
-                    token_info['user_token']['user'],
-                    Role.ADMINISTRATION, current_app.db
-                )
+        if (not token_has_role(token_info, Role.ADMINISTRATION)
                 and username != token_info['user_token']['user']):
             return (
                 'Current user has not enough privileges to view other users\' roles',
@@ -78,10 +77,7 @@ def grant_role(
             - 404 NOT FOUND if the user does not exist.
     """
     with current_app.app_context():
-        if not RoleServices.has_role(
-                token_info['user_token']['user'],
-                Role.ADMINISTRATION, current_app.db
-            ):
+        if not token_has_role(token_info, Role.ADMINISTRATION):
             return (
                 'Current user has not enough privileges to grant roles',
                 HTTPStatus.FORBIDDEN.value
@@ -95,6 +91,7 @@ def grant_role(
             )
         except UserNotFoundError:
             return (f'User {username} was not found', HTTPStatus.NOT_FOUND.value)
+        TokenCache.invalidate_user(username)
         return (None, HTTPStatus.CREATED.value)
 
 
@@ -115,10 +112,7 @@ def revoke_role(
             - 403 FORBIDDEN if the requesting user has no rights to revoke a role.
     """
     with current_app.app_context():
-        if not RoleServices.has_role(
-                token_info['user_token']['user'],
-                Role.ADMINISTRATION, current_app.db
-            ):
+        if not token_has_role(token_info, Role.ADMINISTRATION):
             return (
                 'Current user has not enough privileges to revoke roles',
                 HTTPStatus.FORBIDDEN.value
@@ -132,4 +126,43 @@ def revoke_role(
             RoleServices.revoke_role(username, rolename, current_app.db)
         except ValueError:
             return 'Both a username and a role name must be given', HTTPStatus.BAD_REQUEST.value
+        TokenCache.invalidate_user(username)
         return (None, HTTPStatus.NO_CONTENT.value)
+
+
+def set_user_roles(
+    username: str, body: List[str], token_info: Dict
+) -> Tuple[Union[List[str], str], Optional[int]]:
+    """Replaces the roles of a user.
+
+    Args:
+        - username (str): The user name.
+        - body (List[str]): The names of the roles the user must have.
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Union[List[str], str], Optional[int]]: A tuple with the resulting list of user
+          roles and code 200 OK if updated, or a description message and codes:
+            - 400 BAD REQUEST if a mandatory parameter is missing.
+            - 403 FORBIDDEN if the requesting user has no rights to update the roles.
+            - 404 NOT FOUND if the user does not exist.
+    """
+    with current_app.app_context():
+        if not token_has_role(token_info, Role.ADMINISTRATION):
+            return (
+                'Current user has not enough privileges to update roles',
+                HTTPStatus.FORBIDDEN.value
+            )
+        if token_info['user_token']['user'] == username and Role.ADMINISTRATION.name not in body:
+            return (
+                'Current user cannot revoke the Admin role from oneself',
+                HTTPStatus.FORBIDDEN.value
+            )
+        try:
+            user_roles: List[str] = RoleServices.set_roles(username, body, current_app.db)
+        except ValueError:
+            return ('A username and valid role names must be given', HTTPStatus.BAD_REQUEST.value)
+        except UserNotFoundError:
+            return (f'User {username} was not found', HTTPStatus.NOT_FOUND.value)
+        TokenCache.invalidate_user(username)
+        return (user_roles, HTTPStatus.OK.value)
@@ -0,0 +1,77 @@
+""" HashingPool class module.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Any, Callable, Optional
+
+
+class HashingPool():
+    """ Monostate class responsible of running the password hashing in worker processes.
+
+    Slow password hashing is CPU bound; running it in a bounded pool of processes keeps it
+    from holding the interpreter lock of the request threads, and bounds how many hashes
+    are computed at the same time. Workers are spawned (not forked) on first use, as the
+    service process is multithreaded by then.
+    """
+
+    __lock: Lock = Lock()
+    __workers: int = 2
+    __executor: Optional[ProcessPoolExecutor] = None
+
+    @staticmethod
+    def configure(workers: int) -> None:
+        """ Sets the number of worker processes.
+
+        Args:
+            - workers (int): Maximum number of hashes computed at the same time. Zero runs
+              the hashing in the calling thread.
+        """
+        with HashingPool.__lock:
+            previous: Optional[ProcessPoolExecutor] = HashingPool.__executor
+            HashingPool.__workers = workers
+            HashingPool.__executor = None
+        if previous is not None:
+            previous.shutdown(wait=False)
+
+    @staticmethod
+    def run(function: Callable[..., Any], *args: Any) -> Any:
+        """ Runs a hashing function in the pool and waits for its result.
+
+        Args:
+            - function (Callable[..., Any]): The function to run; it and its arguments must be
+              picklable (e.g., a method of a `PasswordHasher`).
+            - *args (Any): The function arguments.
+
+        Returns:
+            - Any: The function result.
+        """
+        executor: Optional[ProcessPoolExecutor] = HashingPool.__get_executor()
+        if executor is None:
+            return function(*args)
+        try:
+            return executor.submit(function, *args).result()
+        except BrokenProcessPool:
+            # A worker died (e.g., killed by the OOM killer); start a new pool next time
+            with HashingPool.__lock:
+                if HashingPool.__executor is executor:
+                    HashingPool.__executor = None
+            raise
+
+    @staticmethod
+    def __get_executor() -> Optional[ProcessPoolExecutor]:
+        """ Gets the pool of worker processes, creating it if needed.
+
+        Returns:
+            - Optional[ProcessPoolExecutor]: The pool, or `None` if hashing runs inline.
+        """
+        with HashingPool.__lock:
+            if HashingPool.__workers <= 0:
+                return None
+            if HashingPool.__executor is None:
+                HashingPool.__executor = ProcessPoolExecutor(
+                    max_workers=HashingPool.__workers,
+                    mp_context=multiprocessing.get_context('spawn'))
+            return HashingPool.__executor
@@ -1,22 +1,49 @@
 """ RoleServices class module.
 """
 
-from typing import Union, List
+from typing import Dict, Optional, Sequence, Union, List
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223common.data import Role
+from dms2223common.data.cache import ReadThroughCache
 from dms2223auth.data.db import Schema
-from dms2223auth.data.db.exc.usernotfounderror import UserNotFoundError
-from dms2223auth.data.db.results import UserRole
+from dms2223auth.data.db.results import User, UserRole
 from dms2223auth.data.db.resultsets import UserRoles
 
 
 class RoleServices():
     """ Monostate class that provides high-level services to handle role-related use cases.
     """
+
+    # Role checks are among the most frequent queries; role changes invalidate the cache.
+    # Each user entry holds the token claims of the user (role names and token version).
+    __role_cache: ReadThroughCache = ReadThroughCache(30.0, 4096)
+
+    @staticmethod
+    def configure_role_cache(ttl: float, max_entries: int) -> None:
+        """Sets the bounds of the user role sets cache.
+
+        Args:
+            - ttl (float): Seconds the role set of a user is kept. Zero disables the cache.
+            - max_entries (int): Maximum number of users whose roles are kept.
+        """
+        RoleServices.__role_cache.configure(ttl, max_entries)
+
+    @staticmethod
+    def get_role_cache_stats() -> Dict[str, int]:
+        """Gets the hit and miss counters of the user role sets cache.
+
+        Returns:
+            - Dict[str, int]: The number of hits (`hits`), misses (`misses`) and users
+              currently cached (`entries`).
+        """
+        return RoleServices.__role_cache.get_stats()
+
     @staticmethod
     def has_role(username: str, role: Union[Role, str], schema: Schema) -> bool:
         """Determines whether a user has a certain role or not.
 
+        The role set of the user is read through the role cache.
+
         Args:
             - username (str): The username of the user to test.
             - role (Union[Role, str]): The role to be tested.
@@ -25,24 +52,15 @@ class RoleServices():
         Returns:
             - bool: `True` if the user has the given role. `False` otherwise.
         """
-        session: Session = schema.new_session()
-        has_role: bool
-        try:
-            if isinstance(role, str):
-                role = Role[role]
-            has_role = bool(UserRoles.find_role(
-                session, username, role) is not None)
-        except KeyError:
-            has_role = False
-        except UserNotFoundError:
-            has_role = False
-        schema.remove_session()
-        return has_role
+        rolename: str = role.name if isinstance(role, Role) else role
+        return rolename in RoleServices.__cached_claims(username, schema)['roles']
 
     @staticmethod
     def list_user_roles(username: str, schema: Schema) -> List[str]:
         """Lists the roles assigned to a given user.
 
+        The role set of the user is read through the role cache.
+
         Args:
             - username (str): The username of the user queried.
             - schema (Schema): A database handler where users and roles are mapped into.
@@ -53,18 +71,75 @@ class RoleServices():
         Returns:
             - List[str]: The list of role names.
         """
+        return list(RoleServices.__cached_claims(username, schema)['roles'])
+
+    @staticmethod
+    def get_token_claims(username: str, schema: Schema) -> Dict:
+        """Gets the role claims embedded in the tokens issued to a user.
+
+        The claims are read through the role cache.
+
+        Args:
+            - username (str): The username of the user queried.
+            - schema (Schema): A database handler where users and roles are mapped into.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - Dict: A dictionary with the list of role names (key `roles`) and the current
+              token version of the user (key `ver`).
+        """
+        claims: Dict = RoleServices.__cached_claims(username, schema)
+        return {'roles': list(claims['roles']), 'ver': claims['ver']}
+
+    @staticmethod
+    def __cached_claims(username: str, schema: Schema) -> Dict:
+        """Gets the token claims of a user from the role cache, loading them on a miss.
+
+        The returned dictionary is shared with other callers and must not be modified.
+
+        Args:
+            - username (str): The username of the user queried.
+            - schema (Schema): A database handler where users and roles are mapped into.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - Dict: A dictionary with the tuple of role names (key `roles`) and the current
+              token version of the user (key `ver`).
+        """
+        return RoleServices.__role_cache.get(
+            username, lambda: RoleServices.__load_claims(username, schema))
+
+    @staticmethod
+    def __load_claims(username: str, schema: Schema) -> Dict:
+        """Loads the token claims of a user from the database.
+
+        Args:
+            - username (str): The username of the user queried.
+            - schema (Schema): A database handler where users and roles are mapped into.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - Dict: A dictionary with the tuple of role names (key `roles`), in the order
+              of `Role`, and the current token version of the user (key `ver`).
+        """
         session: Session = schema.new_session()
-        out: List[str] = []
         try:
             roles: List[UserRole] = UserRoles.list_all_for_user(
                 session, username)
-            for role in roles:
-                out.append(role.role.name)
-        except:  # pylint: disable=try-except-raise
-            raise
+            user: Optional[User] = session.get(User, username)
+            rolenames: List[str] = [user_role.role.name for user_role in roles]
+            return {
+                'roles': tuple(role.name for role in Role if role.name in rolenames),
+                'ver': user.token_version if user is not None else 0
+            }
         finally:
             schema.remove_session()
-        return out
 
     @staticmethod
     def grant_role(username: str, role: Union[Role, str], schema: Schema) -> None:
@@ -87,7 +162,38 @@ class RoleServices():
         except:  # pylint: disable=try-except-raise
             raise
         finally:
+            RoleServices.__role_cache.invalidate(username)
+            schema.remove_session()
+
+    @staticmethod
+    def set_roles(username: str, roles: Sequence[Union[Role, str]], schema: Schema) -> List[str]:
+        """Replaces the roles of a user.
+
+        Args:
+            - username (str): The user name.
+            - roles (Sequence[Union[Role, str]]): The roles the user must have.
+            - schema (Schema): A database handler where users and roles are mapped into.
+
+        Raises:
+            - ValueError: If the username is missing or a role name is not valid.
+            - UserNotFoundError: If the user does not exist.
+
+        Returns:
+            - List[str]: The list of role names of the user after the change.
+        """
+        session: Session = schema.new_session()
+        try:
+            target: List[Role] = [
+                role if isinstance(role, Role) else Role[role] for role in roles
+            ]
+            user_roles: List[UserRole] = UserRoles.set_roles(session, username, target)
+            out: List[str] = [user_role.role.name for user_role in user_roles]
+        except KeyError as ex:
+            raise ValueError('Invalid role name.') from ex
+        finally:
+            RoleServices.__role_cache.invalidate(username)
             schema.remove_session()
+        return out
 
     @staticmethod
     def revoke_role(username: str, role: Union[Role, str], schema: Schema) -> None:
@@ -109,4 +215,5 @@ class RoleServices():
         except:  # pylint: disable=try-except-raise
             raise
         finally:
+            RoleServices.__role_cache.invalidate(username)
             schema.remove_session()
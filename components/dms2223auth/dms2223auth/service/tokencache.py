@@ -0,0 +1,154 @@
+""" TokenCache class module.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Dict, List, Set
+from dms2223common.data.cache import ReadThroughCache
+
+
+class TokenCache():
+    """ Monostate class keeping the claims of already verified user tokens.
+
+    The claims are read through a shared cache keyed by the token digest, so the tokens
+    themselves are not kept in memory. A token is dropped once it expires or after the time
+    to live, whatever happens first; the time to live bounds how long a token keeps the
+    claims it was verified with (e.g., the roles of its user) in the processes that did not
+    invalidate them. The digests cached for each user are indexed, so that they can be
+    dropped when the user roles change.
+    """
+
+    __claims: ReadThroughCache = ReadThroughCache(30.0, 4096)
+    __lock: Lock = Lock()
+    __owners: 'OrderedDict[bytes, str]' = OrderedDict()
+    __digests: Dict[str, Set[bytes]] = {}
+    __capacity: int = 4096
+    __ttl: float = 30.0
+
+    @staticmethod
+    def configure(capacity: int, ttl: float) -> None:
+        """ Sets the bounds of the token cache, dropping the cached tokens.
+
+        Args:
+            - capacity (int): Maximum number of tokens kept. Zero disables the cache.
+            - ttl (float): Maximum seconds a token is kept. Zero disables the cache.
+        """
+        with TokenCache.__lock:
+            TokenCache.__capacity = capacity
+            TokenCache.__ttl = ttl
+            TokenCache.__owners.clear()
+            TokenCache.__digests.clear()
+        TokenCache.__claims.configure(ttl, capacity)
+
+    @staticmethod
+    def __digest(token: str) -> bytes:
+        """ Computes the cache key of a token.
+
+        Args:
+            - token (str): The JWS user token.
+
+        Returns:
+            - bytes: The token digest.
+        """
+        return hashlib.sha256(token.encode('ascii', 'replace')).digest()
+
+    @staticmethod
+    def get(token: str, loader: Callable[[], Dict]) -> Dict:
+        """ Gets the claims of a verified token, verifying it if it is not cached.
+
+        Args:
+            - token (str): The JWS user token.
+            - loader (Callable[[], Dict]): The function that verifies the token when it is
+              not cached, returning its claims (including its user, `user`, and its
+              expiration, `exp`). Exceptions raised by it are propagated and nothing is
+              cached.
+
+        Returns:
+            - Dict: The token claims. They are shared among callers, so they must not be
+              modified.
+        """
+        key: bytes = TokenCache.__digest(token)
+        claims: Dict = TokenCache.__claims.get(key, lambda: TokenCache.__load(key, loader))
+        if time.time() > claims['exp']:
+            # Cached for longer than the token lasts; the loader tells why it is not valid
+            TokenCache.__claims.invalidate(key)
+            return loader()
+        return claims
+
+    @staticmethod
+    def __load(key: bytes, loader: Callable[[], Dict]) -> Dict:
+        """ Verifies a token that is not cached and indexes its digest under its user,
+        dropping the oldest indexed tokens if there are more than the capacity.
+
+        Args:
+            - key (bytes): The token digest.
+            - loader (Callable[[], Dict]): The function that verifies the token.
+
+        Returns:
+            - Dict: The token claims.
+        """
+        claims: Dict = loader()
+        with TokenCache.__lock:
+            if TokenCache.__capacity <= 0 or TokenCache.__ttl <= 0:
+                return claims
+            TokenCache.__owners[key] = claims['user']
+            TokenCache.__digests.setdefault(claims['user'], set()).add(key)
+            dropped: List[bytes] = []
+            while len(TokenCache.__owners) > TokenCache.__capacity:
+                oldest, username = TokenCache.__owners.popitem(last=False)
+                TokenCache.__unindex(oldest, username)
+                dropped.append(oldest)
+        # Tokens no longer indexed must not stay cached, or a role change would miss them
+        for oldest in dropped:
+            TokenCache.__claims.invalidate(oldest)
+        return claims
+
+    @staticmethod
+    def __unindex(key: bytes, username: str) -> None:
+        """ Removes a token digest from the index of its user. Must be called holding the
+        index lock.
+
+        Args:
+            - key (bytes): The token digest.
+            - username (str): The user name.
+        """
+        digests: Set[bytes] = TokenCache.__digests.get(username, set())
+        digests.discard(key)
+        if not digests:
+            TokenCache.__digests.pop(username, None)
+
+    @staticmethod
+    def invalidate_user(username: str) -> None:
+        """ Drops the cached tokens of a user (e.g., after the user roles change).
+
+        Args:
+            - username (str): The user name.
+        """
+        with TokenCache.__lock:
+            digests: Set[bytes] = TokenCache.__digests.pop(username, set())
+            for key in digests:
+                TokenCache.__owners.pop(key, None)
+        for key in digests:
+            TokenCache.__claims.invalidate(key)
+
+    @staticmethod
+    def get_metrics() -> Dict:
+        """ Gets the cache usage metrics gathered so far.
+
+        Returns:
+            - Dict: A dictionary with the number of hits (`hits`) and misses (`misses`), the
+              hit rate (`hit_rate`, from 0 to 1), the tokens currently cached (`entries`),
+              the capacity (`capacity`) and the time to live (`ttl`).
+        """
+        stats: Dict[str, int] = TokenCache.__claims.get_stats()
+        lookups: int = stats['hits'] + stats['misses']
+        return {
+            'hits': stats['hits'],
+            'misses': stats['misses'],
+            'hit_rate': stats['hits'] / lookups if lookups > 0 else 0.0,
+            'entries': stats['entries'],
+            'capacity': TokenCache.__capacity,
+            'ttl': TokenCache.__ttl,
+        }
@@ -1,12 +1,14 @@
 """ UserServices class module.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223auth.data.config import AuthConfiguration
 from dms2223auth.data.db import Schema
 from dms2223auth.data.db.results import User
 from dms2223auth.data.db.resultsets import Users
+from dms2223auth.data.db.resultsets.passwordhasher import PasswordHasher
+from dms2223auth.service.hashingpool import HashingPool
 
 
 class UserServices():
@@ -16,6 +18,10 @@ class UserServices():
     def user_exists(username: str, password: str, schema: Schema, cfg: AuthConfiguration) -> bool:
         """Determines whether a user with the given credentials exists.
 
+        The password is checked in the hashing pool. Passwords stored with the legacy
+        scheme or outdated cost parameters are hashed again with the configured ones
+        once they are verified.
+
         Args:
             - username (str): The user name.
             - password (str): The user password.
@@ -25,33 +31,91 @@ class UserServices():
         Returns:
             - bool: `True` if the given user exists. `False` otherwise.
         """
-        salt: str = cfg.get_password_salt()
-        password_hash: str = Users.hash_password(
-            password, suffix=username, salt=salt)
+        hasher: PasswordHasher = UserServices.__password_hasher(cfg)
         session: Session = schema.new_session()
-        user_exists: bool = Users.user_exists(session, username, password_hash)
-        schema.remove_session()
-        return user_exists
+        try:
+            password_hash: Optional[str] = Users.get_password_hash(session, username)
+        finally:
+            schema.remove_session()
+        if password_hash is None:
+            # Spend the same time as with an existing user, not to disclose which ones exist
+            HashingPool.run(hasher.hash, password, username)
+            return False
+
+        stored_hasher: PasswordHasher = hasher
+        if not hasher.identifies(password_hash):
+            stored_hasher = Users.legacy_password_hasher(cfg.get_password_salt())
+        if not stored_hasher.identifies(password_hash) \
+                or not HashingPool.run(stored_hasher.verify, password, username, password_hash):
+            return False
+
+        if stored_hasher is not hasher or hasher.needs_rehash(password_hash):
+            new_password_hash: str = HashingPool.run(hasher.hash, password, username)
+            session = schema.new_session()
+            try:
+                Users.update_password_hash(session, username, password_hash, new_password_hash)
+            finally:
+                schema.remove_session()
+        return True
+
+    @staticmethod
+    def __password_hasher(cfg: AuthConfiguration) -> PasswordHasher:
+        """Builds the configured password hasher.
+
+        Args:
+            - cfg (AuthConfiguration): The application configuration.
+
+        Returns:
+            - PasswordHasher: The hasher of new passwords.
+        """
+        return Users.password_hasher(cfg.get_password_hashing(), cfg.get_password_salt())
 
     @staticmethod
-    def list_users(schema: Schema) -> List[Dict]:
-        """Lists the existing users.
+    def list_users(schema: Schema, limit: int = 50, after: Optional[str] = None,
+                   prefix: Optional[str] = None, with_roles: bool = False) -> Dict:
+        """Lists a page of the existing users, sorted by username.
 
         Args:
             - schema (Schema): A database handler where the users are mapped into.
+            - limit (int): The maximum number of users in the page.
+            - after (Optional[str]): The cursor returned with the previous page, if any.
+            - prefix (Optional[str]): Only users with a username starting with this are listed.
+            - with_roles (bool): Whether to include the role names of each user.
+
+        Raises:
+            - ValueError: If the page limit is not a positive number.
 
         Returns:
-            - List[Dict]: A list of dictionaries with the users' data.
+            - Dict: A dictionary with a list of dictionaries with the users' data (key `users`)
+              and the cursor of the next page (key `next_cursor`, `None` on the last page).
         """
+        if limit < 1:
+            raise ValueError('The page limit must be a positive number.')
         out: List[Dict] = []
         session: Session = schema.new_session()
-        users: List[User] = Users.list_all(session)
-        for user in users:
-            out.append({
-                'username': user.username
-            })
-        schema.remove_session()
-        return out
+        try:
+            if with_roles:
+                by_username: Dict[str, Dict] = {}
+                for username, role in Users.list_page_with_roles(
+                        session, limit + 1, after, prefix):
+                    if username not in by_username:
+                        by_username[username] = {'username': username, 'roles': []}
+                        out.append(by_username[username])
+                    if role is not None:
+                        by_username[username]['roles'].append(role.name)
+            else:
+                users: List[User] = Users.list_page(session, limit + 1, after, prefix)
+                for user in users:
+                    out.append({
+                        'username': user.username
+                    })
+        finally:
+            schema.remove_session()
+        next_cursor: Optional[str] = None
+        if len(out) > limit:
+            out = out[:limit]
+            next_cursor = out[-1]['username']
+        return {'users': out, 'next_cursor': next_cursor}
 
     @staticmethod
     def create_user(username: str, password: str, schema: Schema, cfg: AuthConfiguration) -> Dict:
@@ -70,9 +134,8 @@ class UserServices():
         Returns:
             - Dict: A dictionary with the new user's data.
         """
-        salt: str = cfg.get_password_salt()
-        password_hash: str = Users.hash_password(
-            password, suffix=username, salt=salt)
+        password_hash: str = HashingPool.run(
+            UserServices.__password_hasher(cfg).hash, password, username)
         session: Session = schema.new_session()
         out: Dict = {}
         try:
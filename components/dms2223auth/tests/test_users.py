@@ -0,0 +1,39 @@
+""" Tests of the Users resultset.
+"""
+
+import unittest
+from typing import List
+from dms2223auth.data.config import AuthConfiguration
+from dms2223auth.data.db import Schema
+from dms2223auth.data.db.resultsets import Users
+
+
+class UsersTests(unittest.TestCase):
+    """ Tests of the users listing over an in-memory SQLite database.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """ Deploys the database with users whose names share surrogate-adjacent prefixes.
+        """
+        cfg: AuthConfiguration = AuthConfiguration()
+        cfg.set_db_connection_string('sqlite://')
+        cls.schema: Schema = Schema(cfg)
+        session = cls.schema.new_session()
+        for username in ('a\ud7ff', 'a\ud7ffb', 'a', 'b'):
+            Users.create(session, username, 'hash')
+        cls.schema.remove_session()
+
+    def test_prefix_ending_before_surrogates(self):
+        """ A prefix whose last character precedes the surrogates (U+D7FF) is listed.
+        """
+        session = self.schema.new_session()
+        users: List[str] = [
+            user.username for user in Users.list_page(session, 10, prefix='a\ud7ff')
+        ]
+        self.schema.remove_session()
+        self.assertEqual(users, ['a\ud7ff', 'a\ud7ffb'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,6 +25,18 @@ class BackendConfiguration(ServiceConfiguration):
         ServiceConfiguration.__init__(self)
 
         self.set_db_connection_string('sqlite:////tmp/dms2223backend.sqlite3.db')
+        self.set_sqlite_pragmas({
+            'busy_timeout': 5000,
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'cache_size': -16000,
+            'mmap_size': 134217728,
+            'temp_store': 'MEMORY'
+        })
+        self.set_discussions_cache({
+            'ttl': 30,
+            'max_entries': 1024
+        })
         self.set_service_host('127.0.0.1')
         self.set_service_port(5000)
         self.set_debug_flag(True)
@@ -35,6 +47,8 @@ class BackendConfiguration(ServiceConfiguration):
             'port': 4000,
             'apikey_secret': 'This should be the backend API key'
         })
+        self.set_jws_secret('This JWS secret should be changed ASAP')
+        self.set_token_verification('local')
 
     def _set_values(self, values: Dict) -> None:
         """Sets/merges a collection of configuration values.
@@ -46,10 +60,19 @@ class BackendConfiguration(ServiceConfiguration):
 
         if 'db_connection_string' in values:
             self.set_db_connection_string(values['db_connection_string'])
+        if 'sqlite_pragmas' in values:
+            self.set_sqlite_pragmas({**self.get_sqlite_pragmas(), **values['sqlite_pragmas']})
+        if 'discussions_cache' in values:
+            self.set_discussions_cache(
+                {**self.get_discussions_cache(), **values['discussions_cache']})
         if 'salt' in values:
             self.set_password_salt(values['salt'])
         if 'auth_service' in values:
             self.set_auth_service(values['auth_service'])
+        if 'jws_secret' in values:
+            self.set_jws_secret(values['jws_secret'])
+        if 'token_verification' in values:
+            self.set_token_verification(values['token_verification'])
 
     def set_db_connection_string(self, db_connection_string: str) -> None:
         """ Sets the db_connection_string configuration value.
@@ -71,6 +94,62 @@ class BackendConfiguration(ServiceConfiguration):
 
         return str(self._values['db_connection_string'])
 
+    def set_sqlite_pragmas(self, sqlite_pragmas: Dict) -> None:
+        """ Sets the SQLite pragmas applied on every new database connection.
+
+        Args:
+            - sqlite_pragmas (Dict): A dictionary of pragma names and values. A `None` value
+              leaves that pragma with the SQLite default.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if not isinstance(sqlite_pragmas, dict):
+            raise ValueError('The SQLite pragmas must be a dictionary.')
+        for name, value in sqlite_pragmas.items():
+            if not str(name).isidentifier():
+                raise ValueError('Invalid SQLite pragma name: ' + str(name))
+            if value is not None and not str(value).lstrip('-').isalnum():
+                raise ValueError('Invalid value for the SQLite pragma ' + str(name))
+        self._values['sqlite_pragmas'] = sqlite_pragmas
+
+    def get_sqlite_pragmas(self) -> Dict:
+        """ Gets the SQLite pragmas applied on every new database connection.
+
+        Returns:
+            - Dict: A dictionary with the pragma names and values.
+        """
+
+        return self._values['sqlite_pragmas']
+
+    def set_discussions_cache(self, discussions_cache: Dict) -> None:
+        """ Sets the bounds of the in-process cache of discussion listings.
+
+        Args:
+            - discussions_cache (Dict): A dictionary with the seconds each listing page is
+              kept (`ttl`, zero disables the cache) and the maximum number of pages kept
+              (`max_entries`).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if not isinstance(discussions_cache, dict):
+            raise ValueError('The discussions cache settings must be a dictionary.')
+        for name in ('ttl', 'max_entries'):
+            value = discussions_cache.get(name)
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                raise ValueError('Invalid value for the discussions cache setting ' + name)
+        self._values['discussions_cache'] = discussions_cache
+
+    def get_discussions_cache(self) -> Dict:
+        """ Gets the bounds of the in-process cache of discussion listings.
+
+        Returns:
+            - Dict: A dictionary with the `ttl` and `max_entries` values.
+        """
+
+        return self._values['discussions_cache']
+
     def set_password_salt(self, salt: str) -> None:
         """ Sets the password salt configuration value.
 
@@ -111,4 +190,48 @@ class BackendConfiguration(ServiceConfiguration):
         """
 
         return self._values['auth_service']
-   
\ No newline at end of file
+   
+
+    def set_jws_secret(self, secret: str) -> None:
+        """ Sets the JWS secret key configuration value.
+
+        Must be the same secret the authentication service signs the user tokens with.
+
+        Args:
+            - secret: A string with the configuration value.
+        """
+
+        self._values['jws_secret'] = str(secret)
+
+    def get_jws_secret(self) -> str:
+        """ Gets the JWS secret key configuration value.
+
+        Returns:
+            - str: A string with the value of jws_secret.
+        """
+
+        return str(self._values['jws_secret'])
+
+    def set_token_verification(self, mode: str) -> None:
+        """ Sets how the user tokens are verified.
+
+        Args:
+            - mode (str): `local` to check the token signature with the JWS secret,
+              `remote` to ask the authentication service, or `local_with_fallback` to ask
+              the authentication service only when the signature check fails.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if mode not in ('local', 'remote', 'local_with_fallback'):
+            raise ValueError('Invalid token verification mode: ' + str(mode))
+        self._values['token_verification'] = mode
+
+    def get_token_verification(self) -> str:
+        """ Gets how the user tokens are verified.
+
+        Returns:
+            - str: One of `local`, `remote` or `local_with_fallback`.
+        """
+
+        return str(self._values['token_verification'])
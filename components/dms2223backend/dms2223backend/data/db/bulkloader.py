@@ -0,0 +1,203 @@
+""" BulkLoader class module.
+"""
+
+import csv
+import json
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from sqlalchemy import insert  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2223backend.data.db.schema import Schema
+from dms2223backend.data.db.results import Discussion, Answer, Comment, \
+    Report, Reportanswer, Reportcomment
+from dms2223backend.data.reportstatus import ReportStatus
+
+
+class BulkLoader():
+    """ Class responsible of loading large amounts of records into the database.
+
+    Records are buffered up to the batch size and written with multi-row inserts, one
+    transaction per batch, so the memory used does not depend on the input size.
+
+    Every record has a `type` (one of `RECORD_TYPES`) and the columns of its table. Ids
+    may be given explicitly so that records loaded later can reference them.
+    """
+
+    # Record type: (mapped class, required columns, optional columns), in dependency order
+    RECORD_TYPES: Dict[str, Tuple[type, Tuple[str, ...], Tuple[str, ...]]] = {
+        'discussion': (Discussion, ('title', 'content'), ('id',)),
+        'answer': (Answer, ('discussionid', 'content'), ('id',)),
+        'comment': (Comment, ('discussionid', 'answerid', 'content'), ('id',)),
+        'report': (Report, ('discussionid', 'reason'), ('id', 'tipo', 'status')),
+        'reportanswer': (Reportanswer, ('answerid', 'reason'), ('id', 'status')),
+        'reportcomment': (Reportcomment, ('commentid', 'reason'), ('id', 'status')),
+    }
+
+    __INTEGER_COLUMNS = ('id', 'discussionid', 'answerid', 'commentid', 'tipo')
+
+    # Bound parameters per INSERT statement (the lowest SQLite limit)
+    __MAX_STATEMENT_PARAMETERS = 999
+
+    def __init__(self, schema: Schema, batch_size: int = 5000,
+                 progress: Optional[Callable[[int, float], None]] = None):
+        """ Constructor method.
+
+        Args:
+            - schema (Schema): A database handler where the records are mapped into.
+            - batch_size (int): The number of records written in each transaction.
+            - progress (Optional[Callable[[int, float], None]]): A function called after
+              every batch with the number of records loaded so far and the elapsed seconds.
+
+        Raises:
+            - ValueError: If the batch size is not a positive number.
+        """
+        if batch_size < 1:
+            raise ValueError('The batch size must be a positive number.')
+        self.__schema: Schema = schema
+        self.__batch_size: int = batch_size
+        self.__progress: Optional[Callable[[int, float], None]] = progress
+
+    @staticmethod
+    def read_ndjson(stream: TextIO) -> Iterator[Dict]:
+        """ Reads records from a newline-delimited JSON stream.
+
+        Args:
+            - stream (TextIO): The stream, with one JSON object (including `type`) per line.
+
+        Raises:
+            - ValueError: If a line is not a valid JSON object.
+
+        Returns:
+            - Iterator[Dict]: The records, read lazily.
+        """
+        for number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as ex:
+                raise ValueError(f'Invalid JSON in line {number}.') from ex
+            if not isinstance(record, dict):
+                raise ValueError(f'Line {number} is not a JSON object.')
+            yield record
+
+    @staticmethod
+    def read_csv(stream: TextIO, record_type: Optional[str] = None) -> Iterator[Dict]:
+        """ Reads records from a CSV stream with a header row.
+
+        Args:
+            - stream (TextIO): The CSV stream.
+            - record_type (Optional[str]): The type of all the records, for files
+              without a `type` column.
+
+        Returns:
+            - Iterator[Dict]: The records, read lazily. Empty cells are skipped.
+        """
+        for row in csv.DictReader(stream):
+            record: Dict = {key: value for key, value in row.items() if value not in (None, '')}
+            if record_type is not None:
+                record.setdefault('type', record_type)
+            yield record
+
+    def load(self, records: Iterable[Dict]) -> int:
+        """ Loads a sequence of records.
+
+        Args:
+            - records (Iterable[Dict]): The records to load.
+
+        Raises:
+            - ValueError: If a record has an unknown type or status, or lacks a required
+              column.
+
+        Returns:
+            - int: The number of records loaded.
+        """
+        pending: Dict[str, List[Dict]] = {record_type: [] for record_type in self.RECORD_TYPES}
+        pending_count: int = 0
+        loaded: int = 0
+        start: float = time.perf_counter()
+        for record in records:
+            record_type, values = BulkLoader.__prepare(record)
+            pending[record_type].append(values)
+            pending_count += 1
+            if pending_count >= self.__batch_size:
+                loaded += self.__flush(pending)
+                pending_count = 0
+                if self.__progress is not None:
+                    self.__progress(loaded, time.perf_counter() - start)
+        if pending_count > 0:
+            loaded += self.__flush(pending)
+            if self.__progress is not None:
+                self.__progress(loaded, time.perf_counter() - start)
+        return loaded
+
+    @staticmethod
+    def __prepare(record: Dict) -> Tuple[str, Dict]:
+        """ Validates a record and converts it to the column values of its table.
+
+        Args:
+            - record (Dict): The record read.
+
+        Raises:
+            - ValueError: If the record has an unknown type or status, or lacks a required
+              column.
+
+        Returns:
+            - Tuple[str, Dict]: The record type and the column values.
+        """
+        record_type: str = str(record.get('type', ''))
+        if record_type not in BulkLoader.RECORD_TYPES:
+            raise ValueError('Unknown record type: ' + record_type)
+        _, required, optional = BulkLoader.RECORD_TYPES[record_type]
+        values: Dict = {}
+        for column in required:
+            if record.get(column) in (None, ''):
+                raise ValueError(f'A {record_type} record requires a {column} value.')
+            values[column] = record[column]
+        for column in optional:
+            if record.get(column) not in (None, ''):
+                values[column] = record[column]
+        for column in BulkLoader.__INTEGER_COLUMNS:
+            if column in values:
+                values[column] = int(values[column])
+        if 'status' in values:
+            try:
+                values['status'] = ReportStatus[str(values['status']).upper()]
+            except KeyError as ex:
+                raise ValueError(
+                    f'A {record_type} record has an unknown status: {values["status"]}.') from ex
+        elif record_type.startswith('report'):
+            values['status'] = ReportStatus.PENDING
+        return (record_type, values)
+
+    def __flush(self, pending: Dict[str, List[Dict]]) -> int:
+        """ Writes the pending records in a single transaction and empties the buffers.
+
+        Args:
+            - pending (Dict[str, List[Dict]]): The pending column values by record type.
+
+        Returns:
+            - int: The number of records written.
+        """
+        written: int = 0
+        session: Session = self.__schema.new_session()
+        try:
+            for record_type, (mapped_class, _, _) in self.RECORD_TYPES.items():
+                rows: List[Dict] = pending[record_type]
+                # Rows of a multi-row insert must share the same columns
+                by_columns: Dict[Tuple[str, ...], List[Dict]] = {}
+                for row in rows:
+                    by_columns.setdefault(tuple(sorted(row)), []).append(row)
+                for columns, group in by_columns.items():
+                    step: int = max(1, self.__MAX_STATEMENT_PARAMETERS // len(columns))
+                    for offset in range(0, len(group), step):
+                        session.execute(insert(mapped_class).values(group[offset:offset + step]))
+                written += len(rows)
+                rows.clear()
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self.__schema.remove_session()
+        return written
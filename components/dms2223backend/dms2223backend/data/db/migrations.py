@@ -0,0 +1,39 @@
+""" Migrations class module.
+"""
+
+from typing import Callable, List
+from sqlalchemy import MetaData  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+
+class Migrations():
+    """ Monostate class holding the migration steps of the service database.
+
+    `create_all` only creates the tables that do not exist yet, so any change to a table
+    already deployed (e.g., a new index) needs a migration step. The steps are applied by
+    `SchemaMigrations`, once and in order.
+    """
+
+    @staticmethod
+    def _create_indexes(connection: Connection, metadata: MetaData) -> None:
+        """ Migration step 1: creates the lookup and foreign key indexes.
+
+        Args:
+            - connection (Connection): The connection where the step is run.
+            - metadata (MetaData): The metadata with the current table definitions.
+        """
+        for table in metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=connection, checkfirst=True)
+
+    @staticmethod
+    def steps() -> List[Callable[[Connection, MetaData], None]]:
+        """ Gets the migration steps, in the order they must be applied.
+
+        New steps must always be appended at the end of the list.
+
+        Returns:
+            - List[Callable[[Connection, MetaData], None]]: The migration step functions.
+        """
+        return [
+            Migrations._create_indexes,
+        ]
@@ -44,7 +44,8 @@ class Answer(ResultBase):
             'answers',
             metadata,
             Column('id', Integer, autoincrement='auto', primary_key=True),
-            Column('discussionid', Integer, ForeignKey('discussions.id'), nullable=False),
+            Column('discussionid', Integer, ForeignKey('discussions.id'), nullable=False,
+                   index=True),
             Column('content', String(250), nullable=False)
             # Column('user', String, nullable=False),
             # Column('time', TIME, nullable = False),
@@ -40,8 +40,9 @@ class Comment(ResultBase):
             'comments',
             metadata,
             Column('id', Integer, autoincrement='auto', primary_key=True),
-            Column('discussionid', Integer, nullable=False),
-            Column('answerid', Integer, ForeignKey('answers.id'), nullable=False),
+            Column('discussionid', Integer, nullable=False, index=True),
+            Column('answerid', Integer, ForeignKey('answers.id'), nullable=False,
+                   index=True),
             Column('content', String(250), nullable=False)
         )
 
@@ -45,11 +45,11 @@ class Report(ResultBase):
             Column('id', Integer, autoincrement='auto', primary_key=True),
             Column('reason', String(250), nullable=False),
             Column('discussionid', Integer, ForeignKey(
-                'discussions.id'), nullable=False),
+                'discussions.id'), nullable=False, index=True),
             # si vale 1 discusion , si vale 2 respuesta , si vale 3 comentario
             Column('tipo', Integer, nullable=True),
             Column('status', Enum(ReportStatus),
-                   default=ReportStatus.PENDING, nullable=False),
+                   default=ReportStatus.PENDING, nullable=False, index=True),
             # Column('propietario', String(250), nullable=False),
-            Column('timestamp', DateTime, nullable=False, default=func.now())
+            Column('timestamp', DateTime, nullable=False, default=func.now(), index=True)
         )
@@ -43,7 +43,7 @@ class Reportanswer(ResultBase):
             Column('id', Integer, autoincrement='auto', primary_key=True),
             Column('reason', String(250), nullable=False),
             Column('answerid', Integer, ForeignKey(
-                'answers.id'), nullable=False),
+                'answers.id'), nullable=False, index=True),
             Column('status', Enum(ReportStatus),
                    default=ReportStatus.PENDING, nullable=False),
             Column('timestamp', DateTime, nullable=False, default=func.now())
@@ -45,7 +45,7 @@ class Reportcomment(ResultBase):
             Column('id', Integer, autoincrement='auto', primary_key=True),
             Column('reason', String(250), nullable=False),
             Column('commentid', Integer, ForeignKey(
-                'comments.id'), nullable=False),
+                'comments.id'), nullable=False, index=True),
             Column('status', Enum(ReportStatus),
                    default=ReportStatus.PENDING, nullable=False),
             Column('timestamp', DateTime, nullable=False, default=func.now())
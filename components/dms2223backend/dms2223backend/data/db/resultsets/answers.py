@@ -1,7 +1,7 @@
 """ Answers class module.
 """
 
-from typing import List
+from typing import List, Optional
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223backend.data.db.results import Answer
@@ -58,19 +58,37 @@ class Answers():
 
     @staticmethod
     def discussion_has_answers(session: Session, discussionid: int) -> bool:
+        """Determines whether a discussion has been answered.
+
+        Args:
+            - session (Session): The session object.
+            - discussionid (int): The discussion id.
+
+        Raises:
+            - ValueError: If the discussion id is missing.
+
+        Returns:
+            - bool: `True` if the discussion has at least one answer; `False` otherwise.
+        """
         if not discussionid:
             raise ValueError('A discussion id is required.')
-        discussions = Answers.list_all_for_discussion(session, discussionid)
-
-        return len(discussions) != 0
+        query = session.query(Answer.id).filter_by(discussionid=discussionid)  # type: ignore
+        return bool(session.query(query.exists()).scalar())
 
     @staticmethod
-    def list_all_for_discussion(session: Session, discussionid: int) -> List[Answer]:
+    def list_all_for_discussion(session: Session, discussionid: int,
+                                limit: Optional[int] = None,
+                                after: Optional[int] = None) -> List[Answer]:
         """Lists the `answers made to a certain question.
 
+        Answers are sorted by id, and the listing can be restricted to a page using keyset
+        pagination on the primary key.
+
         Args:
             - session (Session): The session object.
             - id (int): The question id.
+            - limit (Optional[int]): The maximum number of answers to return.
+            - after (Optional[int]): Only answers with an id greater than this are returned.
 
         Raises:
             - ValueError: If the question id is missing.
@@ -81,6 +99,11 @@ class Answers():
         if not discussionid:
             raise ValueError('A discussion id is required')
         query = session.query(Answer).filter_by(discussionid=discussionid)
+        if after is not None:
+            query = query.filter(Answer.id > after)  # type: ignore
+        query = query.order_by(Answer.id)  # type: ignore
+        if limit is not None:
+            query = query.limit(limit)
         return query.all()
 
     @staticmethod
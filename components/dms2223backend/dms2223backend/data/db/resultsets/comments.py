@@ -1,7 +1,8 @@
 """ Comments class module.
 """
 
-from typing import List
+from typing import List, Optional
+from sqlalchemy import func  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223backend.data.db.results import Comment
@@ -82,24 +83,64 @@ class Comments():
         return query.all()
 
     @staticmethod
-    def list_all_for_answer(session: Session, answerid: int) -> List[Comment]:
-        """Lists the `answers made to a certain question.
+    def list_all_for_answer(session: Session, answerid: int,
+                            limit: Optional[int] = None,
+                            after: Optional[int] = None) -> List[Comment]:
+        """Lists the comments made to a certain answer.
+
+        Comments are sorted by id, and the listing can be restricted to a page using keyset
+        pagination on the primary key.
 
         Args:
             - session (Session): The session object.
-            - id (int): The question id.
+            - answerid (int): The answer id.
+            - limit (Optional[int]): The maximum number of comments to return.
+            - after (Optional[int]): Only comments with an id greater than this are returned.
 
         Raises:
-            - ValueError: If the question id is missing.
+            - ValueError: If the answer id is missing.
 
         Returns:
-            - List[Answer]: A list of answer registers with the question answers.
+            - List[Comment]: A list of comment registers with the answer comments.
         """
         if not answerid:
             raise ValueError('An answer id is required')
         query = session.query(Comment).filter_by(answerid=answerid)
+        if after is not None:
+            query = query.filter(Comment.id > after)  # type: ignore
+        query = query.order_by(Comment.id)  # type: ignore
+        if limit is not None:
+            query = query.limit(limit)
         return query.all()
         
+    @staticmethod
+    def list_first_for_answers(session: Session, answerids: List[int],
+                               limit: int) -> List[Comment]:
+        """Lists the first comments made to each of several answers with a single statement.
+
+        Args:
+            - session (Session): The session object.
+            - answerids (List[int]): The answer ids.
+            - limit (int): The maximum number of comments returned per answer.
+
+        Returns:
+            - List[Comment]: A list of comment registers, sorted by answer id and then by
+              comment id, with at most `limit` comments of each answer.
+        """
+        if not answerids:
+            return []
+        numbered = session.query(
+            Comment.id.label('id'),  # type: ignore
+            func.row_number().over(
+                partition_by=Comment.answerid, order_by=Comment.id  # type: ignore
+            ).label('position')
+        ).filter(Comment.answerid.in_(answerids)).subquery()  # type: ignore
+        query = session.query(Comment).join(
+            numbered, Comment.id == numbered.c.id  # type: ignore
+        ).filter(numbered.c.position <= limit)
+        query = query.order_by(Comment.answerid, Comment.id)  # type: ignore
+        return query.all()
+
     @staticmethod
     def get_comment(session: Session, discussionid: int, answerid: int) -> Comment:
         """Return a answer of a certain question and user.
@@ -2,11 +2,12 @@
 """
 
 import hashlib
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import func  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
-from dms2223backend.data.db.results import Discussion
+from dms2223backend.data.db.results import Discussion, Answer, Comment
 from dms2223backend.data.db.exc import DiscussionExistsError
 
 
@@ -57,6 +58,41 @@ class Discussions():
         query = session.query(Discussion)
         return query.all()
 
+    @staticmethod
+    def list_all_with_counts(session: Session,
+                             limit: Optional[int] = None,
+                             after: Optional[int] = None
+                             ) -> List[Tuple[Discussion, int, int]]:
+        """Lists the discussions along with their number of answers and comments.
+
+        The counts are computed in the database, so a single statement is issued
+        regardless of the number of discussions. Discussions are sorted by id, and the
+        listing can be restricted to a page using keyset pagination on the primary key.
+
+        Args:
+            - session (Session): The session object.
+            - limit (Optional[int]): The maximum number of discussions to return.
+            - after (Optional[int]): Only discussions with an id greater than this are returned.
+
+        Returns:
+            - List[Tuple[Discussion, int, int]]: A list of tuples with each `Discussion`
+              register, its answer count and its comment count.
+        """
+        answer_count = session.query(func.count(Answer.id)).filter(  # type: ignore
+            Answer.discussionid == Discussion.id  # type: ignore
+        ).correlate(Discussion).scalar_subquery()
+        comment_count = session.query(func.count(Comment.id)).filter(  # type: ignore
+            Comment.discussionid == Discussion.id  # type: ignore
+        ).correlate(Discussion).scalar_subquery()
+        query = session.query(Discussion, answer_count, comment_count)
+        if after is not None:
+            query = query.filter(Discussion.id > after)  # type: ignore
+        query = query.order_by(Discussion.id)  # type: ignore
+        if limit is not None:
+            query = query.limit(limit)
+        return [(discussion, int(answers), int(comments))
+                for discussion, answers, comments in query.all()]
+
     @staticmethod
     def get_discussion_by_id(session: Session, id: int,) -> Optional[Discussion]:
         """Obtains a discussion by an id.
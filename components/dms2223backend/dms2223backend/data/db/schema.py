@@ -1,25 +1,34 @@
 """ Schema class module.
 """
 
+from typing import Dict
 from sqlalchemy import create_engine, event  # type: ignore
-from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.engine import make_url  # type: ignore
 from sqlalchemy.orm import sessionmaker, scoped_session, registry  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
+from dms2223common.data.db import SchemaMigrations
+from dms2223common.data.metrics import PoolMetrics, StatementLog, StatementMetrics
 from dms2223backend.data.config import BackendConfiguration
 from dms2223backend.data.db.results import Discussion, Answer, Comment, \
     Report, Reportanswer, Reportcomment
+from dms2223backend.data.db.migrations import Migrations
 
 
-# Required for SQLite to enforce FK integrity when supported
-@event.listens_for(Engine, 'connect')
-def set_sqlite_pragma(dbapi_connection, connection_record):  # pylint: disable=unused-argument
-    """ Sets the SQLite foreign keys enforcement pragma on connection.
+def set_sqlite_pragmas(dbapi_connection, pragmas: Dict) -> None:
+    """ Sets the SQLite pragmas on a new connection.
+
+    Foreign keys enforcement is always enabled (required for SQLite to enforce FK
+    integrity); the rest of the pragmas come from the configured profile.
 
     Args:
         - dbapi_connection: The connection to the database API.
+        - pragmas (Dict): The pragma names and values. Pragmas set to `None` are skipped.
     """
     cursor = dbapi_connection.cursor()
     cursor.execute('PRAGMA foreign_keys = ON;')
+    for name, value in pragmas.items():
+        if value is not None:
+            cursor.execute(f'PRAGMA {name} = {value};')
     cursor.close()
 
 
@@ -30,7 +39,9 @@ class Schema():
     def __init__(self, config: BackendConfiguration):
         """ Constructor method.
 
-        Initializes the schema, deploying it if necessary.
+        Initializes the schema, deploying it if necessary, and upgrades existing
+        databases through the pending migration steps. Databases already deployed with the
+        current table definitions are used as they are, without running any DDL.
 
         Args:
             - config (AuthConfiguration): The instance with the schema connection parameters.
@@ -44,7 +55,23 @@ class Schema():
                 'A value for the configuration parameter `db_connection_string` is needed.'
             )
         db_connection_string: str = config.get_db_connection_string() or ''
-        self.__create_engine = create_engine(db_connection_string)
+        self.__create_engine = create_engine(
+            db_connection_string,
+            **Schema.__engine_options(db_connection_string, config.get_db_pool())
+        )
+        self.__pool_metrics: PoolMetrics = PoolMetrics()
+        self.__pool_metrics.instrument(self.__create_engine)
+        statement_log: Dict = config.get_statement_log()
+        StatementLog.configure(statement_log['mode'], statement_log['slow_threshold'],
+                               statement_log['repeat_threshold'])
+        if config.get_metrics()['enabled'] or StatementLog.is_enabled():
+            StatementMetrics.instrument(self.__create_engine)
+        if self.__create_engine.dialect.name == 'sqlite':
+            pragmas: Dict = config.get_sqlite_pragmas()
+            event.listen(
+                self.__create_engine, 'connect',
+                lambda dbapi_connection, _: set_sqlite_pragmas(dbapi_connection, pragmas)
+            )
         self.__session_maker = scoped_session(
             sessionmaker(bind=self.__create_engine))
 
@@ -54,7 +81,54 @@ class Schema():
         Report.map(self.__registry)
         Reportanswer.map(self.__registry)
         Reportcomment.map(self.__registry)
-        self.__registry.metadata.create_all(self.__create_engine)
+        migrations: SchemaMigrations = SchemaMigrations(Migrations.steps())
+        if not migrations.is_current(self.__create_engine, self.__registry.metadata):
+            self.__registry.metadata.create_all(self.__create_engine)
+            migrations.upgrade(self.__create_engine, self.__registry.metadata)
+
+    @staticmethod
+    def __engine_options(db_connection_string: str, db_pool: Dict) -> Dict:
+        """ Builds the engine creation options from the pool configuration.
+
+        The pool sizing options only apply to server databases; SQLite keeps the pool
+        class SQLAlchemy chooses for it.
+
+        Args:
+            - db_connection_string (str): The database connection string.
+            - db_pool (Dict): The `db_pool` configuration value.
+
+        Returns:
+            - Dict: The keyword arguments for `create_engine`.
+        """
+        options: Dict = {
+            'pool_pre_ping': db_pool['pre_ping'],
+            'query_cache_size': db_pool['statement_cache_size'],
+        }
+        if make_url(db_connection_string).get_backend_name() != 'sqlite':
+            options['pool_size'] = db_pool['pool_size']
+            options['max_overflow'] = db_pool['max_overflow']
+            options['pool_timeout'] = db_pool['pool_timeout']
+            options['pool_recycle'] = db_pool['pool_recycle']
+        return options
+
+    def get_pool_metrics(self) -> Dict:
+        """ Gets the connection pool checkout metrics.
+
+        Returns:
+            - Dict: A dictionary with the checkout count, the total and maximum checkout wait
+              times in seconds and the pool status.
+        """
+        return self.__pool_metrics.get_metrics()
+
+    def dispose_pool(self, close: bool = True) -> None:
+        """ Discards the pooled database connections; new ones are opened on demand.
+
+        Args:
+            - close (bool): Whether the connections are closed. Pass `False` in a forked
+              process, so the connections inherited from the parent (and still used by it)
+              are dropped without sending anything through them.
+        """
+        self.__create_engine.dispose(close=close)
 
     def new_session(self) -> Session:
         """ Constructs a new session.
@@ -3,10 +3,10 @@
 
 from typing import Optional
 import requests
-from dms2223common.data.rest import ResponseData
+from dms2223common.data.rest import ResponseData, RestClient
 
 
-class AuthService():
+class AuthService(RestClient):
     """ REST client to connect to the authentication service.
     """
 
@@ -14,7 +14,8 @@ class AuthService():
                  host: str, port: int,
                  api_base_path: str = '/api/v1',
                  apikey_header: str = 'X-ApiKey-Auth',
-                 apikey_secret: str = ''
+                 apikey_secret: str = '',
+                 **kwargs
                  ):
         """ Constructor method.
 
@@ -26,22 +27,31 @@ class AuthService():
             - api_base_path (str): The base path that is prepended to every request's path.
             - apikey_header (str): Name of the header with the API key that identifies this client.
             - apikey_secret (str): The API key that identifies this client.
+            - **kwargs: The connection tuning parameters accepted by `RestClient` (timeouts,
+              retries, backoff and pool size).
         """
-        self.__host: str = host
-        self.__port: int = port
-        self.__api_base_path: str = api_base_path
-        self.__apikey_header: str = apikey_header
-        self.__apikey_secret: str = apikey_secret
+        RestClient.__init__(
+            self, host, port, api_base_path, apikey_header, apikey_secret, **kwargs)
 
-    def __base_url(self) -> str:
-        """ Constructs the base URL for the requests.
+    def get_token_owner(self, token: str) -> ResponseData:
+        """ Validates a user session token against the authentication service.
+
+        Args:
+            - token (str): The user session token to validate.
 
         Returns:
-            - str: The base URL.
+            - ResponseData: If successful, the contents hold a dictionary with the name of the
+              token owner (key `username`), its current roles (key `roles`) and its current
+              token version (key `ver`). Otherwise, the token was rejected.
         """
-        return f'http://{self.__host}:{self.__port}{self.__api_base_path}'
-
-    
+        response_data: ResponseData = ResponseData()
+        response: requests.Response = self._request('GET', '/auth', token)
+        response_data.set_successful(response.ok)
+        if response_data.is_successful():
+            response_data.set_content(response.json())
+        else:
+            response_data.add_message(response.content.decode('ascii'))
+        return response_data
 
     def user_role(self, token: Optional[str], username: str, rolename: str)-> ResponseData:
         """ Performs an authentication request to the authentication service.
@@ -55,12 +65,9 @@ class AuthService():
         """
         response_data: ResponseData = ResponseData()
        
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/user/{username}/role/{rolename}',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
+        response: requests.Response = self._request(
+            'GET', '/user/{username}/role/{rolename}', token,
+            {'username': username, 'rolename': rolename}
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
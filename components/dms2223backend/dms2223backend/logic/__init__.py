@@ -1,6 +1,7 @@
 """ Backend logic classes
 """
 
+from .pagination import Pagination
 from .discussionlogic import DiscussionLogic
 from .answerlogic import AnswerLogic
 from .commentlogic import CommentLogic
@@ -1,10 +1,11 @@
 """ AnswerLogic class module.
 """
 
-from typing import List
+from typing import List, Optional, Tuple
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223backend.data.db.results import Answer
 from dms2223backend.data.db.resultsets import Answers
+from dms2223backend.logic.pagination import Pagination
 
 
 class AnswerLogic():
@@ -74,6 +75,30 @@ class AnswerLogic():
         """
         return Answers.list_all_for_discussion(session, discussionid)
 
+    @staticmethod
+    def list_page_for_discussion(discussionid: int, session: Session,
+                                 limit: int, after: Optional[int] = None
+                                 ) -> Tuple[List[Answer], Optional[int]]:
+        """Lists a page of the answers made to a certain question.
+
+        Args:
+            - discussionid (int): The question id.
+            - session (Session): The session object.
+            - limit (int): The maximum number of answers in the page.
+            - after (Optional[int]): The cursor returned with the previous page, if any.
+
+        Raises:
+            - ValueError: If the question id is missing or the limit is not a positive number.
+
+        Returns:
+            - Tuple[List[Answer], Optional[int]]: The answers in the page and the cursor of
+              the next page, or `None` if this is the last one.
+        """
+        Pagination.check_limit(limit)
+        answers: List[Answer] = Answers.list_all_for_discussion(
+            session, discussionid, limit + 1, after)
+        return Pagination.split_page(answers, limit, lambda answer: answer.id)
+
     @staticmethod
     def get_answer(session: Session, discussionid: int) -> Answer:
         """Return a answer of a certain question and user.
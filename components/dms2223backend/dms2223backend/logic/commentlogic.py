@@ -1,10 +1,11 @@
 """ CommentLogic class module.
 """
 
-from typing import List
+from typing import List, Optional, Tuple
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223backend.data.db.results import Comment
 from dms2223backend.data.db.resultsets import Comments
+from dms2223backend.logic.pagination import Pagination
 class CommentLogic():
     """ Class responsible of table-level comments operations.
     """
@@ -79,6 +80,30 @@ class CommentLogic():
         """
         return Comments.list_all_for_answer(session, answerid)
 
+    @staticmethod
+    def list_page_for_answer(answerid: int, session: Session,
+                             limit: int, after: Optional[int] = None
+                             ) -> Tuple[List[Comment], Optional[int]]:
+        """Lists a page of the comments made to a certain answer.
+
+        Args:
+            - answerid (int): The answer id.
+            - session (Session): The session object.
+            - limit (int): The maximum number of comments in the page.
+            - after (Optional[int]): The cursor returned with the previous page, if any.
+
+        Raises:
+            - ValueError: If the answer id is missing or the limit is not a positive number.
+
+        Returns:
+            - Tuple[List[Comment], Optional[int]]: The comments in the page and the cursor of
+              the next page, or `None` if this is the last one.
+        """
+        Pagination.check_limit(limit)
+        comments: List[Comment] = Comments.list_all_for_answer(
+            session, answerid, limit + 1, after)
+        return Pagination.split_page(comments, limit, lambda comment: comment.id)
+
     @staticmethod
     def get_comment(session: Session, discussionid: int, answerid: int) -> Comment:
         """Return a answer of a certain question and user.
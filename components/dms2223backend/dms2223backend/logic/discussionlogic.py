@@ -2,13 +2,14 @@
 """
 
 import hashlib
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
-from dms2223backend.data.db.results import Discussion
-from dms2223backend.data.db.resultsets import Discussions, Answers
-from dms2223backend.data.db.exc import DiscussionExistsError
+from dms2223backend.data.db.results import Discussion, Answer, Comment
+from dms2223backend.data.db.resultsets import Discussions, Answers, Comments
+from dms2223backend.data.db.exc import DiscussionExistsError, DiscussionNotFoundError
+from dms2223backend.logic.pagination import Pagination
 
 
 class DiscussionLogic():
@@ -42,24 +43,47 @@ class DiscussionLogic():
         return new_discussion
 
     @staticmethod
-    def list_all(session: Session) -> List[List]:
+    def list_all(session: Session,
+                 limit: Optional[int] = None, after: Optional[int] = None) -> List[List]:
         """Lists every discussion.
 
         Args:
             - session (Session): The session object.
+            - limit (Optional[int]): The maximum number of discussions to return.
+            - after (Optional[int]): Only discussions with an id greater than this are returned.
 
         Returns:
-            - List[Discussion]: A list of `Discussion` registers.
+            - List[List]: A list with, for each discussion, the `Discussion` register, whether
+              it has been answered (1) or not (0), its answer count and its comment count.
         """
-        discussions = Discussions.list_all(session)
+        discussions = Discussions.list_all_with_counts(session, limit, after)
         list_of_discussions : List[List] = []
-        for discussion in discussions:
-            if (Answers.discussion_has_answers(session, discussion.id)): #type: ignore
-                list_of_discussions.append([discussion,1])
-            else:
-                list_of_discussions.append([discussion,0])
+        for discussion, answers, comments in discussions:
+            answered: int = 1 if answers > 0 else 0
+            list_of_discussions.append([discussion, answered, answers, comments])
         return list_of_discussions
 
+    @staticmethod
+    def list_page(session: Session,
+                  limit: int, after: Optional[int] = None) -> Tuple[List[List], Optional[int]]:
+        """Lists a page of discussions.
+
+        Args:
+            - session (Session): The session object.
+            - limit (int): The maximum number of discussions in the page.
+            - after (Optional[int]): The cursor returned with the previous page, if any.
+
+        Raises:
+            - ValueError: If the limit is not a positive number.
+
+        Returns:
+            - Tuple[List[List], Optional[int]]: The discussions in the page (as returned by
+              `list_all`) and the cursor of the next page, or `None` if this is the last one.
+        """
+        Pagination.check_limit(limit)
+        discussions: List[List] = DiscussionLogic.list_all(session, limit + 1, after)
+        return Pagination.split_page(discussions, limit, lambda row: row[0].id)
+
     @staticmethod
     def get_discussion_by_id(session: Session, id: int,) -> List:
         """Obtains a discussion by an id.
@@ -81,4 +105,52 @@ class DiscussionLogic():
             raise ex
         return list_of_discussions
 
-    
\ No newline at end of file
+    @staticmethod
+    def get_thread(session: Session, id: int, limit: int, after: Optional[int] = None,
+                   comments_limit: int = 10
+                   ) -> Tuple[Discussion, int, List[Answer], Optional[int],
+                              Dict[int, Tuple[List[Comment], Optional[int]]]]:
+        """Obtains a discussion with a page of its answers and the first comments of each.
+
+        The whole thread is loaded with a fixed number of statements, whatever the number
+        of answers and comments.
+
+        Args:
+            - session (Session): The session object.
+            - id (int): Id discussion integer.
+            - limit (int): The maximum number of answers in the page.
+            - after (Optional[int]): The answers cursor returned with the previous page, if any.
+            - comments_limit (int): The maximum number of comments of each answer.
+
+        Raises:
+            - ValueError: If the id is missing or a limit is not a positive number.
+            - DiscussionNotFoundError: If the discussion does not exist.
+
+        Returns:
+            - Tuple[Discussion, int, List[Answer], Optional[int],
+              Dict[int, Tuple[List[Comment], Optional[int]]]]: The discussion, whether it
+              has been answered (1) or not (0), the answers in the page, the cursor of the
+              next answers page (or `None` if this is the last one) and, for each answer id,
+              its first page of comments and the cursor of the next one (or `None`).
+        """
+        # pylint: disable=too-many-arguments
+        Pagination.check_limit(limit)
+        Pagination.check_limit(comments_limit)
+        discussion: Optional[Discussion] = Discussions.get_discussion_by_id(session, id)
+        if discussion is None:
+            raise DiscussionNotFoundError(
+                'A discussion with id ' + str(id) + ' not exists.')
+        answers: List[Answer] = Answers.list_all_for_discussion(session, id, limit + 1, after)
+        answered: int = 1 if answers else 0
+        if not answered and after is not None:
+            answered = 1 if Answers.discussion_has_answers(session, id) else 0
+        page, next_cursor = Pagination.split_page(answers, limit, lambda answer: answer.id)
+        fetched: Dict[int, List[Comment]] = {answer.id: [] for answer in page}
+        for comment in Comments.list_first_for_answers(
+                session, list(fetched), comments_limit + 1):
+            fetched[comment.answerid].append(comment)
+        comments: Dict[int, Tuple[List[Comment], Optional[int]]] = {
+            answerid: Pagination.split_page(rows, comments_limit, lambda comment: comment.id)
+            for answerid, rows in fetched.items()
+        }
+        return (discussion, answered, page, next_cursor, comments)
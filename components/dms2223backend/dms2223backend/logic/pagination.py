@@ -0,0 +1,44 @@
+""" Pagination class module.
+"""
+
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class Pagination():
+    """ Monostate class with utilities for keyset (cursor-based) pagination.
+    """
+
+    @staticmethod
+    def check_limit(limit: int) -> None:
+        """ Validates a page limit.
+
+        Args:
+            - limit (int): The maximum number of elements in a page.
+
+        Raises:
+            - ValueError: If the limit is not a positive number.
+        """
+        if limit < 1:
+            raise ValueError('The page limit must be a positive number.')
+
+    @staticmethod
+    def split_page(rows: List, limit: int,
+                   cursor_of: Callable[[Any], int]) -> Tuple[List, Optional[int]]:
+        """ Splits the rows fetched for a page from the cursor of the next one.
+
+        The rows must have been fetched asking for `limit + 1` elements, so the presence
+        of an extra row tells whether there is a next page.
+
+        Args:
+            - rows (List): The rows fetched, sorted by the cursor key.
+            - limit (int): The maximum number of elements in a page.
+            - cursor_of (Callable[[Any], int]): Function extracting the cursor key from a row.
+
+        Returns:
+            - Tuple[List, Optional[int]]: The rows in the page and the cursor of the next
+              page, or `None` if this is the last one.
+        """
+        if len(rows) <= limit:
+            return (rows, None)
+        rows = rows[:limit]
+        return (rows, cursor_of(rows[-1]))
@@ -4,12 +4,14 @@
 from typing import Tuple, Union, Optional, List, Dict
 from http import HTTPStatus
 from flask import current_app
+from dms2223common.data import Role
+from dms2223common.presentation.security import token_has_role
 from dms2223backend.data.db.exc import DiscussionNotFoundError
 from dms2223backend.logic.exc.operationerror import OperationError
 from dms2223backend.service import CommentsServices
 
 
-def comment(body: Dict, id: int) -> Tuple[Union[Dict, str], Optional[int]]:
+def comment(body: Dict, id: int, token_info: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
     """Comments a discussion if the requestor has the discussion role.
 
     Args:
@@ -24,6 +26,11 @@ def comment(body: Dict, id: int) -> Tuple[Union[Dict, str], Optional[int]]:
             - 409 CONFLICT if an existing user already has all or part of the unique user's data.
     """
     with current_app.app_context():
+        if not token_has_role(token_info, Role.DISCUSSION):
+            return (
+                'Current user has not enough privileges to comment an answer',
+                HTTPStatus.FORBIDDEN.value
+            )
         try:
             comment = CommentsServices.comment(
                 body['discussionid'], id, body['content'], current_app.db
@@ -62,23 +69,25 @@ def list_all_for_discussion(id: int) -> Tuple[Union[List[Dict], str], Optional[i
     return (comments, HTTPStatus.OK.value)
 
 
-def list_all_for_answer(id: int) -> Tuple[Union[List[Dict], str], Optional[int]]:
-    """Lists the comments of an answer if the requestor has the discussion role.
+def list_all_for_answer(id: int, limit: int = 50, after: Optional[int] = None) \
+        -> Tuple[Union[Dict, str], Optional[int]]:
+    """Lists a page of the comments of an answer if the requestor has the discussion role.
 
     Args:
-        - answerId (int): Answer id.
-        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+        - id (int): Answer id.
+        - limit (int): The maximum number of comments in the page.
+        - after (Optional[int]): The cursor returned with the previous page, if any.
 
     Returns:
-        - Tuple[Union[List[Dict], str], Optional[int]]: On success,
-          a tuple with the dictionary of the new discussion data
+        - Tuple[Union[Dict, str], Optional[int]]: On success,
+          a tuple with a dictionary holding the comments' data and the next page cursor,
           and a code 200 OK. On error, a description message and code:
-            - 400 BAD REQUEST when a mandatory argument is missing.
+            - 400 BAD REQUEST when a mandatory argument is missing or the limit is not valid.
     """
     with current_app.app_context():
         try:
-            comments: List[Dict] = CommentsServices.list_all_for_answer(
-                id, current_app.db
+            comments: Dict = CommentsServices.list_all_for_answer(
+                id, current_app.db, limit, after
             )
         except ValueError:
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
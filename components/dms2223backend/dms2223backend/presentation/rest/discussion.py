@@ -1,26 +1,41 @@
 """ REST API controllers responsible of handling the discussion operations.
 """
 
-from typing import Tuple, Union, Optional, List, Dict
+from typing import Tuple, Union, Optional, Dict
 from http import HTTPStatus
 from flask import current_app
+from dms2223common.data import Role
+from dms2223common.presentation.security import token_has_role
+from dms2223backend.data.db.exc import DiscussionNotFoundError
 from dms2223backend.logic.exc.operationerror import OperationError
 from dms2223backend.service import DiscussionsServices
 
 
-def list_discussions() -> Tuple[List[Dict], Optional[int]]:
-    """Lists the existing discussions.
+def list_discussions(limit: int = 50, after: Optional[int] = None) \
+        -> Tuple[Union[Dict, str], Optional[int]]:
+    """Lists a page of the existing discussions.
+
+    Args:
+        - limit (int): The maximum number of discussions in the page.
+        - after (Optional[int]): The cursor returned with the previous page, if any.
 
     Returns:
-        - Tuple[List[Dict], Optional[int]]: A tuple with a list
-          of dictionaries for the discussions' data and a code 200 OK.
+        - Tuple[Union[Dict, str], Optional[int]]: On success, a tuple with a dictionary holding
+          the discussions' data and the next page cursor, and a code 200 OK. On error, a
+          description message and code:
+            - 400 BAD REQUEST when the page limit is not valid.
     """
     with current_app.app_context():
-        discussions: List[Dict] = DiscussionsServices.list_discussions(current_app.db)
+        try:
+            discussions: Dict = DiscussionsServices.list_discussions(
+                current_app.db, limit, after
+            )
+        except ValueError:
+            return ('The page limit must be a positive number', HTTPStatus.BAD_REQUEST.value)
     return (discussions, HTTPStatus.OK.value)
 
 
-def create_discussion(body: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
+def create_discussion(body: Dict, token_info: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
     """Creates a discussion if the requestor has the discussion role.
 
     Args:
@@ -35,6 +50,11 @@ def create_discussion(body: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
             - 409 CONFLICT if an existing user already has all or part of the unique user's data.
     """
     with current_app.app_context():
+        if not token_has_role(token_info, Role.DISCUSSION):
+            return (
+                'Current user has not enough privileges to create a discussion',
+                HTTPStatus.FORBIDDEN.value
+            )
         try:
             discussion: Dict = DiscussionsServices.create_discussion(
                 body['title'], body['content'], current_app.db
@@ -66,3 +86,32 @@ def get_discussion_by_id(id: int) -> Tuple[Union[Dict, str], Optional[int]]:
         except ValueError:
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
     return (discussion, HTTPStatus.OK.value)
+
+
+def get_thread(id: int, limit: int = 50, after: Optional[int] = None,
+               comments_limit: int = 10) -> Tuple[Union[Dict, str], Optional[int]]:
+    """Gets a discussion with a page of its answers and their first comments.
+
+    Args:
+        - id (int): Id for discussion.
+        - limit (int): The maximum number of answers in the page.
+        - after (Optional[int]): The answers cursor returned with the previous page, if any.
+        - comments_limit (int): The maximum number of comments of each answer.
+
+    Returns:
+        - Tuple[Union[Dict, str], Optional[int]]: On success, a tuple with the dictionary of the
+          discussion thread and a code 200 OK. On error, a description message and code:
+            - 400 BAD REQUEST when a mandatory argument is missing or the limit is not valid.
+            - 404 NOT FOUND when the discussion does not exist.
+    """
+    with current_app.app_context():
+        try:
+            thread: Dict = DiscussionsServices.get_thread(
+                id, current_app.db, limit, after, comments_limit  # type: ignore
+            )
+        except ValueError:
+            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
+        except DiscussionNotFoundError:
+            return ('The discussion with id ' + str(id) + ' does not exist',
+                    HTTPStatus.NOT_FOUND.value)
+    return (thread, HTTPStatus.OK.value)
@@ -4,77 +4,82 @@
 from typing import Tuple, Union, Optional, List, Dict
 from http import HTTPStatus
 from flask import current_app
+from dms2223common.data import Role
+from dms2223common.presentation.security import token_has_role
 from dms2223backend.logic.exc.operationerror import OperationError
 from dms2223backend.service import ReportsServices
 
 
-def list_reports() -> Tuple[List[Dict], Optional[int]]:
+def list_reports(token_info: Dict) -> Tuple[Union[List[Dict], str], Optional[int]]:
     """Lists the existing reports.
 
+    Args:
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
     Returns:
-        - Tuple[List[Dict], Optional[int]]: A tuple with a list of
-            dictionaries for the reports' data and a code 200 OK.
+        - Tuple[Union[List[Dict], str], Optional[int]]: A tuple with a list of
+            dictionaries for the reports' data and a code 200 OK. On error, a description
+            message and code:
+            - 403 FORBIDDEN when the requestor does not have the moderation role.
     """
     with current_app.app_context():
+        if not token_has_role(token_info, Role.MODERATION):
+            return (
+                'Current user has not enough privileges to list the reports',
+                HTTPStatus.FORBIDDEN.value
+            )
         reports: List[Dict] = ReportsServices.list_reports(current_app.db)
     return (reports, HTTPStatus.OK.value)
 
 
-def list_reports_answer() -> Tuple[List[Dict], Optional[int]]:
+def list_reports_answer(token_info: Dict) -> Tuple[Union[List[Dict], str], Optional[int]]:
     """Lists the existing reports.
 
+    Args:
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
     Returns:
-        - Tuple[List[Dict], Optional[int]]: A tuple with a list of
-            dictionaries for the reports' data and a code 200 OK.
+        - Tuple[Union[List[Dict], str], Optional[int]]: A tuple with a list of
+            dictionaries for the reports' data and a code 200 OK. On error, a description
+            message and code:
+            - 403 FORBIDDEN when the requestor does not have the moderation role.
     """
     with current_app.app_context():
+        if not token_has_role(token_info, Role.MODERATION):
+            return (
+                'Current user has not enough privileges to list the reports',
+                HTTPStatus.FORBIDDEN.value
+            )
         reports: List[Dict] = ReportsServices.list_reports_answer(
             current_app.db)
     return (reports, HTTPStatus.OK.value)
 
 
-def list_reports_comments() -> Tuple[List[Dict], Optional[int]]:
+def list_reports_comments(token_info: Dict) -> Tuple[Union[List[Dict], str], Optional[int]]:
     """Lists the existing reports.
 
-    Returns:
-        - Tuple[List[Dict], Optional[int]]: A tuple with a list of
-            dictionaries for the reports' data and a code 200 OK.
-    """
-    with current_app.app_context():
-        reports: List[Dict] = ReportsServices.list_reports_comments(
-            current_app.db)
-    return (reports, HTTPStatus.OK.value)
-
-
-def create_report(body: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
-    """Creates a report if the requestor has the report role.
-
     Args:
-        - body (Dict): A dictionary with the new report's data.
         - token_info (Dict): A dictionary of information provided by the security schema handlers.
 
     Returns:
-        - Tuple[Union[Dict, str], Optional[int]]: On success, a tuple with the dictionary of the
-          new user data and a code 201 CREATED. On error, a description message and code:
-            - 400 BAD REQUEST when a mandatory argument is missing.
-            - 403 FORBIDDEN when the requestor does not have the rights to create the report.
-            - 409 CONFLICT if an existing user already has all or part of the unique user's data.
+        - Tuple[Union[List[Dict], str], Optional[int]]: A tuple with a list of
+            dictionaries for the reports' data and a code 200 OK. On error, a description
+            message and code:
+            - 403 FORBIDDEN when the requestor does not have the moderation role.
     """
     with current_app.app_context():
-        try:
-
-            report: Dict = ReportsServices.create_report(
-                body['tiporeport'], body['title'], body['content'], current_app.db
+        if not token_has_role(token_info, Role.MODERATION):
+            return (
+                'Current user has not enough privileges to list the reports',
+                HTTPStatus.FORBIDDEN.value
             )
-        except ValueError:
-            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
-        except OperationError:
-            return ('The user with the given username can not create a report',
-                    HTTPStatus.FORBIDDEN.value)
-    return (report, HTTPStatus.OK.value)
+        reports: List[Dict] = ReportsServices.list_reports_comments(
+            current_app.db)
+    return (reports, HTTPStatus.OK.value)
 
 
-def create_comment_report(body: Dict, id: int) -> Tuple[Union[Dict, str], Optional[int]]:
+def create_comment_report(body: Dict, id: int, token_info: Dict) \
+        -> Tuple[Union[Dict, str], Optional[int]]:
     """Creates a report if the requestor has the report role.
 
     Args:
@@ -89,6 +94,11 @@ def create_comment_report(body: Dict, id: int) -> Tuple[Union[Dict, str], Option
             - 409 CONFLICT if an existing user already has all or part of the unique user's data.
     """
     with current_app.app_context():
+        if not token_has_role(token_info, Role.DISCUSSION):
+            return (
+                'Current user has not enough privileges to report a comment',
+                HTTPStatus.FORBIDDEN.value
+            )
         try:
             report: Dict = ReportsServices.create_report_comment(
                 id, body['reason'], current_app.db
@@ -101,7 +111,8 @@ def create_comment_report(body: Dict, id: int) -> Tuple[Union[Dict, str], Option
     return (report, HTTPStatus.OK.value)
 
 
-def create_answer_report(body: Dict, id: int) -> Tuple[Union[Dict, str], Optional[int]]:
+def create_answer_report(body: Dict, id: int, token_info: Dict) \
+        -> Tuple[Union[Dict, str], Optional[int]]:
     """Creates a report if the requestor has the report role.
 
     Args:
@@ -116,6 +127,11 @@ def create_answer_report(body: Dict, id: int) -> Tuple[Union[Dict, str], Optiona
             - 409 CONFLICT if an existing user already has all or part of the unique user's data.
     """
     with current_app.app_context():
+        if not token_has_role(token_info, Role.DISCUSSION):
+            return (
+                'Current user has not enough privileges to report an answer',
+                HTTPStatus.FORBIDDEN.value
+            )
         try:
             report: Dict = ReportsServices.create_report_answer(
                 id, body['reason'], current_app.db
@@ -128,11 +144,13 @@ def create_answer_report(body: Dict, id: int) -> Tuple[Union[Dict, str], Optiona
     return (report, HTTPStatus.OK.value)
 
 
-def create_report(body: Dict, id: int) -> Tuple[Union[Dict, str], Optional[int]]:
+def create_report(body: Dict, id: int, token_info: Dict) \
+        -> Tuple[Union[Dict, str], Optional[int]]:
     """Creates a report if the requestor has the report role.
 
     Args:
         - body (Dict): A dictionary with the new report's data.
+        - id (int): Id for the reported discussion.
         - token_info (Dict): A dictionary of information provided by the security schema handlers.
 
     Returns:
@@ -143,6 +161,11 @@ def create_report(body: Dict, id: int) -> Tuple[Union[Dict, str], Optional[int]]
             - 409 CONFLICT if an existing user already has all or part of the unique user's data.
     """
     with current_app.app_context():
+        if not token_has_role(token_info, Role.DISCUSSION):
+            return (
+                'Current user has not enough privileges to report a discussion',
+                HTTPStatus.FORBIDDEN.value
+            )
         try:
             report: Dict = ReportsServices.create_report(
                 id, body['reason'], current_app.db
@@ -1,11 +1,17 @@
 """ REST API controllers responsible of handling the security schemas.
 """
 
-from typing import Dict
+import json
+import time
+from typing import Dict, Optional
 from flask import current_app
 import requests
+from authlib.jose import JsonWebSignature  # type: ignore
 from connexion.exceptions import Unauthorized  # type: ignore
+from dms2223common.data.cache import TokenVersions
+from dms2223common.data.rest import ResponseData
 from dms2223backend.data.config import BackendConfiguration
+from dms2223backend.data.rest import AuthService
 
 
 def verify_api_key(token: str) -> Dict:
@@ -27,34 +33,105 @@ def verify_api_key(token: str) -> Dict:
     return {}
 
 
-def verify_token(token: str) -> bool:
+def verify_token(token: str) -> Dict:
     """Callback testing a JWS user token.
 
+    The token is verified with the shared JWS secret, exactly as the authentication service
+    does, unless the configured token verification mode asks that service instead. The user
+    roles are taken from the token claims, so no role lookups are needed either. Tokens
+    issued before the roles of their user last changed (see `TokenVersions`) are rejected,
+    so the frontend refreshes them.
+
     Args:
         - token (str): The JWS user token received.
 
     Raises:
-        - Unauthorized: When the token is incorrect.
+        - Unauthorized: When the token is incorrect or outdated.
 
     Returns:
-        - Dict: A dictionary with the user name (key `user`) if the credentials are correct.
+        - Dict: A dictionary with the user name (key `user`) and role names (key `roles`) if
+          the credentials are correct.
     """
 
     with current_app.app_context():
-        cfg = current_app.cfg.get_auth_service()
-        base_url = f"http://{cfg['host']}:{cfg['port']}/api/v1"
-        current_app.logger.warn(base_url)
-        current_app.logger.warn(token)
-        response: requests.Response = requests.get(
-            base_url + '/auth',
-            headers={
-                'Authorization': f'Bearer {token}',
-                'X-ApiKey-Auth': cfg['apikey_secret']
-            },
-            timeout=60
-        )
-
-        if not response.ok:
+        cfg: BackendConfiguration = current_app.cfg
+        mode: str = cfg.get_token_verification()
+        if mode == 'remote':
+            return _verify_token_remotely(token)
+        jws: JsonWebSignature = current_app.jws
+        try:
+            data: Dict = jws.deserialize_compact(
+                token.encode('ascii'),
+                bytes(cfg.get_jws_secret(), 'UTF-8')
+            )
+            payload: Dict = json.loads(data['payload'].decode('UTF-8'))
+        except Exception as ex:
+            if mode == 'local_with_fallback':
+                current_app.logger.debug('Local token verification failed; asking the auth service')
+                return _verify_token_remotely(token)
+            raise Unauthorized from ex
+        expiration: Optional[float] = payload.get('exp')
+        if 'user' not in payload or not isinstance(expiration, (int, float)):
             raise Unauthorized('Invalid token')
+        if time.time() > expiration:
+            raise Unauthorized('Expired token')
+        if TokenVersions.is_outdated(payload, lambda: _current_token_version(token)):
+            raise Unauthorized('Outdated token')
+        return {
+            'sub': payload['sub'],
+            'user': payload['user'],
+            'exp': expiration,
+            'roles': payload.get('roles', [])
+        }
+
+
+def _current_token_version(token: str) -> int:
+    """Asks the authentication service for the current token version of a token user.
+
+    Args:
+        - token (str): The JWS user token received.
+
+    Raises:
+        - Unauthorized: When the token is rejected or the service cannot be reached.
+
+    Returns:
+        - int: The current token version of the user.
+    """
+    auth_service: AuthService = current_app.authservice
+    try:
+        response: ResponseData = auth_service.get_token_owner(token)
+    except requests.RequestException as ex:
+        raise Unauthorized('The authentication service is unavailable') from ex
+    if not response.is_successful():
+        raise Unauthorized('Invalid token')
+    return int(response.get_content().get('ver') or 0)
+
+
+def _verify_token_remotely(token: str) -> Dict:
+    """Tests a JWS user token against the authentication service.
 
-    return True
+    The service answers with the current user roles, so role changes apply immediately.
+
+    Args:
+        - token (str): The JWS user token received.
+
+    Raises:
+        - Unauthorized: When the token is incorrect or the service cannot be reached.
+
+    Returns:
+        - Dict: A dictionary with the user name (key `user`) and role names (key `roles`) if
+          the credentials are correct.
+    """
+    auth_service: AuthService = current_app.authservice
+    try:
+        response: ResponseData = auth_service.get_token_owner(token)
+    except requests.RequestException as ex:
+        raise Unauthorized('The authentication service is unavailable') from ex
+    if not response.is_successful():
+        raise Unauthorized('Invalid token')
+    owner: Dict = response.get_content()
+    return {
+        'sub': owner['username'],
+        'user': owner['username'],
+        'roles': owner.get('roles', [])
+    }
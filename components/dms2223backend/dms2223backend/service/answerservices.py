@@ -1,11 +1,12 @@
 """ AnswerServices class module.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223backend.data.db import Schema
 from dms2223backend.data.db.results import Answer
 from dms2223backend.logic import AnswerLogic
+from dms2223backend.service.discussionservices import DiscussionsServices
 
 
 class AnswersServices():
@@ -39,31 +40,44 @@ class AnswersServices():
             raise ex
         finally:
             schema.remove_session()
+        DiscussionsServices.invalidate_listings()
         return out
 
     @staticmethod
-    def list_all_for_discussion(discussionid: int, schema: Schema) -> List[Dict]:
-        """Lists the answers of a discussion if the requestor has the discussion role.
+    def list_all_for_discussion(discussionid: int, schema: Schema,
+                                limit: int = 50, after: Optional[int] = None) -> Dict:
+        """Lists a page of the answers of a discussion.
 
         Args:
             - disucssionId (int): Discussion id.
             - schema (Schema): A database handler where the discussions are mapped into.
+            - limit (int): The maximum number of answers in the page.
+            - after (Optional[int]): The cursor returned with the previous page, if any.
+
+        Raises:
+            - ValueError: If the discussion id is missing or the limit is not valid.
 
         Returns:
-            - List[Dict]: List of dictionaries with the answers' data.
+            - Dict: A dictionary with the list of the answers' data (key `answers`) and the
+              cursor of the next page (key `next_cursor`, `None` on the last page).
         """
         out: List[Dict] = []
         session: Session = schema.new_session()
-        answers: List[Answer] = AnswerLogic.list_all_for_discussion(
-            discussionid, session)
-        for answer in answers:
-            out.append({
-                'id': answer.id,  # type: ignore
-                'discussionid': answer.discussionid,
-                'content': answer.content
-            })
-        schema.remove_session()
-        return out
+        try:
+            answers, next_cursor = AnswerLogic.list_page_for_discussion(
+                discussionid, session, limit, after)
+            for answer in answers:
+                out.append({
+                    'id': answer.id,  # type: ignore
+                    'discussionid': answer.discussionid,
+                    'content': answer.content
+                })
+        finally:
+            schema.remove_session()
+        return {
+            'answers': out,
+            'next_cursor': next_cursor
+        }
 
     @staticmethod
     def get_answer(discussionid: int, schema: Schema) -> Dict:
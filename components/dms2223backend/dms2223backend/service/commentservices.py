@@ -1,11 +1,12 @@
 """ CommentServices class module.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223backend.data.db import Schema
 from dms2223backend.data.db.results import Comment
 from dms2223backend.logic import CommentLogic
+from dms2223backend.service.discussionservices import DiscussionsServices
 
 
 class CommentsServices():
@@ -39,6 +40,7 @@ class CommentsServices():
             raise ex
         finally:
             schema.remove_session()
+        DiscussionsServices.invalidate_listings()
         return out
 
     @staticmethod
@@ -67,29 +69,41 @@ class CommentsServices():
         return out
 
     @staticmethod
-    def list_all_for_answer(answerid: int, schema: Schema) -> List[Dict]:
-        """Lists the comments of a discussion if the requestor has the discussion role.
+    def list_all_for_answer(answerid: int, schema: Schema,
+                            limit: int = 50, after: Optional[int] = None) -> Dict:
+        """Lists a page of the comments of an answer.
 
         Args:
-            - disucssionId (int): Discussion id.
+            - answerid (int): Answer id.
             - schema (Schema): A database handler where the discussions are mapped into.
+            - limit (int): The maximum number of comments in the page.
+            - after (Optional[int]): The cursor returned with the previous page, if any.
+
+        Raises:
+            - ValueError: If the answer id is missing or the limit is not valid.
 
         Returns:
-            - List[Dict]: List of dictionaries with the comments' data.
+            - Dict: A dictionary with the list of the comments' data (key `comments`) and the
+              cursor of the next page (key `next_cursor`, `None` on the last page).
         """
         out: List[Dict] = []
         session: Session = schema.new_session()
-        comments: List[Comment] = CommentLogic.list_all_for_answer(
-            answerid, session)
-        for comment in comments:
-            out.append({
-                'id': comment.id,  # type: ignore
-                'discussionid': comment.discussionid,
-                'answerid': comment.answerid,
-                'content': comment.content
-            })
-        schema.remove_session()
-        return out
+        try:
+            comments, next_cursor = CommentLogic.list_page_for_answer(
+                answerid, session, limit, after)
+            for comment in comments:
+                out.append({
+                    'id': comment.id,  # type: ignore
+                    'discussionid': comment.discussionid,
+                    'answerid': comment.answerid,
+                    'content': comment.content
+                })
+        finally:
+            schema.remove_session()
+        return {
+            'comments': out,
+            'next_cursor': next_cursor
+        }
 
     @staticmethod
     def get_comment(discussionid: int, answerid: int, schema: Schema) -> Dict:
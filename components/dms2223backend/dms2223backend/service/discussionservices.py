@@ -1,8 +1,9 @@
 """ DiscussionServices class module.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from sqlalchemy.orm.session import Session  # type: ignore
+from dms2223common.data.cache import ReadThroughCache
 from dms2223backend.data.db import Schema
 from dms2223backend.data.db.results import Discussion
 from dms2223backend.logic import DiscussionLogic
@@ -11,6 +12,36 @@ from dms2223backend.logic import DiscussionLogic
 class DiscussionsServices():
     """ Monostate class that provides high-level services to handle user-related use cases.
     """
+
+    # Listing pages are the hottest read; writes that change them invalidate the cache
+    __listing_cache: ReadThroughCache = ReadThroughCache()
+
+    @staticmethod
+    def configure_listing_cache(ttl: float, max_entries: int) -> None:
+        """Sets the bounds of the discussion listings cache.
+
+        Args:
+            - ttl (float): Seconds each listing page is kept. Zero disables the cache.
+            - max_entries (int): Maximum number of listing pages kept.
+        """
+        DiscussionsServices.__listing_cache.configure(ttl, max_entries)
+
+    @staticmethod
+    def invalidate_listings() -> None:
+        """Drops the cached discussion listings. Must be called after any write that
+        changes the listed data (discussions, `answered` flags or counters).
+        """
+        DiscussionsServices.__listing_cache.invalidate()
+
+    @staticmethod
+    def get_listing_cache_stats() -> Dict[str, int]:
+        """Gets the hit and miss counters of the discussion listings cache.
+
+        Returns:
+            - Dict[str, int]: The number of hits (`hits`), misses (`misses`) and pages
+              currently cached (`entries`).
+        """
+        return DiscussionsServices.__listing_cache.get_stats()
     @staticmethod
     def get_discussion_by_id(id: int, schema: Schema) -> Dict:
         """Determines whether a user with the given credentials exists.
@@ -46,28 +77,118 @@ class DiscussionsServices():
         return salida
 
     @staticmethod
-    def list_discussions(schema: Schema) -> List[Dict]:
-        """Lists the existing discussions.
+    def list_discussions(schema: Schema, limit: int = 50, after: Optional[int] = None) -> Dict:
+        """Lists a page of the existing discussions.
+
+        Pages are served from the listing cache; the returned dictionary is shared and
+        must not be modified.
+
+        Args:
+            - schema (Schema): A database handler where the discussions are mapped into.
+            - limit (int): The maximum number of discussions in the page.
+            - after (Optional[int]): The cursor returned with the previous page, if any.
+
+        Raises:
+            - ValueError: If the limit is not a positive number.
+
+        Returns:
+            - Dict: A dictionary with the list of the discussions' data (key `discussions`)
+              and the cursor of the next page (key `next_cursor`, `None` on the last page).
+        """
+        return DiscussionsServices.__listing_cache.get(
+            (id(schema), limit, after),
+            lambda: DiscussionsServices.__load_page(schema, limit, after))
+
+    @staticmethod
+    def __load_page(schema: Schema, limit: int, after: Optional[int]) -> Dict:
+        """Loads a page of the existing discussions from the database.
 
         Args:
             - schema (Schema): A database handler where the discussions are mapped into.
+            - limit (int): The maximum number of discussions in the page.
+            - after (Optional[int]): The cursor returned with the previous page, if any.
+
+        Raises:
+            - ValueError: If the limit is not a positive number.
 
         Returns:
-            - List[Dict]: A list of dictionaries with the discussions' data.
+            - Dict: A dictionary with the list of the discussions' data (key `discussions`)
+              and the cursor of the next page (key `next_cursor`, `None` on the last page).
         """
         out: List[Dict] = []
         session: Session = schema.new_session()
-        discussions: List[List] = DiscussionLogic.list_all(session)
-        for discuss in discussions:
-            discussion: Discussion = discuss[0]
-            answered: int = discuss[1]
-            out.append({
-                'id': discussion.id,#type: ignore
+        try:
+            discussions, next_cursor = DiscussionLogic.list_page(session, limit, after)
+            for discuss in discussions:
+                discussion: Discussion = discuss[0]
+                answered: int = discuss[1]
+                out.append({
+                    'id': discussion.id,#type: ignore
+                    'title': discussion.title,
+                    'content': discussion.content,
+                    'answered': answered,
+                    'answers': discuss[2],
+                    'comments': discuss[3]
+                })
+        finally:
+            schema.remove_session()
+        return {
+            'discussions': out,
+            'next_cursor': next_cursor
+        }
+
+    @staticmethod
+    def get_thread(id: int, schema: Schema, limit: int = 50, after: Optional[int] = None,
+                   comments_limit: int = 10) -> Dict:
+        """Gets a discussion with a page of its answers, each with its first comments.
+
+        Args:
+            - id (int): Discussion id.
+            - schema (Schema): A database handler where the discussions are mapped into.
+            - limit (int): The maximum number of answers in the page.
+            - after (Optional[int]): The answers cursor returned with the previous page, if any.
+            - comments_limit (int): The maximum number of comments of each answer. The rest
+              are listed by pages of the answer comments.
+
+        Raises:
+            - ValueError: If the id is missing or a limit is not a positive number.
+            - DiscussionNotFoundError: If the discussion does not exist.
+
+        Returns:
+            - Dict: A dictionary with the discussion's data, the list of answers' data (key
+              `answers`, each one with its first comments' data under `comments` and the
+              cursor of its next comments page under `comments_next_cursor`) and the cursor
+              of the next answers page (key `next_cursor`, `None` on the last page).
+        """
+        # pylint: disable=too-many-arguments
+        session: Session = schema.new_session()
+        try:
+            discussion, answered, answers, next_cursor, comments = DiscussionLogic.get_thread(
+                session, id, limit, after, comments_limit)
+            out: Dict = {
+                'id': discussion.id,  # type: ignore
                 'title': discussion.title,
                 'content': discussion.content,
-                'answered': answered
-            })
-        schema.remove_session()
+                'answered': answered,
+                'answers': [],
+                'next_cursor': next_cursor
+            }
+            for answer in answers:
+                answer_comments, comments_next_cursor = comments[answer.id]  # type: ignore
+                out['answers'].append({
+                    'id': answer.id,  # type: ignore
+                    'discussionid': answer.discussionid,
+                    'content': answer.content,
+                    'comments': [{
+                        'id': comment.id,  # type: ignore
+                        'discussionid': comment.discussionid,
+                        'answerid': comment.answerid,
+                        'content': comment.content
+                    } for comment in answer_comments],
+                    'comments_next_cursor': comments_next_cursor
+                })
+        finally:
+            schema.remove_session()
         return out
 
     @staticmethod
@@ -95,4 +216,5 @@ class DiscussionsServices():
             raise ex
         finally:
             schema.remove_session()
+        DiscussionsServices.invalidate_listings()
         return out
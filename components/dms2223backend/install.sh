@@ -11,4 +11,4 @@ popd
 rm -R "${TEMP_DIR}"
 
 #Create test discussions 
-dms2223backend-create-discussions
+dms2223backend-import seed/discussions.ndjson
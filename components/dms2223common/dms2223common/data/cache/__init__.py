@@ -0,0 +1,5 @@
+""" In-process caches shared by the services.
+"""
+
+from .readthroughcache import ReadThroughCache
+from .tokenversions import TokenVersions
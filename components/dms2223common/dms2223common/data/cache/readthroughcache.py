@@ -0,0 +1,144 @@
+""" ReadThroughCache class module.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class ReadThroughCache():
+    """ In-process read-through cache with a time to live and a maximum number of entries.
+
+    Concurrent misses of the same key are serialized, so only one of them runs the loader
+    while the rest wait for its result (cache stampede guard).
+    """
+
+    __MISSING = object()
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 1024):
+        """ Constructor method.
+
+        Args:
+            - ttl (float): Seconds an entry is kept. Zero or less disables the cache.
+            - max_entries (int): Maximum number of entries kept; the least recently used
+              are evicted first.
+        """
+        self.__lock: Lock = Lock()
+        self.__entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self.__loading: Dict[Hashable, Lock] = {}
+        self.__generation: int = 0
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__ttl: float = ttl
+        self.__max_entries: int = max_entries
+
+    def configure(self, ttl: float, max_entries: int) -> None:
+        """ Changes the cache bounds, dropping the cached entries.
+
+        Args:
+            - ttl (float): Seconds an entry is kept. Zero or less disables the cache.
+            - max_entries (int): Maximum number of entries kept.
+        """
+        with self.__lock:
+            self.__ttl = ttl
+            self.__max_entries = max_entries
+        self.invalidate()
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """ Gets a value, loading and storing it if it is not cached.
+
+        Values are shared among callers, so they must not be modified.
+
+        Args:
+            - key (Hashable): The key of the value.
+            - loader (Callable[[], Any]): The function that loads the value on a miss.
+              Exceptions raised by it are propagated and nothing is cached.
+
+        Returns:
+            - Any: The value.
+        """
+        with self.__lock:
+            value: Any = self.__lookup(key)
+            if value is not self.__MISSING:
+                self.__hits += 1
+                return value
+            key_lock: Lock = self.__loading.setdefault(key, Lock())
+        with key_lock:
+            with self.__lock:
+                value = self.__lookup(key)
+                if value is not self.__MISSING:
+                    self.__hits += 1
+                    return value
+                self.__misses += 1
+                generation: int = self.__generation
+            try:
+                value = loader()
+                with self.__lock:
+                    # Values loaded before an invalidation may already be stale
+                    if generation == self.__generation and self.__ttl > 0:
+                        self.__store(key, value)
+            finally:
+                with self.__lock:
+                    self.__loading.pop(key, None)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """ Drops a cached entry, or all of them.
+
+        Args:
+            - key (Optional[Hashable]): The key whose value changed. If not given, every
+              entry is dropped.
+        """
+        with self.__lock:
+            if key is None:
+                self.__entries.clear()
+            else:
+                self.__entries.pop(key, None)
+            self.__generation += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """ Gets the cache counters.
+
+        Returns:
+            - Dict[str, int]: The number of hits (`hits`), misses (`misses`) and entries
+              currently cached (`entries`).
+        """
+        with self.__lock:
+            return {
+                'hits': self.__hits,
+                'misses': self.__misses,
+                'entries': len(self.__entries),
+            }
+
+    def __lookup(self, key: Hashable) -> Any:
+        """ Looks up a live entry. Must be called holding the cache lock.
+
+        Args:
+            - key (Hashable): The key of the value.
+
+        Returns:
+            - Any: The value, or the missing sentinel if it is not cached or has expired.
+        """
+        entry = self.__entries.get(key)
+        if entry is None:
+            return self.__MISSING
+        expires, value = entry
+        if time.monotonic() >= expires:
+            del self.__entries[key]
+            return self.__MISSING
+        self.__entries.move_to_end(key)
+        return value
+
+    def __store(self, key: Hashable, value: Any) -> None:
+        """ Stores an entry, evicting the least recently used ones if needed. Must be
+        called holding the cache lock.
+
+        Args:
+            - key (Hashable): The key of the value.
+            - value (Any): The value.
+        """
+        self.__entries[key] = (time.monotonic() + self.__ttl, value)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > max(0, self.__max_entries):
+            self.__entries.popitem(last=False)
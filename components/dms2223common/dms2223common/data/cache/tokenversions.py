@@ -0,0 +1,55 @@
+""" TokenVersions class module.
+"""
+
+from typing import Callable, Dict
+from .readthroughcache import ReadThroughCache
+
+
+class TokenVersions():
+    """ Monostate class responsible of telling the outdated user tokens.
+
+    The authentication service bumps the token version of a user (claim `ver`) every time
+    the user roles change, so a token with an older version embeds outdated roles. The
+    current version of each user is kept for a short time to live, which bounds both the
+    requests to the authentication service and how long a revoked role keeps working.
+    """
+
+    __versions: ReadThroughCache = ReadThroughCache(30.0, 4096)
+
+    @staticmethod
+    def configure(ttl: float, max_entries: int = 4096) -> None:
+        """ Sets the bounds of the token versions cache.
+
+        Args:
+            - ttl (float): Seconds the current token version of a user is kept. Zero asks
+              for it on every check.
+            - max_entries (int): Maximum number of users whose token version is kept.
+        """
+        TokenVersions.__versions.configure(ttl, max_entries)
+
+    @staticmethod
+    def get_stats() -> Dict[str, int]:
+        """ Gets the token versions cache counters.
+
+        Returns:
+            - Dict[str, int]: The number of hits (`hits`), misses (`misses`) and users
+              currently cached (`entries`).
+        """
+        return TokenVersions.__versions.get_stats()
+
+    @staticmethod
+    def is_outdated(claims: Dict, loader: Callable[[], int]) -> bool:
+        """ Determines whether a token was issued before the roles of its user last changed.
+
+        Args:
+            - claims (Dict): The token claims, with the user name (key `user`) and the token
+              version (key `ver`). Tokens without a version are taken as version `0`.
+            - loader (Callable[[], int]): The function that gets the current token version of
+              the user when it is not cached. Exceptions raised by it are propagated.
+
+        Returns:
+            - bool: `True` if the token version is older than the current one of its user.
+              `False` otherwise.
+        """
+        current: int = TokenVersions.__versions.get(claims['user'], loader)
+        return int(claims.get('ver') or 0) < current
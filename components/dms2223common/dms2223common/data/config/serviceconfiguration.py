@@ -1,7 +1,8 @@
 """ ServiceConfiguration class module.
 """
 
-from typing import List, Dict
+import os
+from typing import List, Dict, Union
 from .configuration import Configuration
 
 
@@ -16,6 +17,42 @@ class ServiceConfiguration(Configuration):
         Configuration.__init__(self)
 
         self.set_authorized_api_keys([])
+        self.set_db_pool({
+            'pool_size': 5,
+            'max_overflow': 10,
+            'pool_timeout': 30,
+            'pool_recycle': 1800,
+            'pre_ping': True,
+            'statement_cache_size': 500
+        })
+        self.set_server({
+            'mode': 'development',
+            'workers': 4,
+            'threads': 4,
+            'backlog': 2048,
+            'worker_connections': 1000,
+            'timeout': 30,
+            'graceful_timeout': 30,
+            'max_requests': 0
+        })
+        self.set_metrics({
+            'enabled': False,
+            'path': '/metrics'
+        })
+        self.set_statement_log({
+            'mode': 'off',
+            'slow_threshold': 0.1,
+            'repeat_threshold': 5
+        })
+        self.set_profiling({
+            'enabled': False,
+            'header': 'X-ApiKey-Profile',
+            'sample_percent': 0.0,
+            'profiler': 'deterministic',
+            'sampling_interval': 0.005,
+            'directory': os.path.join(self.default_cache_dir(), 'profiles'),
+            'max_profiles': 1000
+        })
 
     def _set_values(self, values: Dict) -> None:
         """Sets/merges a collection of configuration values.
@@ -31,6 +68,16 @@ class ServiceConfiguration(Configuration):
             self.set_debug_flag(values['debug'])
         if 'authorized_api_keys' in values:
             self.set_authorized_api_keys(values['authorized_api_keys'])
+        if 'db_pool' in values:
+            self.set_db_pool({**self.get_db_pool(), **values['db_pool']})
+        if 'server' in values:
+            self.set_server({**self.get_server(), **values['server']})
+        if 'metrics' in values:
+            self.set_metrics({**self.get_metrics(), **values['metrics']})
+        if 'statement_log' in values:
+            self.set_statement_log({**self.get_statement_log(), **values['statement_log']})
+        if 'profiling' in values:
+            self.set_profiling({**self.get_profiling(), **values['profiling']})
 
     def set_service_host(self, service_host: str) -> None:
         """ Sets the service_host configuration value.
@@ -111,3 +158,208 @@ class ServiceConfiguration(Configuration):
         """
 
         return self._values['authorized_api_keys']
+
+    def set_db_pool(self, db_pool: Dict[str, Union[int, bool]]) -> None:
+        """ Sets the database connection pool and engine tuning parameters.
+
+        Args:
+            - db_pool: A dictionary with the following keys:
+                - pool_size (int): Connections kept open in the pool.
+                - max_overflow (int): Connections that can be opened above `pool_size`.
+                - pool_timeout (int): Seconds to wait for a connection before giving up.
+                - pool_recycle (int): Seconds after which a connection is replaced (-1: never).
+                - pre_ping (bool): Whether to test connections on checkout.
+                - statement_cache_size (int): Size of the compiled statements cache.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        out: Dict[str, Union[int, bool]] = {}
+        for key in ('pool_size', 'max_overflow', 'pool_timeout',
+                    'pool_recycle', 'statement_cache_size'):
+            if key not in db_pool:
+                raise ValueError('The db_pool parameter ' + key + ' is required.')
+            out[key] = int(db_pool[key])
+        if 'pre_ping' not in db_pool:
+            raise ValueError('The db_pool parameter pre_ping is required.')
+        out['pre_ping'] = bool(db_pool['pre_ping'])
+        self._values['db_pool'] = out
+
+    def get_db_pool(self) -> Dict[str, Union[int, bool]]:
+        """ Gets the database connection pool and engine tuning parameters.
+
+        Returns:
+            - Dict[str, Union[int, bool]]: A dictionary with the value of db_pool.
+        """
+
+        return self._values['db_pool']
+
+    def set_server(self, server: Dict[str, Union[str, int]]) -> None:
+        """ Sets the HTTP server configuration.
+
+        Args:
+            - server: A dictionary with the following keys:
+                - mode (str): `development` (single-process development server) or
+                  `production` (pre-forking multi-worker server).
+                - workers (int): Worker processes in production mode.
+                - threads (int): Request threads of each worker.
+                - backlog (int): Maximum number of connections waiting to be accepted.
+                - worker_connections (int): Maximum number of open connections per worker.
+                - timeout (int): Seconds a request can take before its worker is restarted.
+                - graceful_timeout (int): Seconds workers are given to finish their requests
+                  on shutdown.
+                - max_requests (int): Requests after which a worker is replaced (0: never).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if server.get('mode') not in ('development', 'production'):
+            raise ValueError('The server mode must be either development or production.')
+        out: Dict[str, Union[str, int]] = {'mode': str(server['mode'])}
+        for key in ('workers', 'threads', 'backlog', 'worker_connections',
+                    'timeout', 'graceful_timeout', 'max_requests'):
+            if key not in server:
+                raise ValueError('The server parameter ' + key + ' is required.')
+            value: int = int(server[key])
+            minimum: int = 0 if key == 'max_requests' else 1
+            if value < minimum:
+                raise ValueError('The server parameter ' + key + ' must be at least '
+                                 + str(minimum) + '.')
+            out[key] = value
+        self._values['server'] = out
+
+    def get_server(self) -> Dict[str, Union[str, int]]:
+        """ Gets the HTTP server configuration.
+
+        Returns:
+            - Dict[str, Union[str, int]]: A dictionary with the value of server.
+        """
+
+        return self._values['server']
+
+    def set_metrics(self, metrics: Dict[str, Union[str, bool]]) -> None:
+        """ Sets the metrics configuration.
+
+        Args:
+            - metrics: A dictionary with the following keys:
+                - enabled (bool): Whether the service gathers and exposes its metrics.
+                - path (str): The URL path where the metrics are exposed.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        for key in ('enabled', 'path'):
+            if key not in metrics:
+                raise ValueError('The metrics parameter ' + key + ' is required.')
+        if not str(metrics['path']).startswith('/'):
+            raise ValueError('The metrics path must start with a slash.')
+        self._values['metrics'] = {
+            'enabled': bool(metrics['enabled']),
+            'path': str(metrics['path'])
+        }
+
+    def get_metrics(self) -> Dict[str, Union[str, bool]]:
+        """ Gets the metrics configuration.
+
+        Returns:
+            - Dict[str, Union[str, bool]]: A dictionary with the value of metrics.
+        """
+
+        return self._values['metrics']
+
+    def set_statement_log(self, statement_log: Dict[str, Union[str, int, float]]) -> None:
+        """ Sets the SQL statement log configuration.
+
+        Args:
+            - statement_log: A dictionary with the following keys:
+                - mode (str): `off`, `log` (slow and repeated statements are logged) or
+                  `test` (repeated statements also fail the request).
+                - slow_threshold (float): Seconds from which a statement is logged as slow.
+                - repeat_threshold (int): Times a request can run the same statement before
+                  it is reported.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        for key in ('mode', 'slow_threshold', 'repeat_threshold'):
+            if key not in statement_log:
+                raise ValueError('The statement_log parameter ' + key + ' is required.')
+        if statement_log['mode'] not in ('off', 'log', 'test'):
+            raise ValueError('The statement_log mode must be off, log or test.')
+        slow_threshold: float = float(statement_log['slow_threshold'])
+        repeat_threshold: int = int(statement_log['repeat_threshold'])
+        if slow_threshold < 0 or repeat_threshold < 1:
+            raise ValueError(
+                'The statement_log slow_threshold must not be negative and the '
+                'repeat_threshold must be at least 1.')
+        self._values['statement_log'] = {
+            'mode': str(statement_log['mode']),
+            'slow_threshold': slow_threshold,
+            'repeat_threshold': repeat_threshold
+        }
+
+    def get_statement_log(self) -> Dict[str, Union[str, int, float]]:
+        """ Gets the SQL statement log configuration.
+
+        Returns:
+            - Dict[str, Union[str, int, float]]: A dictionary with the value of statement_log.
+        """
+
+        return self._values['statement_log']
+
+    def set_profiling(self, profiling: Dict[str, Union[str, int, float, bool]]) -> None:
+        """ Sets the on-demand request profiling configuration.
+
+        Args:
+            - profiling: A dictionary with the following keys:
+                - enabled (bool): Whether requests can be profiled.
+                - header (str): Request header that, carrying an authorized API key, asks
+                  for the request to be profiled.
+                - sample_percent (float): Percentage (0 to 100) of the requests profiled
+                  without asking.
+                - profiler (str): `deterministic` (every call, with `cProfile`) or
+                  `sampling` (the call stack every `sampling_interval` seconds).
+                - sampling_interval (float): Seconds between samples of the sampling
+                  profiler.
+                - directory (str): Directory where the profiles are written.
+                - max_profiles (int): Profiles kept in the directory; no more are written
+                  once it holds this many files.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        keys = ('enabled', 'header', 'sample_percent', 'profiler', 'sampling_interval',
+                'directory', 'max_profiles')
+        for key in keys:
+            if key not in profiling:
+                raise ValueError('The profiling parameter ' + key + ' is required.')
+        if profiling['profiler'] not in ('deterministic', 'sampling'):
+            raise ValueError('The profiling profiler must be deterministic or sampling.')
+        sample_percent: float = float(profiling['sample_percent'])
+        sampling_interval: float = float(profiling['sampling_interval'])
+        max_profiles: int = int(profiling['max_profiles'])
+        if not 0 <= sample_percent <= 100:
+            raise ValueError('The profiling sample_percent must be between 0 and 100.')
+        if sampling_interval <= 0 or max_profiles < 1:
+            raise ValueError(
+                'The profiling sampling_interval must be positive and the max_profiles '
+                'at least 1.')
+        self._values['profiling'] = {
+            'enabled': bool(profiling['enabled']),
+            'header': str(profiling['header']),
+            'sample_percent': sample_percent,
+            'profiler': str(profiling['profiler']),
+            'sampling_interval': sampling_interval,
+            'directory': str(profiling['directory']),
+            'max_profiles': max_profiles
+        }
+
+    def get_profiling(self) -> Dict[str, Union[str, int, float, bool]]:
+        """ Gets the on-demand request profiling configuration.
+
+        Returns:
+            - Dict[str, Union[str, int, float, bool]]: A dictionary with the value of
+              profiling.
+        """
+
+        return self._values['profiling']
@@ -0,0 +1,4 @@
+""" Database utilities shared by the services.
+"""
+
+from .schemamigrations import SchemaMigrations
@@ -0,0 +1,139 @@
+""" SchemaMigrations class module.
+"""
+
+import hashlib
+from typing import Any, Callable, List
+
+
+class SchemaMigrations():
+    """ Class responsible of upgrading existing databases to the current schema.
+
+    `create_all` only creates the tables that do not exist yet, so any change to a table
+    already deployed (e.g., a new column or index) needs a migration step. Steps are applied
+    once and in order; the number of steps applied is kept in the `schema_version` table,
+    together with a fingerprint of the table definitions, so that starting against an up to
+    date database needs no DDL at all.
+    """
+
+    def __init__(self, steps: List[Callable[[Any, Any], None]]):
+        """ Constructor method.
+
+        Args:
+            - steps (List[Callable[[Connection, MetaData], None]]): The migration step
+              functions of the service, in the order they must be applied. Each one receives
+              the connection where it is run and the metadata with the current table
+              definitions. New steps must always be appended at the end of the list.
+        """
+        # Imported here, so services without a database do not need SQLAlchemy
+        # pylint: disable=import-outside-toplevel
+        from sqlalchemy import Table, MetaData, Column, Integer, String  # type: ignore
+
+        self.__steps: List[Callable[[Any, Any], None]] = list(steps)
+        self.__metadata: Any = MetaData()
+        self.__version_table: Any = Table(
+            'schema_version',
+            self.__metadata,
+            Column('version', Integer, nullable=False),
+            Column('fingerprint', String(64), nullable=True)
+        )
+
+    def current_version(self) -> int:
+        """ Gets the schema version of the current table definitions.
+
+        Returns:
+            - int: The schema version.
+        """
+        return len(self.__steps)
+
+    def fingerprint(self, engine: Any, metadata: Any) -> str:
+        """ Computes a digest of the current table definitions and migration steps.
+
+        Args:
+            - engine (Engine): The database engine, whose dialect the DDL is compiled for.
+            - metadata (MetaData): The metadata with the current table definitions.
+
+        Returns:
+            - str: The hexadecimal digest.
+        """
+        # pylint: disable=import-outside-toplevel
+        from sqlalchemy.schema import CreateIndex, CreateTable  # type: ignore
+
+        digest = hashlib.sha256(str(self.current_version()).encode('ascii'))
+        for table in metadata.sorted_tables:
+            digest.update(str(CreateTable(table).compile(dialect=engine.dialect)).encode('UTF-8'))
+            for index in sorted(table.indexes, key=lambda index: index.name or ''):
+                digest.update(
+                    str(CreateIndex(index).compile(dialect=engine.dialect)).encode('UTF-8'))
+        return digest.hexdigest()
+
+    def is_current(self, engine: Any, metadata: Any) -> bool:
+        """ Determines whether the database was deployed with the current table definitions
+        and all the migration steps, so that neither `create_all` nor `upgrade` are needed.
+
+        A single query is run; any error (e.g., a new database) means it is not current.
+
+        Args:
+            - engine (Engine): The database engine.
+            - metadata (MetaData): The metadata with the current table definitions.
+
+        Returns:
+            - bool: `True` if the database schema is up to date. `False` otherwise.
+        """
+        # pylint: disable=import-outside-toplevel
+        from sqlalchemy import select  # type: ignore
+        from sqlalchemy.exc import SQLAlchemyError  # type: ignore
+
+        table: Any = self.__version_table
+        try:
+            with engine.connect() as connection:
+                row = connection.execute(select(table.c.version, table.c.fingerprint)).first()
+        except SQLAlchemyError:
+            return False
+        return row is not None and row.version == self.current_version() \
+            and row.fingerprint == self.fingerprint(engine, metadata)
+
+    def upgrade(self, engine: Any, metadata: Any) -> int:
+        """ Applies the migration steps still pending in the database.
+
+        All the pending steps are run in a single transaction.
+
+        Args:
+            - engine (Engine): The database engine.
+            - metadata (MetaData): The metadata with the current table definitions.
+
+        Returns:
+            - int: The schema version the database was at before the upgrade.
+        """
+        # pylint: disable=import-outside-toplevel
+        from sqlalchemy import select, insert, update  # type: ignore
+
+        table: Any = self.__version_table
+        with engine.begin() as connection:
+            self.__metadata.create_all(connection)
+            SchemaMigrations.__add_fingerprint_column(connection)
+            version = connection.execute(select(table.c.version)).scalar()
+            if version is None:
+                version = 0
+                connection.execute(insert(table).values(version=version))
+            for step in self.__steps[version:]:
+                step(connection, metadata)
+            connection.execute(update(table).values(
+                version=len(self.__steps), fingerprint=self.fingerprint(engine, metadata)))
+        return version
+
+    @staticmethod
+    def __add_fingerprint_column(connection: Any) -> None:
+        """ Adds the fingerprint column to `schema_version` tables created without it.
+
+        Args:
+            - connection (Connection): The connection where the column is added.
+        """
+        # pylint: disable=import-outside-toplevel
+        from sqlalchemy import inspect, text  # type: ignore
+
+        existing: List[str] = [
+            column['name'] for column in inspect(connection).get_columns('schema_version')
+        ]
+        if 'fingerprint' not in existing:
+            connection.execute(
+                text('ALTER TABLE schema_version ADD COLUMN fingerprint VARCHAR(64)'))
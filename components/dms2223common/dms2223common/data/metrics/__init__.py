@@ -0,0 +1,7 @@
+""" Classes gathering the metrics of the services.
+"""
+
+from .metricsregistry import MetricsRegistry
+from .poolmetrics import PoolMetrics
+from .statementmetrics import StatementMetrics
+from .statementlog import StatementLog
@@ -0,0 +1,4 @@
+""" Metrics-related exceptions.
+"""
+
+from .repeatedstatementerror import RepeatedStatementError
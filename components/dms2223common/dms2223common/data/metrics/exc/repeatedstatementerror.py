@@ -0,0 +1,7 @@
+""" RepeatedStatementError class module.
+"""
+
+
+class RepeatedStatementError(Exception):
+    """ Error raised when a request runs the same statement more times than allowed.
+    """
@@ -0,0 +1,225 @@
+""" MetricsRegistry class module.
+"""
+
+import bisect
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+LabelValues = Tuple[Tuple[str, str], ...]
+Stats = Dict[str, Union[int, float, str, bool, None]]
+
+
+class MetricsRegistry():
+    """ Class responsible of gathering the metrics of a service and rendering them in the
+    Prometheus text exposition format.
+
+    Counters and histograms are updated as the service runs, with a lock-protected
+    increment each. The statistics kept elsewhere (caches, connection pools, REST clients)
+    are only collected when the metrics are rendered, so they cost nothing until a scrape.
+    """
+
+    # Default histogram buckets, in seconds
+    DEFAULT_BUCKETS: Tuple[float, ...] = (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+    )
+
+    def __init__(self, namespace: str = 'dms2223'):
+        """ Constructor method.
+
+        Args:
+            - namespace (str): Prefix of every metric name.
+        """
+        self.__namespace: str = namespace
+        self.__lock: Lock = Lock()
+        self.__families: Dict[str, Dict] = {}
+        self.__collectors: List[Tuple[str, str, Callable[[], Dict], Optional[str]]] = []
+
+    def counter(self, name: str, description: str) -> None:
+        """ Declares a counter.
+
+        Args:
+            - name (str): The metric name, without the namespace.
+            - description (str): The metric help text.
+        """
+        self.__declare(name, 'counter', description, ())
+
+    def histogram(self, name: str, description: str,
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """ Declares a histogram.
+
+        Args:
+            - name (str): The metric name, without the namespace.
+            - description (str): The metric help text.
+            - buckets (Sequence[float]): The upper bounds of the buckets, in ascending order.
+        """
+        self.__declare(name, 'histogram', description, tuple(buckets))
+
+    def __declare(self, name: str, kind: str, description: str,
+                  buckets: Tuple[float, ...]) -> None:
+        """ Declares a metric family.
+
+        Args:
+            - name (str): The metric name, without the namespace.
+            - kind (str): The metric type (`counter` or `histogram`).
+            - description (str): The metric help text.
+            - buckets (Tuple[float, ...]): The histogram bucket bounds.
+        """
+        with self.__lock:
+            self.__families.setdefault(name, {
+                'type': kind, 'help': description, 'buckets': buckets, 'samples': {}
+            })
+
+    def inc(self, name: str, labels: Dict[str, str], value: float = 1) -> None:
+        """ Increments a counter.
+
+        Args:
+            - name (str): The counter name.
+            - labels (Dict[str, str]): The label values of the sample.
+            - value (float): The increment.
+        """
+        key: LabelValues = tuple(sorted(labels.items()))
+        with self.__lock:
+            samples: Dict = self.__families[name]['samples']
+            samples[key] = samples.get(key, 0) + value
+
+    def observe(self, name: str, labels: Dict[str, str], value: float) -> None:
+        """ Records an observation in a histogram.
+
+        Args:
+            - name (str): The histogram name.
+            - labels (Dict[str, str]): The label values of the sample.
+            - value (float): The observed value.
+        """
+        key: LabelValues = tuple(sorted(labels.items()))
+        with self.__lock:
+            family: Dict = self.__families[name]
+            sample: Optional[List[float]] = family['samples'].get(key)
+            if sample is None:
+                # One count per bucket, plus the +Inf count and the sum
+                sample = [0] * (len(family['buckets']) + 1) + [0.0]
+                family['samples'][key] = sample
+            sample[bisect.bisect_left(family['buckets'], value)] += 1
+            sample[-1] += value
+
+    def add_collector(self, name: str, description: str, function: Callable[[], Dict],
+                      label: Optional[str] = None) -> None:
+        """ Adds statistics gathered by another component, collected on every render.
+
+        Every numeric value returned by the function is rendered as a metric named after the
+        collector and its key: a counter if the key ends in `_total`, a gauge otherwise.
+        Values of other types (e.g., descriptions) are skipped.
+
+        Args:
+            - name (str): The collector name, the prefix of its metric names.
+            - description (str): The help text of its metrics.
+            - function (Callable[[], Dict]): Returns the statistics; a dictionary of values,
+              or, if `label` is given, a dictionary of such dictionaries keyed by the value
+              of that label.
+            - label (Optional[str]): The name of the label of nested statistics.
+        """
+        with self.__lock:
+            self.__collectors.append((name, description, function, label))
+
+    def render(self) -> str:
+        """ Renders every metric in the Prometheus text exposition format (version 0.0.4).
+
+        Returns:
+            - str: The metrics text.
+        """
+        lines: List[str] = []
+        with self.__lock:
+            families: List[Tuple[str, Dict]] = [
+                (name, {**family, 'samples': {
+                    key: list(value) if isinstance(value, list) else value
+                    for key, value in family['samples'].items()
+                }})
+                for name, family in sorted(self.__families.items())
+            ]
+            collectors = list(self.__collectors)
+        for name, family in families:
+            full_name: str = f'{self.__namespace}_{name}'
+            lines.append(f'# HELP {full_name} {family["help"]}')
+            lines.append(f'# TYPE {full_name} {family["type"]}')
+            for key, value in sorted(family['samples'].items()):
+                if family['type'] == 'histogram':
+                    lines.extend(MetricsRegistry.__histogram_lines(
+                        full_name, key, family['buckets'], value))
+                else:
+                    lines.append(f'{full_name}{MetricsRegistry.__labels(key)} {value}')
+        for name, description, function, label in collectors:
+            lines.extend(self.__collector_lines(name, description, function(), label))
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def __histogram_lines(name: str, key: LabelValues, buckets: Tuple[float, ...],
+                          sample: List[float]) -> List[str]:
+        """ Renders the samples of a histogram.
+
+        Args:
+            - name (str): The full metric name.
+            - key (LabelValues): The label values.
+            - buckets (Tuple[float, ...]): The bucket bounds.
+            - sample (List[float]): The bucket counts, the +Inf count and the sum.
+
+        Returns:
+            - List[str]: The sample lines.
+        """
+        lines: List[str] = []
+        cumulative: float = 0
+        for bound, count in zip(list(buckets) + ['+Inf'], sample[:-1]):
+            cumulative += count
+            lines.append(
+                f'{name}_bucket{MetricsRegistry.__labels(key + (("le", str(bound)),))} '
+                f'{cumulative}')
+        lines.append(f'{name}_sum{MetricsRegistry.__labels(key)} {sample[-1]}')
+        lines.append(f'{name}_count{MetricsRegistry.__labels(key)} {cumulative}')
+        return lines
+
+    def __collector_lines(self, name: str, description: str, stats: Dict,
+                          label: Optional[str]) -> List[str]:
+        """ Renders the statistics returned by a collector.
+
+        Args:
+            - name (str): The collector name.
+            - description (str): The help text.
+            - stats (Dict): The statistics.
+            - label (Optional[str]): The name of the label of nested statistics.
+
+        Returns:
+            - List[str]: The metric lines.
+        """
+        samples: Dict[str, List[Tuple[LabelValues, float]]] = {}
+        nested: Dict[str, Stats] = stats if label is not None else {'': stats}
+        for label_value, values in nested.items():
+            key: LabelValues = ((label, str(label_value)),) if label is not None else ()
+            for stat, value in values.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    samples.setdefault(stat, []).append((key, value))
+        lines: List[str] = []
+        for stat, stat_samples in sorted(samples.items()):
+            full_name: str = f'{self.__namespace}_{name}_{stat}'
+            lines.append(f'# HELP {full_name} {description}: {stat.replace("_", " ")}')
+            kind: str = 'counter' if stat.endswith('_total') else 'gauge'
+            lines.append(f'# TYPE {full_name} {kind}')
+            for sample_key, sample_value in stat_samples:
+                lines.append(f'{full_name}{MetricsRegistry.__labels(sample_key)} {sample_value}')
+        return lines
+
+    @staticmethod
+    def __labels(key: LabelValues) -> str:
+        """ Renders the label values of a sample.
+
+        Args:
+            - key (LabelValues): The label names and values.
+
+        Returns:
+            - str: The labels in braces, or an empty string if there are none.
+        """
+        if not key:
+            return ''
+        escaped: List[str] = [
+            name + '="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            + '"'
+            for name, value in key
+        ]
+        return '{' + ','.join(escaped) + '}'
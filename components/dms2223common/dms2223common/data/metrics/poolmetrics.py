@@ -0,0 +1,81 @@
+""" PoolMetrics class module.
+"""
+
+import time
+from threading import Lock
+from typing import Any, Dict, Optional
+
+
+class PoolMetrics():
+    """ Class responsible of measuring the time spent waiting for pool connection checkouts.
+    """
+
+    def __init__(self):
+        """ Constructor method.
+        """
+        self.__lock: Lock = Lock()
+        self.__checkouts: int = 0
+        self.__wait_total: float = 0.0
+        self.__wait_max: float = 0.0
+        self.__engine: Optional[Any] = None
+
+    def instrument(self, engine: Any) -> None:
+        """ Starts measuring the connection checkouts of an engine.
+
+        The pool is replaced when the engine is disposed, so the new one is instrumented too.
+
+        Args:
+            - engine (Engine): The engine whose pool is to be measured.
+        """
+        # Imported here, so services without a database do not need SQLAlchemy
+        # pylint: disable=import-outside-toplevel
+        from sqlalchemy import event  # type: ignore
+
+        self.__engine = engine
+        self.__instrument_pool(engine)
+        event.listen(engine, 'engine_disposed', self.__instrument_pool)
+
+    def __instrument_pool(self, engine: Any) -> None:
+        """ Wraps the pool checkout operation to measure its duration.
+
+        Args:
+            - engine (Engine): The engine whose current pool is to be measured.
+        """
+        connect = engine.pool.connect
+
+        def timed_connect() -> Any:
+            start: float = time.perf_counter()
+            try:
+                return connect()
+            finally:
+                self.record(time.perf_counter() - start)
+
+        engine.pool.connect = timed_connect
+
+    def record(self, wait: float) -> None:
+        """ Records a connection checkout.
+
+        Args:
+            - wait (float): The seconds spent waiting for the connection.
+        """
+        with self.__lock:
+            self.__checkouts += 1
+            self.__wait_total += wait
+            self.__wait_max = max(self.__wait_max, wait)
+
+    def get_metrics(self) -> Dict:
+        """ Gets the checkout metrics gathered so far.
+
+        Returns:
+            - Dict: A dictionary with the number of checkouts (`checkouts`), the total and
+              maximum seconds waited (`checkout_wait_seconds_total` and
+              `checkout_wait_seconds_max`) and the pool status description (`pool_status`).
+        """
+        with self.__lock:
+            metrics: Dict = {
+                'checkouts': self.__checkouts,
+                'checkout_wait_seconds_total': self.__wait_total,
+                'checkout_wait_seconds_max': self.__wait_max,
+            }
+        metrics['pool_status'] = self.__engine.pool.status() if self.__engine is not None else ''
+        return metrics
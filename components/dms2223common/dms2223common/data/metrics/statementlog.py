@@ -0,0 +1,175 @@
+""" StatementLog class module.
+"""
+
+import inspect
+import logging
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+from .exc import RepeatedStatementError
+from .statementmetrics import StatementMetrics
+
+
+class StatementLog():
+    """ Monostate class responsible of the opt-in statement instrumentation mode.
+
+    Every statement timed by `StatementMetrics` is attributed to the resultset method that
+    ran it. Statements slower than a threshold are logged. The statements run by a thread
+    between `begin` and `end` (i.e., while it handles a request) are grouped by shape, the
+    statement text with its parameter lists collapsed, to find the requests that run the
+    same statement over and over (e.g., once per item of a listing).
+
+    Modes:
+        - `off`: Nothing is instrumented.
+        - `log`: Slow and repeated statements are logged as warnings.
+        - `test`: Like `log`, but repeated statements also fail the request.
+    """
+
+    MODES: Tuple[str, ...] = ('off', 'log', 'test')
+
+    # Modules whose functions statements are attributed to
+    CALLER_MODULE: str = '.data.db.resultsets.'
+
+    __PARAMETER_LIST = re.compile(
+        r'\(\s*(?:\?|%s|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+))*\s*\)')
+    __WHITESPACE = re.compile(r'\s+')
+
+    __logger: logging.Logger = logging.getLogger('dms2223.statements')
+    __local: threading.local = threading.local()
+    __mode: str = 'off'
+    __slow_threshold: float = 0.1
+    __repeat_threshold: int = 5
+
+    @staticmethod
+    def configure(mode: str, slow_threshold: float, repeat_threshold: int) -> None:
+        """ Sets the instrumentation mode and thresholds.
+
+        Unless the mode is `off`, the statements timed by `StatementMetrics` are recorded;
+        the engines must be instrumented with `StatementMetrics.instrument`.
+
+        Args:
+            - mode (str): One of `MODES`.
+            - slow_threshold (float): Statements taking these seconds or more are logged.
+            - repeat_threshold (int): Statement shapes run more than these times by a single
+              request are reported.
+
+        Raises:
+            - ValueError: If the mode is unknown.
+        """
+        if mode not in StatementLog.MODES:
+            raise ValueError('Unknown statement log mode ' + str(mode) + '.')
+        StatementLog.__mode = mode
+        StatementLog.__slow_threshold = slow_threshold
+        StatementLog.__repeat_threshold = repeat_threshold
+        if StatementLog.is_enabled():
+            StatementMetrics.add_listener(StatementLog.record)
+        else:
+            StatementMetrics.remove_listener(StatementLog.record)
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """ Whether the statements are being instrumented.
+
+        Returns:
+            - bool: `False` in the `off` mode; `True` otherwise.
+        """
+        return StatementLog.__mode != 'off'
+
+    @staticmethod
+    def record(statement: str, seconds: float) -> None:
+        """ Records a statement run by the current thread.
+
+        Args:
+            - statement (str): The SQL statement text.
+            - seconds (float): The statement execution time.
+        """
+        caller: str = StatementLog.__caller()
+        shape: str = StatementLog.shape(statement)
+        if seconds >= StatementLog.__slow_threshold:
+            StatementLog.__logger.warning(
+                'Slow statement (%.1f ms) run by %s: %s', seconds * 1000, caller, shape)
+        else:
+            StatementLog.__logger.debug(
+                'Statement (%.1f ms) run by %s: %s', seconds * 1000, caller, shape)
+        scope: Optional[Dict[Tuple[str, str], int]] = getattr(
+            StatementLog.__local, 'scope', None)
+        if scope is not None:
+            key: Tuple[str, str] = (shape, caller)
+            scope[key] = scope.get(key, 0) + 1
+
+    @staticmethod
+    def shape(statement: str) -> str:
+        """ Normalizes a statement, so those differing only in their parameters are equal.
+
+        Args:
+            - statement (str): The SQL statement text.
+
+        Returns:
+            - str: The statement with its whitespace collapsed and every list of parameter
+              placeholders (e.g., of an `IN` clause) replaced by a single one.
+        """
+        return StatementLog.__PARAMETER_LIST.sub(
+            '(?)', StatementLog.__WHITESPACE.sub(' ', statement).strip())
+
+    @staticmethod
+    def __caller() -> str:
+        """ Finds the resultset method running the current statement.
+
+        Returns:
+            - str: The qualified name of the innermost resultset function in the call stack,
+              or `unknown` if the statement was not run by a resultset.
+        """
+        frame = inspect.currentframe()
+        try:
+            while frame is not None:
+                module: str = frame.f_globals.get('__name__', '')
+                if StatementLog.CALLER_MODULE in module:
+                    code = frame.f_code
+                    return getattr(code, 'co_qualname',
+                                   module.rsplit('.', 1)[-1] + '.' + code.co_name)
+                frame = frame.f_back
+            return 'unknown'
+        finally:
+            del frame
+
+    @staticmethod
+    def begin() -> None:
+        """ Starts grouping the statements run by the current thread.
+        """
+        StatementLog.__local.scope = {}
+
+    @staticmethod
+    def end(context: str = '') -> List[Tuple[str, str, int]]:
+        """ Stops grouping the statements run by the current thread and reports the
+        statement shapes run more times than allowed.
+
+        Args:
+            - context (str): A description of the work done since `begin` (e.g., the
+              request), included in the reports.
+
+        Returns:
+            - List[Tuple[str, str, int]]: The shape, caller and count of every statement
+              run more than the repeat threshold times since `begin`.
+
+        Raises:
+            - RepeatedStatementError: In the `test` mode, if any statement was repeated.
+        """
+        scope: Optional[Dict[Tuple[str, str], int]] = getattr(
+            StatementLog.__local, 'scope', None)
+        StatementLog.__local.scope = None
+        if not scope:
+            return []
+        repeated: List[Tuple[str, str, int]] = [
+            (shape, caller, count) for (shape, caller), count in scope.items()
+            if count > StatementLog.__repeat_threshold
+        ]
+        for shape, caller, count in repeated:
+            StatementLog.__logger.warning(
+                'Statement run %d times by %s in %s: %s', count, caller, context or 'a request',
+                shape)
+        if repeated and StatementLog.__mode == 'test':
+            shape, caller, count = repeated[0]
+            raise RepeatedStatementError(
+                f'Statement run {count} times by {caller} in {context or "a request"} '
+                f'(at most {StatementLog.__repeat_threshold} allowed): {shape}')
+        return repeated
@@ -0,0 +1,138 @@
+""" StatementMetrics class module.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class StatementMetrics():
+    """ Monostate class responsible of counting and timing the SQL statements of a service.
+
+    Besides the totals of the process, the statements run by a thread between `begin` and
+    `end` (i.e., while it handles a request) are accumulated separately. Other statement
+    instrumentation (e.g., `StatementLog`) is built on the same timing by adding listeners,
+    so every statement is timed once.
+    """
+
+    __lock: threading.Lock = threading.Lock()
+    __local: threading.local = threading.local()
+    __statements: int = 0
+    __seconds: float = 0.0
+    __listeners: Tuple[Callable[[str, float], None], ...] = ()
+
+    @staticmethod
+    def instrument(engine: Any) -> None:
+        """ Starts measuring the statements run through an engine.
+
+        Args:
+            - engine (Engine): The SQLAlchemy engine.
+        """
+        # Imported here, so services without a database do not need SQLAlchemy
+        # pylint: disable=import-outside-toplevel
+        from sqlalchemy import event  # type: ignore
+
+        event.listen(engine, 'before_cursor_execute', StatementMetrics.__before_execute)
+        event.listen(engine, 'after_cursor_execute', StatementMetrics.__after_execute)
+        event.listen(engine, 'handle_error', StatementMetrics.__handle_error)
+
+    @staticmethod
+    def add_listener(listener: Callable[[str, float], None]) -> None:
+        """ Adds a function called with every statement timed (if not added already).
+
+        Args:
+            - listener (Callable[[str, float], None]): A function receiving the statement
+              text and its execution time in seconds. It runs in the thread that ran the
+              statement.
+        """
+        with StatementMetrics.__lock:
+            if listener not in StatementMetrics.__listeners:
+                StatementMetrics.__listeners += (listener,)
+
+    @staticmethod
+    def remove_listener(listener: Callable[[str, float], None]) -> None:
+        """ Removes a function added with `add_listener`, if present.
+
+        Args:
+            - listener (Callable[[str, float], None]): The function.
+        """
+        with StatementMetrics.__lock:
+            StatementMetrics.__listeners = tuple(
+                added for added in StatementMetrics.__listeners if added != listener)
+
+    @staticmethod
+    def __before_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        """ Records the start of a statement (`before_cursor_execute` event listener).
+        """
+        # pylint: disable=unused-argument,too-many-arguments
+        conn.info.setdefault('dms2223_statement_start', []).append(time.perf_counter())
+
+    @staticmethod
+    def __after_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        """ Records the end of a statement (`after_cursor_execute` event listener).
+        """
+        # pylint: disable=unused-argument,too-many-arguments
+        starts = conn.info.get('dms2223_statement_start')
+        if not starts:
+            return
+        seconds: float = time.perf_counter() - starts.pop()
+        StatementMetrics.record(seconds)
+        for listener in StatementMetrics.__listeners:
+            listener(statement, seconds)
+
+    @staticmethod
+    def __handle_error(exception_context) -> None:
+        """ Discards the start of a failed statement (`handle_error` event listener).
+        """
+        connection = exception_context.connection
+        if connection is not None and connection.info.get('dms2223_statement_start'):
+            connection.info['dms2223_statement_start'].pop()
+
+    @staticmethod
+    def record(seconds: float) -> None:
+        """ Records a statement.
+
+        Args:
+            - seconds (float): The statement execution time.
+        """
+        with StatementMetrics.__lock:
+            StatementMetrics.__statements += 1
+            StatementMetrics.__seconds += seconds
+        scope: Optional[list] = getattr(StatementMetrics.__local, 'scope', None)
+        if scope is not None:
+            scope[0] += 1
+            scope[1] += seconds
+
+    @staticmethod
+    def begin() -> None:
+        """ Starts accumulating the statements run by the current thread.
+        """
+        StatementMetrics.__local.scope = [0, 0.0]
+
+    @staticmethod
+    def end() -> Tuple[int, float]:
+        """ Stops accumulating the statements run by the current thread.
+
+        Returns:
+            - Tuple[int, float]: The number of statements run since `begin` and their total
+              execution time in seconds.
+        """
+        scope: Optional[list] = getattr(StatementMetrics.__local, 'scope', None)
+        StatementMetrics.__local.scope = None
+        if scope is None:
+            return 0, 0.0
+        return scope[0], scope[1]
+
+    @staticmethod
+    def get_metrics() -> Dict:
+        """ Gets the statement totals of the process.
+
+        Returns:
+            - Dict: A dictionary with the number of statements (`statements_total`) and
+              their total execution time in seconds (`statement_seconds_total`).
+        """
+        with StatementMetrics.__lock:
+            return {
+                'statements_total': StatementMetrics.__statements,
+                'statement_seconds_total': StatementMetrics.__seconds,
+            }
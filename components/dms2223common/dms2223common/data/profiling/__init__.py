@@ -0,0 +1,5 @@
+""" Classes profiling the services and summarizing their profiles.
+"""
+
+from .profilesummary import ProfileSummary
+from .samplingprofiler import SamplingProfiler
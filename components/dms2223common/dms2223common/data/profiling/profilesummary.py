@@ -0,0 +1,195 @@
+""" ProfileSummary class module.
+"""
+
+import os
+import pstats
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+from .samplingprofiler import SamplingProfiler
+
+
+class ProfileSummary():
+    """ Monostate class responsible of naming the request profile files and adding them up
+    to find the hot functions.
+
+    Profile files are named `<operation>__<route>__<timestamp>-<pid>-<sequence><extension>`,
+    where the extension tells the profiler: `.prof` for `cProfile` (deterministic, times in
+    seconds) and `.stacks` for `SamplingProfiler` (sample counts).
+    """
+
+    # Extension of the files written by `cProfile`
+    DETERMINISTIC_EXTENSION: str = '.prof'
+
+    __UNSAFE = re.compile(r'[^A-Za-z0-9_.-]+')
+    __sequence: int = 0
+
+    @staticmethod
+    def file_name(operation: str, route: str, extension: str) -> str:
+        """ Builds the name of a new profile file.
+
+        Args:
+            - operation (str): The `operationId` (or endpoint name) of the request.
+            - route (str): The request method and URL rule.
+            - extension (str): The extension of the profiler format.
+
+        Returns:
+            - str: A file name, unique in the process, tagged with the operation and route.
+        """
+        ProfileSummary.__sequence += 1
+        tags: List[str] = [
+            ProfileSummary.__UNSAFE.sub('_', value).strip('_') or '-'
+            for value in (operation, route)
+        ]
+        return (f'{tags[0]}__{tags[1]}__{time.strftime("%Y%m%dT%H%M%S")}-{os.getpid()}-'
+                f'{ProfileSummary.__sequence}{extension}')
+
+    @staticmethod
+    def find(paths: List[str], operation: Optional[str] = None) -> List[str]:
+        """ Lists the profile files in the given files and directories.
+
+        Args:
+            - paths (List[str]): Profile files and directories containing them.
+            - operation (Optional[str]): If given, only the profiles of this operation are
+              listed. It matches a whole `operationId` or its trailing dotted components
+              (e.g., `discussion.list_discussions`).
+
+        Returns:
+            - List[str]: The paths of the profile files.
+        """
+        files: List[str] = []
+        for path in paths:
+            if os.path.isdir(path):
+                files.extend(sorted(os.path.join(path, name) for name in os.listdir(path)))
+            else:
+                files.append(path)
+        extensions: Tuple[str, str] = (ProfileSummary.DETERMINISTIC_EXTENSION,
+                                       SamplingProfiler.EXTENSION)
+        return [
+            file for file in files
+            if file.endswith(extensions) and (
+                operation is None
+                or ('.' + os.path.basename(file).split('__', 1)[0]).endswith('.' + operation)
+            )
+        ]
+
+    @staticmethod
+    def hot_functions(files: List[str], top: int = 20, sort: str = 'self') -> Dict[str, Dict]:
+        """ Adds up profiles and finds the functions where most time was spent.
+
+        Args:
+            - files (List[str]): The profile files.
+            - top (int): The number of functions listed per profiler.
+            - sort (str): `self` to rank the functions by the time spent in their own code,
+              or `cumulative` to include the functions they call.
+
+        Returns:
+            - Dict[str, Dict]: For each profiler with profiles (`deterministic`, `sampling`),
+              a dictionary with the number of `profiles`, the `total` time (seconds) or
+              samples and the `functions`: a list of dictionaries with the function name
+              (`function`), its `self` and `cumulative` time or samples, their shares of the
+              total (`self_percent`, `cumulative_percent`) and the number of `calls` (`0`
+              in sampled profiles, which do not count calls).
+
+        Raises:
+            - ValueError: If the sort key is unknown.
+        """
+        if sort not in ('self', 'cumulative'):
+            raise ValueError('Profiles can only be sorted by self or cumulative time.')
+        summary: Dict[str, Dict] = {}
+        deterministic: List[str] = [
+            file for file in files if file.endswith(ProfileSummary.DETERMINISTIC_EXTENSION)]
+        sampled: List[str] = [
+            file for file in files if file.endswith(SamplingProfiler.EXTENSION)]
+        if deterministic:
+            summary['deterministic'] = ProfileSummary.__rank(
+                len(deterministic), *ProfileSummary.__add_deterministic(deterministic),
+                top, sort)
+        if sampled:
+            summary['sampling'] = ProfileSummary.__rank(
+                len(sampled), *ProfileSummary.__add_sampled(sampled), top, sort)
+        return summary
+
+    @staticmethod
+    def __add_deterministic(files: List[str]) -> Tuple[float, Dict[str, List[float]]]:
+        """ Adds up `cProfile` profiles.
+
+        Args:
+            - files (List[str]): The profile files.
+
+        Returns:
+            - Tuple[float, Dict[str, List[float]]]: The total time and the self time,
+              cumulative time and calls of each function.
+        """
+        stats: pstats.Stats = pstats.Stats(files[0])
+        for file in files[1:]:
+            stats.add(file)
+        functions: Dict[str, List[float]] = {}
+        # pylint: disable=no-member
+        for function, (_, calls, self_time, cumulative, _) in stats.stats.items():  # type: ignore
+            name: str = pstats.func_std_string(function)  # type: ignore[attr-defined]
+            functions[name] = [self_time, cumulative, calls]
+        return stats.total_tt, functions  # type: ignore
+
+    @staticmethod
+    def __add_sampled(files: List[str]) -> Tuple[float, Dict[str, List[float]]]:
+        """ Adds up collapsed stacks profiles.
+
+        Args:
+            - files (List[str]): The profile files.
+
+        Returns:
+            - Tuple[float, Dict[str, List[float]]]: The total samples and the self and
+              cumulative samples of each function.
+        """
+        total: int = 0
+        functions: Dict[str, List[float]] = {}
+        for file in files:
+            with open(file, 'r', encoding='UTF-8') as stream:
+                for line in stream:
+                    stack, _, count_text = line.rstrip('\n').rpartition(' ')
+                    if not stack:
+                        continue
+                    count: int = int(count_text)
+                    frames: List[str] = stack.split(';')
+                    total += count
+                    functions.setdefault(frames[-1], [0, 0, 0])[0] += count
+                    # Recursive functions count once per sample
+                    for frame in set(frames):
+                        functions.setdefault(frame, [0, 0, 0])[1] += count
+        return total, functions
+
+    @staticmethod
+    def __rank(profiles: int, total: float, functions: Dict[str, List[float]], top: int,
+               sort: str) -> Dict:
+        """ Ranks the functions of added up profiles.
+
+        Args:
+            - profiles (int): The number of profiles added up.
+            - total (float): The total time or samples.
+            - functions (Dict[str, List[float]]): The self and cumulative time or samples,
+              and the calls, of each function.
+            - top (int): The number of functions listed.
+            - sort (str): `self` or `cumulative`.
+
+        Returns:
+            - Dict: The summary of the profiles.
+        """
+        # pylint: disable=too-many-arguments
+        index: int = 0 if sort == 'self' else 1
+        ranked = sorted(functions.items(), key=lambda item: item[1][index], reverse=True)
+        return {
+            'profiles': profiles,
+            'total': total,
+            'functions': [
+                {
+                    'function': function,
+                    'self': values[0],
+                    'cumulative': values[1],
+                    'self_percent': values[0] * 100 / total if total else 0.0,
+                    'cumulative_percent': values[1] * 100 / total if total else 0.0,
+                    'calls': int(values[2]),
+                }
+                for function, values in ranked[:top]
+            ],
+        }
@@ -0,0 +1,74 @@
+""" SamplingProfiler class module.
+"""
+
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+class SamplingProfiler():
+    """ Class responsible of profiling a thread by sampling its call stack at a fixed interval.
+
+    Unlike `cProfile`, the profiled thread runs undisturbed: a separate thread takes the
+    samples, so the overhead does not depend on the number of function calls. Its interface
+    mirrors that of `cProfile.Profile`. The profile is written in the collapsed stacks
+    format (one `frame;frame;...;frame count` line per distinct stack, outermost frame
+    first), read by flame graph tools.
+    """
+
+    # Extension of the files written by `dump_stats`
+    EXTENSION: str = '.stacks'
+
+    def __init__(self, interval: float = 0.005):
+        """ Constructor method.
+
+        Args:
+            - interval (float): Seconds between samples.
+        """
+        self.__interval: float = interval
+        self.__stacks: Dict[Tuple[str, ...], int] = {}
+        self.__stopped: threading.Event = threading.Event()
+        self.__sampler: Optional[threading.Thread] = None
+        self.__target: int = 0
+
+    def enable(self) -> None:
+        """ Starts sampling the call stack of the current thread.
+        """
+        self.__target = threading.get_ident()
+        self.__stopped.clear()
+        self.__sampler = threading.Thread(
+            target=self.__sample, name='sampling-profiler', daemon=True)
+        self.__sampler.start()
+
+    def disable(self) -> None:
+        """ Stops sampling.
+        """
+        self.__stopped.set()
+        if self.__sampler is not None:
+            self.__sampler.join()
+            self.__sampler = None
+
+    def __sample(self) -> None:
+        """ Takes a sample of the profiled thread every interval until disabled.
+        """
+        while not self.__stopped.wait(self.__interval):
+            # pylint: disable=protected-access
+            frame = sys._current_frames().get(self.__target)
+            stack: List[str] = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_filename}:{code.co_firstlineno}({code.co_name})')
+                frame = frame.f_back
+            if stack:
+                key: Tuple[str, ...] = tuple(reversed(stack))
+                self.__stacks[key] = self.__stacks.get(key, 0) + 1
+
+    def dump_stats(self, path: str) -> None:
+        """ Writes the samples taken in the collapsed stacks format.
+
+        Args:
+            - path (str): The path of the file to write.
+        """
+        with open(path, 'w', encoding='UTF-8') as stream:
+            for stack, count in sorted(self.__stacks.items()):
+                stream.write(';'.join(stack) + ' ' + str(count) + '\n')
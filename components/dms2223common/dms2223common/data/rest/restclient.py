@@ -0,0 +1,161 @@
+""" RestClient class module.
+"""
+
+import time
+from threading import Lock
+from typing import Dict, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class RestClient():
+    """ Base class of the REST clients of the services.
+
+    Every client keeps a persistent session, so connections to the service are pooled and
+    reused (HTTP keep-alive) instead of opened on every request. Idempotent `GET` requests
+    are retried with an exponential backoff on connection errors and gateway failures.
+    The latency of the requests is measured per endpoint.
+    """
+
+    # Status codes of transient failures worth retrying
+    __RETRY_STATUSES = (502, 503, 504)
+
+    # Constructor parameters that can be set in the service connection configuration
+    TUNING_PARAMETERS = ('connect_timeout', 'read_timeout', 'retries', 'backoff', 'pool_size')
+
+    def __init__(self,
+                 host: str, port: int,
+                 api_base_path: str = '/api/v1',
+                 apikey_header: str = '',
+                 apikey_secret: str = '',
+                 connect_timeout: float = 3.05,
+                 read_timeout: float = 10.0,
+                 retries: int = 2,
+                 backoff: float = 0.1,
+                 pool_size: int = 10
+                 ):
+        """ Constructor method.
+
+        Initializes the client.
+
+        Args:
+            - host (str): The service host string.
+            - port (int): The service port number.
+            - api_base_path (str): The base path that is prepended to every request's path.
+            - apikey_header (str): Name of the header with the API key that identifies this client.
+            - apikey_secret (str): The API key that identifies this client.
+            - connect_timeout (float): Default seconds to wait for a connection.
+            - read_timeout (float): Default seconds to wait for a response once connected.
+            - retries (int): Times a failed `GET` request is retried.
+            - backoff (float): Seconds waited before the first retry; doubled on each retry.
+            - pool_size (int): Maximum number of connections kept open to the service.
+        """
+        self.__base_url: str = f'http://{host}:{port}{api_base_path}'
+        self.__timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+        self.__retries: int = max(0, retries)
+        self.__backoff: float = backoff
+        self.__session: requests.Session = requests.Session()
+        if apikey_header:
+            self.__session.headers[apikey_header] = apikey_secret
+        adapter: HTTPAdapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.__session.mount('http://', adapter)
+        self.__session.mount('https://', adapter)
+        self.__metrics_lock: Lock = Lock()
+        self.__metrics: Dict[str, Dict] = {}
+
+    @staticmethod
+    def tuning_parameters(service_cfg: Dict) -> Dict:
+        """ Extracts the connection tuning parameters from a service connection configuration.
+
+        Args:
+            - service_cfg (Dict): The service connection configuration (e.g., the
+              `auth_service` value), which may include any of the `TUNING_PARAMETERS`.
+
+        Returns:
+            - Dict: The tuning parameters given, to be passed to the constructor.
+        """
+        return {
+            key: value for key, value in service_cfg.items()
+            if key in RestClient.TUNING_PARAMETERS
+        }
+
+    def _request(self, method: str, endpoint: str,
+                 token: Optional[str] = None,
+                 path_params: Optional[Dict] = None,
+                 timeout: Optional[Tuple[float, float]] = None,
+                 **kwargs) -> requests.Response:
+        """ Sends a request to the service.
+
+        Args:
+            - method (str): The HTTP method.
+            - endpoint (str): The path template of the endpoint, relative to the base path
+              (e.g., `/discussions/{id}`). Metrics are gathered per method and template.
+            - token (Optional[str]): The user session token, sent as bearer, if any.
+            - path_params (Optional[Dict]): The values of the path template placeholders.
+            - timeout (Optional[Tuple[float, float]]): The connection and read timeouts of
+              this call. If not given, the client defaults are used.
+            - **kwargs: Other arguments for `requests.Session.request` (e.g., `params`,
+              `json` or `auth`).
+
+        Raises:
+            - requests.RequestException: If the request could not be completed after the
+              allowed attempts.
+
+        Returns:
+            - requests.Response: The service response.
+        """
+        url: str = self.__base_url + endpoint.format(**(path_params or {}))
+        headers: Dict[str, str] = {}
+        if token is not None:
+            headers['Authorization'] = f'Bearer {token}'
+        attempts: int = 1 + (self.__retries if method == 'GET' else 0)
+        for attempt in range(attempts):
+            start: float = time.perf_counter()
+            try:
+                response: requests.Response = self.__session.request(
+                    method, url, headers=headers, timeout=timeout or self.__timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self.__record(method, endpoint, time.perf_counter() - start, True)
+                if attempt + 1 >= attempts:
+                    raise
+            else:
+                self.__record(method, endpoint, time.perf_counter() - start,
+                              response.status_code >= 500)
+                if response.status_code not in RestClient.__RETRY_STATUSES \
+                        or attempt + 1 >= attempts:
+                    return response
+            time.sleep(self.__backoff * 2 ** attempt)
+        raise requests.RequestException('No request attempts were made')
+
+    def __record(self, method: str, endpoint: str, seconds: float, failed: bool) -> None:
+        """ Records the latency of a request.
+
+        Args:
+            - method (str): The HTTP method.
+            - endpoint (str): The path template of the endpoint.
+            - seconds (float): The seconds the request took.
+            - failed (bool): Whether the request failed (connection error or 5xx status).
+        """
+        with self.__metrics_lock:
+            metrics: Dict = self.__metrics.setdefault(f'{method} {endpoint}', {
+                'requests': 0,
+                'errors': 0,
+                'seconds_total': 0.0,
+                'seconds_max': 0.0
+            })
+            metrics['requests'] += 1
+            metrics['errors'] += int(failed)
+            metrics['seconds_total'] += seconds
+            metrics['seconds_max'] = max(metrics['seconds_max'], seconds)
+
+    def get_metrics(self) -> Dict[str, Dict]:
+        """ Gets the latency metrics gathered so far.
+
+        Returns:
+            - Dict[str, Dict]: A dictionary keyed by method and endpoint template (e.g.,
+              `GET /discussions/{id}`) with the number of requests (`requests`) and failed
+              requests (`errors`), and the total and maximum seconds (`seconds_total` and
+              `seconds_max`). Each retry counts as a request.
+        """
+        with self.__metrics_lock:
+            return {endpoint: dict(metrics) for endpoint, metrics in self.__metrics.items()}
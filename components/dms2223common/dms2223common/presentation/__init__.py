@@ -0,0 +1,8 @@
+""" Common presentation layer modules to be used by the different services.
+"""
+
+from .openapispec import OpenApiSpec
+from .requestmetrics import RequestMetrics
+from .requestprofiler import RequestProfiler
+from .requeststatementlog import RequestStatementLog
+from .wsgiserver import WsgiServer
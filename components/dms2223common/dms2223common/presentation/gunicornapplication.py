@@ -0,0 +1,36 @@
+""" GunicornApplication class module.
+"""
+
+from typing import Any, Callable, Dict
+from gunicorn.app.base import BaseApplication  # type: ignore
+
+
+class GunicornApplication(BaseApplication):
+    """ Gunicorn application serving an already built WSGI application.
+    """
+    # pylint: disable=abstract-method
+
+    def __init__(self, wsgi_app: Callable, options: Dict[str, Any]):
+        """ Constructor method.
+
+        Args:
+            - wsgi_app (Callable): The WSGI application, built before forking the workers.
+            - options (Dict[str, Any]): The gunicorn settings.
+        """
+        self.__wsgi_app: Callable = wsgi_app
+        self.__options: Dict[str, Any] = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        """ Loads the gunicorn settings.
+        """
+        for key, value in self.__options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> Callable:
+        """ Gets the WSGI application.
+
+        Returns:
+            - Callable: The WSGI application.
+        """
+        return self.__wsgi_app
@@ -0,0 +1,95 @@
+""" OpenApiSpec class module.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, Optional
+import yaml
+
+
+class OpenApiSpec():
+    """ Monostate class responsible of loading the OpenAPI specifications of the services.
+
+    Parsing the YAML specification is a significant part of the startup time, so the parsed
+    specification is cached as JSON, keyed by the digest of the specification file; any
+    change to the file is a cache miss. The specification is not rendered as a template.
+    """
+
+    @staticmethod
+    def load(path: str, cache_dir: Optional[str] = None) -> Dict:
+        """ Loads an OpenAPI specification file.
+
+        Args:
+            - path (str): The path of the YAML specification file.
+            - cache_dir (Optional[str]): The directory where the parsed specification is
+              cached. If not given, or if it cannot be written, nothing is cached.
+
+        Returns:
+            - Dict: The specification, to be passed to `add_api`.
+        """
+        with open(path, 'rb') as stream:
+            contents: bytes = stream.read()
+        stem: str = os.path.splitext(os.path.basename(path))[0]
+        cache_file: Optional[str] = None
+        if cache_dir is not None:
+            cache_file = os.path.join(
+                cache_dir, f'{stem}-{hashlib.sha256(contents).hexdigest()}.json')
+            try:
+                with open(cache_file, 'r', encoding='UTF-8') as stream:
+                    return json.load(stream)
+            except (OSError, ValueError):
+                pass
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        specification: Dict = yaml.load(contents.decode('UTF-8'), Loader=loader)
+        if cache_dir is not None and cache_file is not None:
+            OpenApiSpec.__store(specification, cache_dir, stem, cache_file)
+        return specification
+
+    @staticmethod
+    def operation_ids(specification: Dict) -> Dict[str, str]:
+        """ Maps the Flask endpoint names connexion gives to the operations to their ids.
+
+        Args:
+            - specification (Dict): The OpenAPI specification.
+
+        Returns:
+            - Dict[str, str]: The `operationId` of each endpoint name.
+        """
+        operation_ids: Dict[str, str] = {}
+        for operations in specification.get('paths', {}).values():
+            for operation in operations.values():
+                if isinstance(operation, dict) and 'operationId' in operation:
+                    operation_id: str = operation['operationId']
+                    operation_ids[operation_id.replace('.', '_')] = operation_id
+        return operation_ids
+
+    @staticmethod
+    def __store(specification: Dict, cache_dir: str, stem: str, cache_file: str) -> None:
+        """ Writes a parsed specification to the cache, replacing the previous versions.
+
+        The file is written under a temporary name and then renamed, so processes starting
+        at the same time never read a partial file.
+
+        Args:
+            - specification (Dict): The parsed specification.
+            - cache_dir (str): The cache directory.
+            - stem (str): The specification file name, without extension.
+            - cache_file (str): The path of the cache file.
+        """
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            for stale in glob.glob(os.path.join(glob.escape(cache_dir), f'{stem}-*.json')):
+                os.remove(stale)
+            descriptor, temporary = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        except OSError:
+            # The cache is an optimization; an unwritable directory is not an error
+            return
+        try:
+            with os.fdopen(descriptor, 'w', encoding='UTF-8') as stream:
+                json.dump(specification, stream)
+            os.replace(temporary, cache_file)
+        except (OSError, TypeError, ValueError):
+            os.remove(temporary)
@@ -0,0 +1,66 @@
+""" RequestMetrics class module.
+"""
+
+import time
+from typing import Dict, Optional
+from flask import Flask, Response, g, request
+from dms2223common.data.metrics import MetricsRegistry, StatementMetrics
+from .openapispec import OpenApiSpec
+
+
+class RequestMetrics():
+    """ Monostate class responsible of measuring the requests handled by a Flask application
+    and exposing the gathered metrics to be scraped.
+    """
+
+    # Bounds of the histogram of statements per request
+    STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+    @staticmethod
+    def instrument(flask_app: Flask, registry: MetricsRegistry,
+                   specification: Optional[Dict] = None, path: str = '/metrics') -> None:
+        """ Measures the requests of an application and serves the metrics text.
+
+        Every request records its latency and response status under the `operationId` of
+        its OpenAPI operation, and the number and time of the SQL statements it ran.
+
+        Args:
+            - flask_app (Flask): The Flask application (of a connexion application).
+            - registry (MetricsRegistry): The registry where the metrics are gathered.
+            - specification (Optional[Dict]): The OpenAPI specification of the application,
+              used to tell the `operationId` of the requests. Otherwise, the Flask endpoint
+              name is used.
+            - path (str): The URL path where the metrics are served.
+        """
+        operation_ids: Dict[str, str] = OpenApiSpec.operation_ids(specification or {})
+        registry.counter('http_requests_total', 'Requests handled')
+        registry.histogram('http_request_duration_seconds', 'Request latency')
+        registry.histogram('db_statements_per_request', 'SQL statements run by a request',
+                           RequestMetrics.STATEMENT_BUCKETS)
+        registry.histogram('db_seconds_per_request', 'Time spent running SQL statements')
+
+        def start() -> None:
+            g.metrics_start = time.perf_counter()
+            StatementMetrics.begin()
+
+        def finish(response: Response) -> Response:
+            start_time: Optional[float] = g.pop('metrics_start', None)
+            statements, db_seconds = StatementMetrics.end()
+            if start_time is None or request.endpoint == 'metrics':
+                return response
+            endpoint: str = request.endpoint or ''
+            operation: str = operation_ids.get(endpoint.rsplit('.', 1)[-1], endpoint)
+            labels: Dict[str, str] = {'operation': operation}
+            registry.inc('http_requests_total', {**labels, 'status': str(response.status_code)})
+            registry.observe('http_request_duration_seconds', labels,
+                             time.perf_counter() - start_time)
+            registry.observe('db_statements_per_request', labels, statements)
+            registry.observe('db_seconds_per_request', labels, db_seconds)
+            return response
+
+        flask_app.before_request(start)
+        flask_app.after_request(finish)
+        flask_app.add_url_rule(
+            path, 'metrics',
+            lambda: Response(registry.render(), mimetype='text/plain; version=0.0.4')
+        )
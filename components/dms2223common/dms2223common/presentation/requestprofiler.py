@@ -0,0 +1,118 @@
+""" RequestProfiler class module.
+"""
+
+import cProfile
+import os
+import random
+import threading
+from typing import Dict, List, Optional, Union
+from flask import Flask, g, request
+from dms2223common.data.profiling import ProfileSummary, SamplingProfiler
+from .openapispec import OpenApiSpec
+
+
+class RequestProfiler():
+    """ Monostate class responsible of profiling, on demand, the requests handled by a Flask
+    application.
+
+    A request is profiled if it carries an authorized API key in the profiling header, or
+    if it falls in the sampled percentage of requests. Only one request is profiled at a
+    time per process (`cProfile` cannot profile concurrent requests separately); requests
+    arriving meanwhile run as usual. The profiles are written to the profiling directory
+    named after the `operationId` and route of the request (see `ProfileSummary`).
+    """
+
+    __lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def instrument(flask_app: Flask, profiling: Dict[str, Union[str, int, float, bool]],
+                   api_keys: List[str], specification: Optional[Dict] = None) -> None:
+        """ Profiles the requests of an application on demand.
+
+        Args:
+            - flask_app (Flask): The Flask application (of a connexion application).
+            - profiling (Dict[str, Union[str, int, float, bool]]): The `profiling`
+              configuration value.
+            - api_keys (List[str]): The API keys authorized to ask for a profile.
+            - specification (Optional[Dict]): The OpenAPI specification of the application,
+              used to tell the `operationId` of the requests. Otherwise, the Flask endpoint
+              name is used.
+        """
+        operation_ids: Dict[str, str] = OpenApiSpec.operation_ids(specification or {})
+        header: str = str(profiling['header'])
+        sample_percent: float = float(profiling['sample_percent'])
+
+        def start() -> None:
+            api_key: Optional[str] = request.headers.get(header)
+            requested: bool = api_key is not None and api_key in api_keys
+            if not requested and random.random() * 100 >= sample_percent:
+                return
+            # Released when the request is torn down
+            # pylint: disable=consider-using-with
+            if not RequestProfiler.__lock.acquire(blocking=False):
+                return
+            profiler: Union[cProfile.Profile, SamplingProfiler] = (
+                cProfile.Profile() if profiling['profiler'] == 'deterministic'
+                else SamplingProfiler(float(profiling['sampling_interval']))
+            )
+            try:
+                profiler.enable()
+            except ValueError:
+                # Another profiler (e.g., of a debugger) is already active in the process
+                RequestProfiler.__lock.release()
+                return
+            g.profiler = profiler
+
+        def finish(exception: Optional[BaseException]) -> None:
+            # pylint: disable=unused-argument
+            profiler: Optional[Union[cProfile.Profile, SamplingProfiler]] = g.pop(
+                'profiler', None)
+            if profiler is None:
+                return
+            try:
+                profiler.disable()
+                endpoint: str = request.endpoint or ''
+                RequestProfiler.__store(
+                    flask_app, profiler, profiling,
+                    operation_ids.get(endpoint.rsplit('.', 1)[-1], endpoint),
+                    f'{request.method} {request.url_rule or request.path}')
+            finally:
+                RequestProfiler.__lock.release()
+
+        flask_app.before_request(start)
+        flask_app.teardown_request(finish)
+
+    @staticmethod
+    def __store(flask_app: Flask, profiler: Union[cProfile.Profile, SamplingProfiler],
+                profiling: Dict[str, Union[str, int, float, bool]], operation: str,
+                route: str) -> None:
+        """ Writes the profile of a request to the profiling directory.
+
+        Profiling must never fail a request, so errors writing the profile are only logged.
+
+        Args:
+            - flask_app (Flask): The Flask application.
+            - profiler (Union[cProfile.Profile, SamplingProfiler]): The disabled profiler.
+            - profiling (Dict[str, Union[str, int, float, bool]]): The `profiling`
+              configuration value.
+            - operation (str): The `operationId` (or endpoint name) of the request.
+            - route (str): The request method and URL rule.
+        """
+        # pylint: disable=too-many-arguments
+        directory: str = str(profiling['directory'])
+        extension: str = (ProfileSummary.DETERMINISTIC_EXTENSION
+                          if isinstance(profiler, cProfile.Profile)
+                          else SamplingProfiler.EXTENSION)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            if len(os.listdir(directory)) >= int(profiling['max_profiles']):
+                flask_app.logger.warning(
+                    'Profile of %s not written: %s already holds %d profiles.',
+                    route, directory, profiling['max_profiles'])
+                return
+            path: str = os.path.join(
+                directory, ProfileSummary.file_name(operation, route, extension))
+            profiler.dump_stats(path)
+            flask_app.logger.info('Profile of %s written to %s.', route, path)
+        except OSError as ex:
+            flask_app.logger.warning('Profile of %s not written: %s', route, ex)
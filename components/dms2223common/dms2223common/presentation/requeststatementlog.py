@@ -0,0 +1,32 @@
+""" RequestStatementLog class module.
+"""
+
+from flask import Flask, Response, request
+from dms2223common.data.metrics import StatementLog
+
+
+class RequestStatementLog():
+    """ Monostate class responsible of grouping the SQL statements of the requests handled
+    by a Flask application in the statement log.
+    """
+
+    @staticmethod
+    def instrument(flask_app: Flask) -> None:
+        """ Reports the statements repeated by every request of an application.
+
+        In the `test` mode of the statement log, a request repeating a statement more than
+        allowed fails with an internal server error, and the error is logged.
+
+        Args:
+            - flask_app (Flask): The Flask application (of a connexion application).
+        """
+
+        def start() -> None:
+            StatementLog.begin()
+
+        def finish(response: Response) -> Response:
+            StatementLog.end(f'{request.method} {request.url_rule or request.path}')
+            return response
+
+        flask_app.before_request(start)
+        flask_app.after_request(finish)
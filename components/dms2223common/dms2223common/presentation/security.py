@@ -0,0 +1,21 @@
+""" Helpers of the REST API controllers to authorize the requests.
+"""
+
+from typing import Dict, Union
+from dms2223common.data import Role
+
+
+def token_has_role(token_info: Dict, role: Union[Role, str]) -> bool:
+    """Determines whether the user of a verified token has a certain role.
+
+    The role claims of the token are used, so no lookup is needed.
+
+    Args:
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+        - role (Union[Role, str]): The role to be tested.
+
+    Returns:
+        - bool: `True` if the token user has the given role. `False` otherwise.
+    """
+    rolename: str = role.name if isinstance(role, Role) else role
+    return rolename in token_info.get('user_token', {}).get('roles', [])
@@ -0,0 +1,74 @@
+""" WsgiServer class module.
+"""
+
+from typing import Any, Callable, Dict, Sequence
+from dms2223common.data.config import ServiceConfiguration
+
+
+class WsgiServer():
+    """ Monostate class responsible of serving the services' applications.
+
+    In `development` mode the application runs in the single-process development server.
+    In `production` mode it runs in a pre-forking gunicorn server with several worker
+    processes, each one with a pool of threads. The application is built once in the
+    master process before forking (so the database schema is deployed and migrated only
+    once) and the workers are shut down gracefully on `SIGTERM`.
+    """
+
+    @staticmethod
+    def run(app: Any, cfg: ServiceConfiguration,
+            post_fork: Sequence[Callable[[], None]] = (),
+            worker_exit: Sequence[Callable[[], None]] = (),
+            use_reloader: bool = False) -> None:
+        """ Serves an application with the configured server.
+
+        Args:
+            - app (Any): The Flask or connexion application.
+            - cfg (ServiceConfiguration): The service configuration.
+            - post_fork (Sequence[Callable[[], None]]): Functions run in every worker right
+              after it is forked, to drop the process state that must not be shared with the
+              master (e.g., pooled database connections).
+            - worker_exit (Sequence[Callable[[], None]]): Functions run in every worker when
+              it exits.
+            - use_reloader (bool): Whether the development server restarts on code changes.
+        """
+        server: Dict = cfg.get_server()
+        if server['mode'] == 'development':
+            app.run(
+                host=cfg.get_service_host(),
+                port=cfg.get_service_port(),
+                debug=cfg.get_debug_flag(),
+                use_reloader=use_reloader
+            )
+            return
+        # Imported here, so the development mode does not pay for it
+        # pylint: disable=import-outside-toplevel
+        from .gunicornapplication import GunicornApplication
+
+        # Connexion applications wrap the Flask application
+        wsgi_app: Callable = getattr(app, 'app', app)
+        GunicornApplication(wsgi_app, {
+            'bind': f'{cfg.get_service_host()}:{cfg.get_service_port()}',
+            'worker_class': 'gthread',
+            'workers': server['workers'],
+            'threads': server['threads'],
+            'backlog': server['backlog'],
+            'worker_connections': server['worker_connections'],
+            'timeout': server['timeout'],
+            'graceful_timeout': server['graceful_timeout'],
+            'max_requests': server['max_requests'],
+            'max_requests_jitter': server['max_requests'] // 10,
+            'preload_app': True,
+            'post_fork': lambda _, __: WsgiServer.__call_all(post_fork),
+            'worker_exit': lambda _, __: WsgiServer.__call_all(worker_exit),
+        }).run()
+
+    @staticmethod
+    def __call_all(functions: Sequence[Callable[[], None]]) -> None:
+        """ Calls a sequence of hook functions.
+
+        Args:
+            - functions (Sequence[Callable[[], None]]): The functions to call.
+        """
+        for function in functions:
+            function()
@@ -38,6 +38,11 @@ class FrontendConfiguration(ServiceConfiguration):
             'port': 5000,
             'apikey_secret': 'This is another frontend API key'
         })
+        self.set_token_refresh_window(300)
+        self.set_fan_out({
+            'workers': 8,
+            'timeout': 15
+        })
 
     def _set_values(self, values: Dict) -> None:
         """Sets/merges a collection of configuration values.
@@ -53,6 +58,10 @@ class FrontendConfiguration(ServiceConfiguration):
             self.set_auth_service(values['auth_service'])
         if 'backend_service' in values:
             self.set_backend_service(values['backend_service'])
+        if 'token_refresh_window' in values:
+            self.set_token_refresh_window(values['token_refresh_window'])
+        if 'fan_out' in values:
+            self.set_fan_out({**self.get_fan_out(), **values['fan_out']})
 
     def set_app_secret_key(self, app_secret_key: str) -> None:
         """ Sets the app_secret_key configuration value.
@@ -113,3 +122,52 @@ class FrontendConfiguration(ServiceConfiguration):
         """
 
         return self._values['backend_service']
+
+    def set_fan_out(self, fan_out: Dict) -> None:
+        """ Sets how independent backend requests of a page are issued concurrently.
+
+        Args:
+            - fan_out (Dict): A dictionary with the maximum number of requests running at the
+              same time (`workers`) and the seconds each request is waited for (`timeout`).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if not isinstance(fan_out, dict):
+            raise ValueError('The fan-out settings must be a dictionary.')
+        if int(fan_out.get('workers', 0)) < 1:
+            raise ValueError('The fan-out workers must be a positive number.')
+        if float(fan_out.get('timeout', 0)) <= 0:
+            raise ValueError('The fan-out timeout must be a positive number.')
+        self._values['fan_out'] = fan_out
+
+    def get_fan_out(self) -> Dict:
+        """ Gets how independent backend requests of a page are issued concurrently.
+
+        Returns:
+            - Dict: A dictionary with the `workers` and `timeout` values.
+        """
+
+        return self._values['fan_out']
+
+    def set_token_refresh_window(self, seconds: float) -> None:
+        """ Sets how long before its expiration the user session token is refreshed.
+
+        Args:
+            - seconds (float): The refresh window length, in seconds.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if float(seconds) < 0:
+            raise ValueError('The token refresh window cannot be negative.')
+        self._values['token_refresh_window'] = float(seconds)
+
+    def get_token_refresh_window(self) -> float:
+        """ Gets how long before its expiration the user session token is refreshed.
+
+        Returns:
+            - float: The refresh window length, in seconds.
+        """
+
+        return float(self._values['token_refresh_window'])
@@ -1,13 +1,13 @@
 """ AuthService class module.
 """
 
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 import requests
 from dms2223common.data import Role
-from dms2223common.data.rest import ResponseData
+from dms2223common.data.rest import ResponseData, RestClient
 
 
-class AuthService():
+class AuthService(RestClient):
     """ REST client to connect to the authentication service.
     """
 
@@ -15,7 +15,8 @@ class AuthService():
                  host: str, port: int,
                  api_base_path: str = '/api/v1',
                  apikey_header: str = 'X-ApiKey-Auth',
-                 apikey_secret: str = ''
+                 apikey_secret: str = '',
+                 **kwargs
                  ):
         """ Constructor method.
 
@@ -27,20 +28,11 @@ class AuthService():
             - api_base_path (str): The base path that is prepended to every request's path.
             - apikey_header (str): Name of the header with the API key that identifies this client.
             - apikey_secret (str): The API key that identifies this client.
+            - **kwargs: The connection tuning parameters accepted by `RestClient` (timeouts,
+              retries, backoff and pool size).
         """
-        self.__host: str = host
-        self.__port: int = port
-        self.__api_base_path: str = api_base_path
-        self.__apikey_header: str = apikey_header
-        self.__apikey_secret: str = apikey_secret
-
-    def __base_url(self) -> str:
-        """ Constructs the base URL for the requests.
-
-        Returns:
-            - str: The base URL.
-        """
-        return f'http://{self.__host}:{self.__port}{self.__api_base_path}'
+        RestClient.__init__(
+            self, host, port, api_base_path, apikey_header, apikey_secret, **kwargs)
 
     def login(self, username: str, password: str) -> ResponseData:
         """ Performs a login request to the authentication service.
@@ -52,13 +44,9 @@ class AuthService():
         Returns:
             - ResponseData: If successful, the contents hold a string with the user session token.
         """
-        response: requests.Response = requests.post(
-            self.__base_url() + '/auth',
-            auth=(username, password),
-            headers={
-                self.__apikey_header: self.__apikey_secret
-            },
-            timeout=60
+        response: requests.Response = self._request(
+            'POST', '/auth',
+            auth=(username, password)
         )
         response_data: ResponseData = ResponseData()
         response_data.set_successful(response.ok)
@@ -83,13 +71,8 @@ class AuthService():
             response_data.set_successful(False)
             return response_data
 
-        response: requests.Response = requests.post(
-            self.__base_url() + '/auth',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            },
-            timeout=60
+        response: requests.Response = self._request(
+            'POST', '/auth', token
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
@@ -98,31 +81,67 @@ class AuthService():
             response_data.add_message('Session expired')
         return response_data
 
-    def list_users(self, token: Optional[str]) -> ResponseData:
-        """ Requests a list of registered users.
+    def get_token_owner(self, token: str) -> ResponseData:
+        """ Validates a user session token against the authentication service.
+
+        Args:
+            - token (str): The user session token to validate.
+
+        Returns:
+            - ResponseData: If successful, the contents hold a dictionary with the name of the
+              token owner (key `username`), its current roles (key `roles`) and its current
+              token version (key `ver`). Otherwise, the token was rejected.
+        """
+        response: requests.Response = self._request('GET', '/auth', token)
+        response_data: ResponseData = ResponseData()
+        response_data.set_successful(response.ok)
+        if response_data.is_successful():
+            response_data.set_content(response.json())
+        else:
+            response_data.add_message('Session expired')
+        return response_data
+
+    def list_users(self, token: Optional[str],
+                   limit: Optional[int] = None,
+                   after: Optional[str] = None,
+                   prefix: Optional[str] = None,
+                   with_roles: bool = False) -> ResponseData:
+        """ Requests a page of registered users.
 
         Args:
-            token (Optional[str]): The user session token.
+            - token (Optional[str]): The user session token.
+            - limit (Optional[int]): The maximum number of users in the page. If not given, the
+              service default is used.
+            - after (Optional[str]): The cursor of the page to fetch. If not given, the first
+              page is fetched.
+            - prefix (Optional[str]): If given, only the users whose name starts with it.
+            - with_roles (bool): Whether to include the role names of each user.
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of user data dictionaries.
-              Otherwise, the contents will be an empty list.
+            - ResponseData: If successful, the contents hold a dictionary with the list of user
+              data dictionaries (key `users`) and the cursor of the next page (key
+              `next_cursor`, `None` on the last page). Otherwise, the list will be empty.
         """
+        params: Dict = {}
+        if limit is not None:
+            params['limit'] = limit
+        if after is not None:
+            params['after'] = after
+        if prefix:
+            params['prefix'] = prefix
+        if with_roles:
+            params['with_roles'] = 'true'
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + '/users',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            },
-            timeout=60
+        response: requests.Response = self._request(
+            'GET', '/users', token,
+            params=params
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
             response_data.set_content(response.json())
         else:
             response_data.add_message(response.content.decode('ascii'))
-            response_data.set_content([])
+            response_data.set_content({'users': [], 'next_cursor': None})
         return response_data
 
     def create_user(self, token: Optional[str], username: str, password: str) -> ResponseData:
@@ -137,17 +156,12 @@ class AuthService():
             - ResponseData: If successful, the contents hold the new user's data.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + '/users',
+        response: requests.Response = self._request(
+            'POST', '/users', token,
             json={
                 'username': username,
                 'password': password
-            },
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            },
-            timeout=60
+            }
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
@@ -168,13 +182,8 @@ class AuthService():
               empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/users/{username}/roles',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            },
-            timeout=60
+        response: requests.Response = self._request(
+            'GET', '/users/{username}/roles', token, {'username': username}
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
@@ -200,13 +209,8 @@ class AuthService():
         if isinstance(role, Role):
             role = role.name
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + f'/users/{username}/roles/{role}',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            },
-            timeout=60
+        response: requests.Response = self._request(
+            'POST', '/users/{username}/roles/{role}', token, {'username': username, 'role': role}
         )
         response_data.set_successful(response.ok)
         if not response_data.is_successful():
@@ -229,13 +233,8 @@ class AuthService():
         if isinstance(role, Role):
             role = role.name
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.delete(
-            self.__base_url() + f'/users/{username}/roles/{role}',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            },
-            timeout=60
+        response: requests.Response = self._request(
+            'DELETE', '/users/{username}/roles/{role}', token, {'username': username, 'role': role}
         )
         response_data.set_successful(response.ok)
         if not response_data.is_successful():
@@ -247,9 +246,8 @@ class AuthService():
                           ) -> ResponseData:
         """ Requests to update several roles on a user at once.
 
-        This is an utility method. If at least one of them fails, all of them are considered failed,
-        though some of the changes may have taken effect. The messages should describe the failure
-        reasons.
+        The whole role set is replaced in a single request and transaction, so either all the
+        changes take effect or none of them do.
 
         Args:
             - token (Optional[str]): The user session token.
@@ -258,17 +256,17 @@ class AuthService():
               otherwise, they will be revoked.
 
         Returns:
-            - ResponseData: Useful to know whether the operation succeeded and its messages.
+            - ResponseData: Useful to know whether the operation succeeded and its messages. If
+              successful, the contents hold the resulting list of role names.
         """
-        aggregated_response: ResponseData = ResponseData()
-        aggregated_response.set_successful(True)
-        for role in Role:
-            response: ResponseData
-            if role.name in new_roles:
-                response = self.grant_user_role(token, username, role)
-            else:
-                response = self.revoke_user_role(token, username, role)
-            aggregated_response.add_messages(response.get_messages())
-            aggregated_response.set_successful(
-                aggregated_response.is_successful() & response.is_successful())
-        return aggregated_response
+        response_data: ResponseData = ResponseData()
+        response: requests.Response = self._request(
+            'PUT', '/users/{username}/roles', token, {'username': username},
+            json=[role.name if isinstance(role, Role) else role for role in new_roles]
+        )
+        response_data.set_successful(response.ok)
+        if response_data.is_successful():
+            response_data.set_content(response.json())
+        else:
+            response_data.add_message(response.content.decode('ascii'))
+        return response_data
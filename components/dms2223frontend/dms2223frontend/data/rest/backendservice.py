@@ -1,11 +1,11 @@
 """ BackendService class module.
 """
-from typing import Optional
+from typing import Dict, Optional
 import requests
-from dms2223common.data.rest import ResponseData
+from dms2223common.data.rest import ResponseData, RestClient
 
 
-class BackendService():
+class BackendService(RestClient):
     """ REST client to connect to the backend service.
     """
 
@@ -13,7 +13,8 @@ class BackendService():
                  host: str, port: int,
                  api_base_path: str = '/api/v1',
                  apikey_header: str = 'X-ApiKey-Backend',
-                 apikey_secret: str = ''
+                 apikey_secret: str = '',
+                 **kwargs
                  ):
         """ 
         Constructor method.
@@ -25,40 +26,45 @@ class BackendService():
             - api_base_path (str): The base path that is prepended to every request's path.
             - apikey_header (str): Name of the header with the API key that identifies this client.
             - apikey_secret (str): The API key that identifies this client.
+            - **kwargs: The connection tuning parameters accepted by `RestClient` (timeouts,
+              retries, backoff and pool size).
         """
-        self.__host: str = host
-        self.__port: int = port
-        self.__api_base_path: str = api_base_path
-        self.__apikey_header: str = apikey_header
-        self.__apikey_secret: str = apikey_secret
+        RestClient.__init__(
+            self, host, port, api_base_path, apikey_header, apikey_secret, **kwargs)
 
-    def __base_url(self) -> str:
-        return f'http://{self.__host}:{self.__port}{self.__api_base_path}'
-
-    def list_discussions(self, token: Optional[str]) -> ResponseData:
-        """ Requests a list of registered questions.
+    def list_discussions(self, token: Optional[str],
+                         limit: Optional[int] = None,
+                         after: Optional[int] = None) -> ResponseData:
+        """ Requests a page of registered questions.
 
         Args:
-            token (Optional[str]): The question session token.
+            - token (Optional[str]): The question session token.
+            - limit (Optional[int]): The maximum number of questions in the page. If not given,
+              the backend default is used.
+            - after (Optional[int]): The cursor of the page to fetch. If not given, the first
+              page is fetched.
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of user data dictionaries.
-              Otherwise, the contents will be an empty list.
+            - ResponseData: If successful, the contents hold a dictionary with the list of
+              question data dictionaries (key `discussions`) and the cursor of the next page
+              (key `next_cursor`, `None` on the last page). Otherwise, the list will be empty.
         """
+        params: Dict = {}
+        if limit is not None:
+            params['limit'] = limit
+        if after is not None:
+            params['after'] = after
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + '/discussions',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
+        response: requests.Response = self._request(
+            'GET', '/discussions', token,
+            params=params
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
             response_data.set_content(response.json())
         else:
             response_data.add_message(response.content.decode('ascii'))
-            response_data.set_content([])
+            response_data.set_content({'discussions': [], 'next_cursor': None})
         return response_data
 
     def create_report(self, token: Optional[str],
@@ -76,14 +82,10 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + f'/discussions/{id}/reports',
+        response: requests.Response = self._request(
+            'POST', '/discussions/{id}/reports', token, {'id': id},
             json={
                 'reason': reason
-            },
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
             }
         )
         response_data.set_successful(response.ok)
@@ -107,14 +109,10 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + f'/comments/{id}/reports',
+        response: requests.Response = self._request(
+            'POST', '/comments/{id}/reports', token, {'id': id},
             json={
                 'reason': reason
-            },
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
             }
         )
         response_data.set_successful(response.ok)
@@ -138,14 +136,10 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + f'/answers/{id}/reports',
+        response: requests.Response = self._request(
+            'POST', '/answers/{id}/reports', token, {'id': id},
             json={
                 'reason': reason
-            },
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
             }
         )
         response_data.set_successful(response.ok)
@@ -167,15 +161,11 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + '/discussions',
+        response: requests.Response = self._request(
+            'POST', '/discussions', token,
             json={
                 'title': title,
                 'content': content
-            },
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
             }
         )
         response_data.set_successful(response.ok)
@@ -187,12 +177,8 @@ class BackendService():
 
     def get_discussion(self, token: Optional[str], id: int) -> ResponseData:
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/discussions/{id}',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
+        response: requests.Response = self._request(
+            'GET', '/discussions/{id}', token, {'id': id}
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
@@ -202,31 +188,78 @@ class BackendService():
             response_data.set_content([])
         return response_data
 
-    def list_answers(self, token: Optional[str], id: int) -> ResponseData:
-        """ Requests a list of registered questions.
+    def get_thread(self, token: Optional[str], id: int,
+                   limit: Optional[int] = None,
+                   after: Optional[int] = None) -> ResponseData:
+        """ Requests a question with a page of its answers and their first comments.
 
         Args:
-            token (Optional[str]): The question session token.
+            - token (Optional[str]): The question session token.
+            - id (int): The question id.
+            - limit (Optional[int]): The maximum number of answers in the page. If not given,
+              the backend default is used.
+            - after (Optional[int]): The cursor of the answers page to fetch. If not given,
+              the first page is fetched.
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of user data dictionaries.
-              Otherwise, the contents will be an empty list.
+            - ResponseData: If successful, the contents hold the question data dictionary with
+              the list of answer data dictionaries (key `answers`, each one with its first
+              comments under `comments` and the cursor of its next comments page under
+              `comments_next_cursor`) and the cursor of the next answers page (key
+              `next_cursor`).
+              Otherwise, the contents will be `None`.
         """
-        # post para recibir de la discusion adecuada
+        params: Dict = {}
+        if limit is not None:
+            params['limit'] = limit
+        if after is not None:
+            params['after'] = after
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/discussions/{id}/answers',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
+        response: requests.Response = self._request(
+            'GET', '/discussions/{id}/thread', token, {'id': id},
+            params=params
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
             response_data.set_content(response.json())
         else:
             response_data.add_message(response.content.decode('ascii'))
-            response_data.set_content([])
+        return response_data
+
+    def list_answers(self, token: Optional[str], id: int,
+                     limit: Optional[int] = None,
+                     after: Optional[int] = None) -> ResponseData:
+        """ Requests a page of the answers of a question.
+
+        Args:
+            - token (Optional[str]): The question session token.
+            - id (int): The question id.
+            - limit (Optional[int]): The maximum number of answers in the page. If not given,
+              the backend default is used.
+            - after (Optional[int]): The cursor of the page to fetch. If not given, the first
+              page is fetched.
+
+        Returns:
+            - ResponseData: If successful, the contents hold a dictionary with the list of
+              answer data dictionaries (key `answers`) and the cursor of the next page
+              (key `next_cursor`, `None` on the last page). Otherwise, the list will be empty.
+        """
+        params: Dict = {}
+        if limit is not None:
+            params['limit'] = limit
+        if after is not None:
+            params['after'] = after
+        response_data: ResponseData = ResponseData()
+        response: requests.Response = self._request(
+            'GET', '/discussions/{id}/answers', token, {'id': id},
+            params=params
+        )
+        response_data.set_successful(response.ok)
+        if response_data.is_successful():
+            response_data.set_content(response.json())
+        else:
+            response_data.add_message(response.content.decode('ascii'))
+            response_data.set_content({'answers': [], 'next_cursor': None})
         return response_data
 
     def create_answer(self, token: Optional[str], discussionid: int, content: str) -> ResponseData:
@@ -242,15 +275,11 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + f'/discussions/{discussionid}/answers',
+        response: requests.Response = self._request(
+            'POST', '/discussions/{discussionid}/answers', token, {'discussionid': discussionid},
             json={
                 'discussionid': discussionid,
                 'content': content
-            },
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
             }
         )
         response_data.set_successful(response.ok)
@@ -262,12 +291,8 @@ class BackendService():
 
     def get_answer(self, token: Optional[str], answerid: int) -> ResponseData:
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/discussions/{answerid}/answers',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
+        response: requests.Response = self._request(
+            'GET', '/discussions/{answerid}/answers', token, {'answerid': answerid}
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
@@ -277,31 +302,40 @@ class BackendService():
             response_data.set_content([])
         return response_data
 
-    def list_comments(self, token: Optional[str], id: int) -> ResponseData:
-        """ Requests a list of registered questions.
+    def list_comments(self, token: Optional[str], answerid: int,
+                      limit: Optional[int] = None,
+                      after: Optional[int] = None) -> ResponseData:
+        """ Requests a page of the comments of an answer.
 
         Args:
-            token (Optional[str]): The question session token.
+            - token (Optional[str]): The question session token.
+            - answerid (int): The answer id.
+            - limit (Optional[int]): The maximum number of comments in the page. If not given,
+              the backend default is used.
+            - after (Optional[int]): The cursor of the page to fetch. If not given, the first
+              page is fetched.
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of user data dictionaries.
-              Otherwise, the contents will be an empty list.
+            - ResponseData: If successful, the contents hold a dictionary with the list of
+              comment data dictionaries (key `comments`) and the cursor of the next page
+              (key `next_cursor`, `None` on the last page). Otherwise, the list will be empty.
         """
-
+        params: Dict = {}
+        if limit is not None:
+            params['limit'] = limit
+        if after is not None:
+            params['after'] = after
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/answers/{id}/comments',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
+        response: requests.Response = self._request(
+            'GET', '/answers/{answerid}/comments', token, {'answerid': answerid},
+            params=params
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
             response_data.set_content(response.json())
         else:
             response_data.add_message(response.content.decode('ascii'))
-            response_data.set_content([])
+            response_data.set_content({'comments': [], 'next_cursor': None})
         return response_data
 
     def create_comment(self, token: Optional[str],
@@ -320,16 +354,12 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + f'/answers/{answerid}/comments',
+        response: requests.Response = self._request(
+            'POST', '/answers/{answerid}/comments', token, {'answerid': answerid},
             json={
                 'discussionid': discussionid,
                 'answerid': answerid,
                 'content': content
-            },
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
             }
         )
         response_data.set_successful(response.ok)
@@ -341,12 +371,8 @@ class BackendService():
 
     def get_comment(self, token: Optional[str], id: int) -> ResponseData:
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/answers/{id}/comments',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
+        response: requests.Response = self._request(
+            'GET', '/answers/{id}/comments', token, {'id': id}
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
@@ -367,12 +393,8 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/discussions/reports',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
+        response: requests.Response = self._request(
+            'GET', '/discussions/reports', token
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
@@ -393,12 +415,8 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/answers/reports',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
+        response: requests.Response = self._request(
+            'GET', '/answers/reports', token
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
@@ -419,12 +437,8 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/comments/reports',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
+        response: requests.Response = self._request(
+            'GET', '/comments/reports', token
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
@@ -436,12 +450,8 @@ class BackendService():
 
     def get_report(self, token: Optional[str], id: int) -> ResponseData:
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/answers/{id}/comments',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
+        response: requests.Response = self._request(
+            'GET', '/answers/{id}/comments', token, {'id': id}
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
@@ -4,6 +4,7 @@
 from .webauth import WebAuth
 from .webuser import WebUser
 from .webutils import WebUtils
+from .webfanout import WebFanOut
 from .webquestion import WebQuestion
 from .webanswer import WebAnswer
 from .webcomment import WebComment
@@ -45,8 +45,11 @@ class AdminEndpoints():
         if Role.ADMINISTRATION.name not in session['roles']:
             return redirect(url_for('get_home'))
         name = session['user']
+        after = request.args.get('after', default=None, type=str)
+        prefix = request.args.get('prefix', default='', type=str)
+        users, next_cursor = WebUser.list_users(auth_service, after, prefix)
         return render_template('admin/users.html', name=name, roles=session['roles'],
-                               users=WebUser.list_users(auth_service)
+                               users=users, after=after, prefix=prefix, next_cursor=next_cursor
                                )
 
     @staticmethod
@@ -140,7 +143,9 @@ class AdminEndpoints():
                                                 request.form['username'],
                                                 request.form.getlist('roles')
                                                 )
-        session['roles'] = WebUser.get_roles(auth_service, session['user'])
+        if request.form['username'] == session['user']:
+            # The roles are embedded in the token; a new one holds the updated roles
+            WebAuth.refresh_token(auth_service)
         redirect_to = request.form['redirect_to']
         if not redirect_to:
             redirect_to = url_for('get_admin_users')
@@ -1,8 +1,8 @@
 """ DiscussionEndpoints class module.
 """
 
-from typing import Text, Union
-from flask import redirect, url_for, session, render_template, request, flash
+from typing import Dict, Optional, Text, Union
+from flask import abort, redirect, url_for, session, render_template, request, flash
 from werkzeug.wrappers import Response
 from dms2223common.data import Role
 from dms2223frontend.data.rest.backendservice import BackendService
@@ -52,9 +52,11 @@ class DiscussionEndpoints():
         if Role.DISCUSSION.name not in session['roles']:
             return redirect(url_for('get_home'))
         name = session['user']
+        after = request.args.get('after', default=None, type=int)
+        discussions, next_cursor = WebQuestion.list_discussions(backend_service, after)
 
         return render_template('discussion/discussions.html', name=name, roles=session['roles'],
-                               discussions=WebQuestion.list_discussions(backend_service))
+                               discussions=discussions, after=after, next_cursor=next_cursor)
 
     @staticmethod
     def get_discussion_discussions_new(auth_service: AuthService, backend_service: BackendService) \
@@ -129,15 +131,18 @@ class DiscussionEndpoints():
             'redirect_to', default='/discussion/discussions')
         id: int = int(str(request.args.get('discussionid')))
         # answerid: int = int(str(request.args.get('answerid')))
+        after = request.args.get('after', default=None, type=int)
+        commentsof = request.args.get('commentsof', default=None, type=int)
+        comments_after = request.args.get('comments_after', default=None, type=int)
+        discussion, answers, comments, next_cursor, comments_next = WebQuestion.get_thread(
+            backend_service, id, after, commentsof, comments_after)
 
         return render_template('discussion/discussions/view.html',
                                name=name, roles=session['roles'],
                                redirect_to=redirect_to,
-                               discussion=WebQuestion.get_discussion(
-                                   backend_service, id),
-                               answers=WebAnswer.list_answers(
-                                   backend_service, id),
-                               comments=WebComment.list_comments(backend_service, id))
+                               discussion=discussion,
+                               answers=answers, after=after, next_cursor=next_cursor,
+                               comments=comments, comments_next=comments_next)
 
     @staticmethod
     def post_discussion_discussions_view(auth_service: AuthService,
@@ -243,13 +248,16 @@ class DiscussionEndpoints():
         answerid: int = int(str(request.args.get('answerid')))
         redirect_to = request.args.get(
             'redirect_to', default='/discussion/discussions/view')
+        answer: Optional[Dict] = WebAnswer.get_answer(backend_service, discussionid, answerid)
+        if answer is None:
+            abort(404)
         return render_template('discussion/discussions/comment.html',
                                name=name, roles=session['roles'],
                                answerid=answerid, discussionid=discussionid,
                                redirect_to=redirect_to,
                                discussion=WebQuestion.get_discussion(
                                    backend_service, discussionid),
-                               answers=WebAnswer.list_answers(backend_service, discussionid))
+                               answers=[answer])
 
     @staticmethod
     def post_discussion_discussions_comment(auth_service: AuthService,
@@ -373,13 +381,16 @@ class DiscussionEndpoints():
         discussionid: int = int(str(request.args.get('discussionid')))
         redirect_to = request.args.get(
             'redirect_to', default='/discussion/discussions/view')
+        answer: Optional[Dict] = WebAnswer.get_answer(backend_service, discussionid, answerid)
+        if answer is None:
+            abort(404)
         return render_template('discussion/discussions/reportanswer.html',
                                name=name,
                                roles=session['roles'],
                                redirect_to=redirect_to,
                                discussionid=discussionid,
                                answerid=answerid,
-                               answers=WebAnswer.list_answers(backend_service, discussionid))
+                               answers=[answer])
 
     @staticmethod
     def get_discussion_discussions_reportcomment(auth_service: AuthService,
@@ -400,17 +411,18 @@ class DiscussionEndpoints():
         name = session['user']
         answerid: int = int(str(request.args.get('answerid')))
         commentid: int = int(str(request.args.get('commentid')))
-        discussionid: int = int(str(request.args.get('discussionid')))
         redirect_to = request.args.get(
             'redirect_to', default='/discussion/discussions/view')
-
+        comment: Optional[Dict] = WebComment.get_comment(backend_service, answerid, commentid)
+        if comment is None:
+            abort(404)
         return render_template('discussion/discussions/reportcomment.html',
                                name=name,
                                roles=session['roles'],
                                answerid=answerid,
                                redirect_to=redirect_to,
                                commentid=commentid,
-                               comments=WebComment.list_comments(backend_service, discussionid))
+                               comments=[comment])
 
     def post_discussion_discussions_reportcomment(auth_service: AuthService,
                                                   backend_service: BackendService) -> Union[
@@ -8,9 +8,8 @@ from dms2223common.data import Role
 from dms2223frontend.data.rest.authservice import AuthService
 from dms2223frontend.data.rest.backendservice import BackendService
 from .webauth import WebAuth
+from .webfanout import WebFanOut
 from .webquestion import WebQuestion
-from .webanswer import WebAnswer
-from .webcomment import WebComment
 
 
 class ModeratorEndpoints():
@@ -50,15 +49,18 @@ class ModeratorEndpoints():
         if Role.MODERATION.name not in session['roles']:
             return redirect(url_for('get_home'))
         name = session['user']
+        reports, reportsanswer, reportscomment = WebFanOut.gather([
+            (lambda: WebQuestion.list_reports(backend_service), []),
+            (lambda: WebQuestion.list_reports_answer(backend_service), []),
+            (lambda: WebQuestion.list_reports_comments(backend_service), [])
+        ])
 
         return render_template('moderator/reports.html',
                                name=name,
                                roles=session['roles'],
-                               reports=WebQuestion.list_reports(backend_service),
-                               reportsanswer=WebQuestion.list_reports_answer(
-                                   backend_service,),
-                               reportscomment=WebQuestion.list_reports_comments(
-                                   backend_service)
+                               reports=reports,
+                               reportsanswer=reportsanswer,
+                               reportscomment=reportscomment
                                )
 
     @staticmethod
@@ -102,10 +104,12 @@ class ModeratorEndpoints():
         if Role.MODERATION.name not in session['roles']:
             return redirect(url_for('get_home'))
         name = session['user']
+        after = request.args.get('after', default=None, type=int)
+        discussions, next_cursor = WebQuestion.list_discussions(backend_services, after)
         return render_template('moderator/discussions.html',
                                name=name,
                                roles=session['roles'],
-                               discussions=WebQuestion.list_discussions(backend_services))
+                               discussions=discussions, after=after, next_cursor=next_cursor)
 
     @staticmethod
     def get_moderator_discussions_view(auth_service: AuthService,
@@ -127,13 +131,18 @@ class ModeratorEndpoints():
         redirect_to = request.args.get(
             'redirect_to', default='/moderator/discussions')
         id: int = int(str(request.args.get('discussionid')))
+        after = request.args.get('after', default=None, type=int)
+        commentsof = request.args.get('commentsof', default=None, type=int)
+        comments_after = request.args.get('comments_after', default=None, type=int)
+        discussion, answers, comments, next_cursor, comments_next = WebQuestion.get_thread(
+            backend_service, id, after, commentsof, comments_after)
 
         return render_template('moderator/discussions/view.html',
                                name=name, roles=session['roles'],
                                redirect_to=redirect_to,
-                               discussion=WebQuestion.get_discussion(backend_service, id),
-                               answers=WebAnswer.list_answers(backend_service, id),
-                               comments=WebComment.list_comments(backend_service, id))
+                               discussion=discussion,
+                               answers=answers, after=after, next_cursor=next_cursor,
+                               comments=comments, comments_next=comments_next)
 
     @staticmethod
     def get_moderator_resolution_report(auth_service: AuthService) -> Union[Response, Text]:
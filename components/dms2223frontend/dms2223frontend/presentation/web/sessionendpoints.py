@@ -7,7 +7,6 @@ from werkzeug.wrappers import Response
 from dms2223common.data.rest import ResponseData
 from dms2223frontend.data.rest import AuthService
 from .webauth import WebAuth
-from .webuser import WebUser
 from .webutils import WebUtils
 
 
@@ -45,8 +44,7 @@ class SessionEndpoints():
             return redirect(url_for('get_login'))
 
         session['user'] = request.form['user']
-        session['token'] = response.get_content()
-        session['roles'] = WebUser.get_roles(auth_service, session['user'])
+        WebAuth.set_session_token(response.get_content())
         return redirect(url_for('get_home'))
 
     @staticmethod
@@ -1,7 +1,7 @@
 """ WebQuestion class module.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from flask import session
 from dms2223common.data.rest import ResponseData
 from dms2223frontend.data.rest.backendservice import BackendService
@@ -12,21 +12,28 @@ class WebAnswer():
     """ Monostate class responsible of the user operation utilities.
     """
     @staticmethod
-    def list_answers(backend_service: BackendService, id: int) -> Optional[List]:
-        """ Gets the list of discussions from the backend service.
+    def list_answers(backend_service: BackendService, id: int,
+                     after: Optional[int] = None,
+                     limit: Optional[int] = None) -> Tuple[List, Optional[int]]:
+        """ Gets a page of the answers of a discussion from the backend service.
 
         Args:
             - backend_service (BackendService): The backend service.
+            - id (int): The discussion id.
+            - after (Optional[int]): The cursor of the page to fetch (`None` for the first one).
+            - limit (Optional[int]): The page size (`None` for the backend default).
 
         Returns:
-            - List: A list of user data dictionaries (the list may be empty)
+            - Tuple[List, Optional[int]]: A list of answer data dictionaries (the list may
+              be empty) and the cursor of the next page (`None` if there are no more pages).
         """
         response: ResponseData = backend_service.list_answers(
-            session.get('token'), id)
+            session.get('token'), id, limit=limit, after=after)
         WebUtils.flash_response_messages(response)
-        if response.get_content() is not None and isinstance(response.get_content(), list):
-            return list(response.get_content())
-        return []
+        content = response.get_content()
+        if content is not None and isinstance(content, dict):
+            return (list(content.get('answers', [])), content.get('next_cursor'))
+        return ([], None)
 
     @staticmethod
     def create_answer(backend_service: BackendService,
@@ -49,8 +56,21 @@ class WebAnswer():
         return response.get_content()
 
     @staticmethod
-    def get_answer(backend_service: BackendService, answerid: int) -> Optional[Dict]:
-        response: ResponseData = backend_service.get_answer(
-            session.get('token'), answerid)
-        WebUtils.flash_response_messages(response)
-        return response.get_content()
+    def get_answer(backend_service: BackendService, discussionid: int,
+                   answerid: int) -> Optional[Dict]:
+        """ Gets an answer of a discussion from the backend service.
+
+        Args:
+            - backend_service (BackendService): The backend service.
+            - discussionid (int): The discussion id.
+            - answerid (int): The answer id.
+
+        Returns:
+            - Optional[Dict]: The answer data, or `None` if the discussion has no answer
+              with that id.
+        """
+        answers: List = WebAnswer.list_answers(
+            backend_service, discussionid, after=answerid - 1, limit=1)[0]
+        if not answers or answers[0].get('id') != answerid:
+            return None
+        return answers[0]
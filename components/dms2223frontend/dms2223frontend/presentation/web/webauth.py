@@ -1,7 +1,14 @@
 """ WebAuth class module.
 """
 
-from flask import session
+import base64
+import binascii
+import json
+import time
+from typing import Dict, Optional
+import requests
+from flask import flash, session
+from dms2223common.data.cache import TokenVersions
 from dms2223common.data.rest import ResponseData
 from dms2223frontend.data.rest import AuthService
 from .webutils import WebUtils
@@ -9,11 +16,27 @@ from .webutils import WebUtils
 class WebAuth():
     """ Monostate class responsible of the authentication operation utilities.
     """
+
+    __refresh_window: float = 300.0
+
+    @staticmethod
+    def configure(refresh_window: float) -> None:
+        """ Sets how long before its expiration the session token is refreshed.
+
+        Args:
+            - refresh_window (float): Seconds before the token expiration in which page views
+              refresh it against the authentication service.
+        """
+        WebAuth.__refresh_window = refresh_window
+
     @staticmethod
     def test_token(auth_service: AuthService) -> bool:
-        """ Tests whether the session token is valid or not against the authentication service.
+        """ Tests whether the session token is valid or not.
 
-        If the token is valid, the session token is updated/refreshed.
+        The token expiration is checked locally; the session cookie is signed, so its
+        contents can be trusted. The token is refreshed against the authentication service,
+        reloading the user roles from the new token, when it is about to expire or when it
+        is outdated (the user roles changed after it was issued; see `TokenVersions`).
 
         Args:
             - auth_service (AuthService): The authentication service.
@@ -21,10 +44,100 @@ class WebAuth():
         Returns:
             - bool: Whether the token is valid (`True`) or not.
         """
-        response: ResponseData = auth_service.auth(session.get('token'))
+        token: Optional[str] = session.get('token')
+        claims: Optional[Dict] = WebAuth.__token_claims(token)
+        if claims is None or time.time() > claims['exp']:
+            if token:
+                flash('Session expired', 'error')
+            return False
+        if claims['exp'] - time.time() > WebAuth.__refresh_window \
+                and not WebAuth.__is_outdated(auth_service, str(token), claims):
+            return True
+        return WebAuth.refresh_token(auth_service)
+
+    @staticmethod
+    def __is_outdated(auth_service: AuthService, token: str, claims: Dict) -> bool:
+        """ Tests whether the session token embeds outdated user roles.
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+            - token (str): The session token.
+            - claims (Dict): The session token claims.
+
+        Returns:
+            - bool: Whether the token must be refreshed (`True`) or not.
+        """
+        def current_version() -> int:
+            response: ResponseData = auth_service.get_token_owner(token)
+            if not response.is_successful():
+                raise LookupError('The session token was rejected')
+            return int(response.get_content().get('ver') or 0)
+
+        try:
+            return TokenVersions.is_outdated(claims, current_version)
+        except LookupError:
+            # Refreshing the rejected token ends the session
+            return True
+        except requests.RequestException:
+            # The authentication service is slow or unreachable; the backend checks it too
+            return False
+
+    @staticmethod
+    def refresh_token(auth_service: AuthService) -> bool:
+        """ Replaces the session token with a new one issued by the authentication service.
+
+        The user roles are updated with the role claims of the new token. The request is
+        bounded by the connection and read timeouts of the authentication service client.
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+
+        Returns:
+            - bool: Whether the session is still valid (`True`) or not.
+        """
+        token: Optional[str] = session.get('token')
+        try:
+            response: ResponseData = auth_service.auth(token)
+        except requests.RequestException:
+            # The authentication service is slow or unreachable; the current token is still valid
+            return True
         WebUtils.flash_response_messages(response)
         if not response.is_successful():
             return False
-
-        session['token'] = response.get_content()
+        WebAuth.set_session_token(response.get_content())
         return True
+
+    @staticmethod
+    def set_session_token(token: str) -> None:
+        """ Stores a user token in the session, together with the roles it embeds.
+
+        Args:
+            - token (str): The JWS user token issued by the authentication service.
+        """
+        claims: Dict = WebAuth.__token_claims(token) or {}
+        session['token'] = token
+        session['roles'] = list(claims.get('roles', []))
+
+    @staticmethod
+    def __token_claims(token: Optional[str]) -> Optional[Dict]:
+        """ Reads the claims of a JWS token.
+
+        The signature is not checked; tokens come from the authentication service or
+        from the signed session cookie.
+
+        Args:
+            - token (Optional[str]): The JWS token in compact serialization.
+
+        Returns:
+            - Optional[Dict]: The token claims, with the expiration timestamp (`exp`) as a
+              float, or `None` if they cannot be read.
+        """
+        if not token:
+            return None
+        try:
+            payload: str = token.split('.')[1]
+            claims: Dict = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+            claims['exp'] = float(claims['exp'])
+            return claims
+        except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+            return None
@@ -1,7 +1,7 @@
 """ WebQuestion class module.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from flask import session
 from dms2223common.data.rest import ResponseData
 from dms2223frontend.data.rest.backendservice import BackendService
@@ -12,21 +12,28 @@ class WebComment():
     """ Monostate class responsible of the user operation utilities.
     """
     @staticmethod
-    def list_comments(backend_service: BackendService, id: int) -> Optional[List]:
-        """ Gets the list of comments from the backend service.
+    def list_comments(backend_service: BackendService, answerid: int,
+                      after: Optional[int] = None,
+                      limit: Optional[int] = None) -> Tuple[List, Optional[int]]:
+        """ Gets a page of the comments of an answer from the backend service.
 
         Args:
             - backend_service (BackendService): The backend service.
+            - answerid (int): The answer id.
+            - after (Optional[int]): The cursor of the page to fetch (`None` for the first one).
+            - limit (Optional[int]): The page size (`None` for the backend default).
 
         Returns:
-            - List: A list of user data dictionaries (the list may be empty)
+            - Tuple[List, Optional[int]]: A list of comment data dictionaries (the list may
+              be empty) and the cursor of the next page (`None` if there are no more pages).
         """
         response: ResponseData = backend_service.list_comments(
-            session.get('token'), id)
+            session.get('token'), answerid, limit=limit, after=after)
         WebUtils.flash_response_messages(response)
-        if response.get_content() is not None and isinstance(response.get_content(), list):
-            return list(response.get_content())
-        return []
+        content = response.get_content()
+        if content is not None and isinstance(content, dict):
+            return (list(content.get('comments', [])), content.get('next_cursor'))
+        return ([], None)
 
     @staticmethod
     def create_comment(backend_service: BackendService,
@@ -50,8 +57,21 @@ class WebComment():
         return response.get_content()
 
     @staticmethod
-    def get_comment(backend_service: BackendService, id: int) -> Optional[Dict]:
-        response: ResponseData = backend_service.get_comment(
-            session.get('token'), id)
-        WebUtils.flash_response_messages(response)
-        return response.get_content()
+    def get_comment(backend_service: BackendService, answerid: int,
+                    commentid: int) -> Optional[Dict]:
+        """ Gets a comment of an answer from the backend service.
+
+        Args:
+            - backend_service (BackendService): The backend service.
+            - answerid (int): The answer id.
+            - commentid (int): The comment id.
+
+        Returns:
+            - Optional[Dict]: The comment data, or `None` if the answer has no comment
+              with that id.
+        """
+        comments: List = WebComment.list_comments(
+            backend_service, answerid, after=commentid - 1, limit=1)[0]
+        if not comments or comments[0].get('id') != commentid:
+            return None
+        return comments[0]
@@ -0,0 +1,75 @@
+""" WebFanOut class module.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import time
+from typing import Any, Callable, List, Sequence, Tuple
+from flask import copy_current_request_context, current_app, flash
+
+
+class WebFanOut():
+    """ Monostate class responsible of issuing independent backend requests concurrently.
+
+    The calls run in a bounded pool of threads within a copy of the current request
+    context, so they can use the session and flash messages as if they ran in the handler.
+    """
+
+    __timeout: float = 15.0
+    __executor: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=8, thread_name_prefix='dms2223frontend-fanout')
+
+    @staticmethod
+    def configure(workers: int, timeout: float) -> None:
+        """ Sets the size of the thread pool and the default per-call timeout.
+
+        Args:
+            - workers (int): Maximum number of calls running at the same time.
+            - timeout (float): Default seconds each call is waited for.
+        """
+        previous: ThreadPoolExecutor = WebFanOut.__executor
+        WebFanOut.__timeout = timeout
+        WebFanOut.__executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='dms2223frontend-fanout')
+        previous.shutdown(wait=False)
+
+    @staticmethod
+    def gather(calls: Sequence[Tuple[Callable[[], Any], Any]], timeout: float = 0) -> List[Any]:
+        """ Runs several independent calls concurrently and waits for all their results.
+
+        Must be called within a request context.
+
+        Args:
+            - calls (Sequence[Tuple[Callable[[], Any], Any]]): The calls, each one with the
+              value to use instead of its result if it does not finish in time or fails
+              (e.g., the service cannot be reached).
+            - timeout (float): Seconds each call is waited for, counted from the moment all
+              of them are issued. If not given, the configured timeout is used.
+
+        Returns:
+            - List[Any]: The results of the calls, in the same order.
+        """
+        deadline: float = time.monotonic() + (timeout or WebFanOut.__timeout)
+        futures: List[Future] = [
+            WebFanOut.__executor.submit(copy_current_request_context(call))
+            for call, _ in calls
+        ]
+        results: List[Any] = []
+        timed_out: bool = False
+        failed: bool = False
+        for future, (_, default) in zip(futures, calls):
+            try:
+                results.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except FutureTimeoutError:
+                future.cancel()
+                results.append(default)
+                timed_out = True
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                # A failed call leaves the page without its data, instead of failing it
+                current_app.logger.warning('Fanned out call failed: %s', ex)
+                results.append(default)
+                failed = True
+        if timed_out:
+            flash('Some data could not be retrieved in time. Please, try again later.', 'error')
+        elif failed:
+            flash('Some data could not be retrieved. Please, try again later.', 'error')
+        return results
@@ -1,10 +1,11 @@
 """ WebQuestion class module.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from flask import session
 from dms2223common.data.rest import ResponseData
 from dms2223frontend.data.rest.backendservice import BackendService
+from .webcomment import WebComment
 from .webutils import WebUtils
 
 
@@ -12,21 +13,25 @@ class WebQuestion():
     """ Monostate class responsible of the user operation utilities.
     """
     @staticmethod
-    def list_discussions(backend_service: BackendService) -> List:
-        """ Gets the list of discussions from the backend service.
+    def list_discussions(backend_service: BackendService,
+                         after: Optional[int] = None) -> Tuple[List, Optional[int]]:
+        """ Gets a page of discussions from the backend service.
 
         Args:
             - backend_service (BackendService): The backend service.
+            - after (Optional[int]): The cursor of the page to fetch (`None` for the first one).
 
         Returns:
-            - List: A list of user data dictionaries (the list may be empty)
+            - Tuple[List, Optional[int]]: A list of discussion data dictionaries (the list may
+              be empty) and the cursor of the next page (`None` if there are no more pages).
         """
         response: ResponseData = backend_service.list_discussions(
-            session.get('token'))
+            session.get('token'), after=after)
         WebUtils.flash_response_messages(response)
-        if response.get_content() is not None and isinstance(response.get_content(), list):
-            return list(response.get_content())
-        return []
+        content = response.get_content()
+        if content is not None and isinstance(content, dict):
+            return (list(content.get('discussions', [])), content.get('next_cursor'))
+        return ([], None)
 
     def create_report(backend_service: BackendService,
                       id: Optional[str],
@@ -110,6 +115,49 @@ class WebQuestion():
         WebUtils.flash_response_messages(response)
         return response.get_content()
 
+    @staticmethod
+    def get_thread(backend_service: BackendService, discussionid: int,
+                   after: Optional[int] = None, commentsof: Optional[int] = None,
+                   comments_after: Optional[int] = None
+                   ) -> Tuple[Dict, List, List, Optional[int], Dict[int, int]]:
+        """ Gets a discussion with a page of its answers and their first comments.
+
+        Args:
+            - backend_service (BackendService): The backend service.
+            - discussionid (int): The discussion id.
+            - after (Optional[int]): The cursor of the answers page (`None` for the first one).
+            - commentsof (Optional[int]): The id of an answer whose comments are to be
+              fetched starting at `comments_after` instead of at the first page.
+            - comments_after (Optional[int]): The comments cursor for `commentsof`.
+
+        Returns:
+            - Tuple[Dict, List, List, Optional[int], Dict[int, int]]: The discussion data
+              dictionary (empty on error), the list of answer data dictionaries, the list of
+              the comment data dictionaries of those answers, the cursor of the next answers
+              page (`None` if there are no more pages) and the cursor of the next comments
+              page of each answer with more comments, by answer id.
+        """
+        # pylint: disable=too-many-arguments
+        response: ResponseData = backend_service.get_thread(
+            session.get('token'), discussionid, after=after)
+        WebUtils.flash_response_messages(response)
+        thread = response.get_content()
+        if thread is None or not isinstance(thread, dict):
+            return ({}, [], [], None, {})
+        answers: List = list(thread.get('answers', []))
+        comments: List = []
+        comments_next: Dict[int, int] = {}
+        for answer in answers:
+            answer_comments: List = answer['comments']
+            answer_next: Optional[int] = answer.get('comments_next_cursor')
+            if answer['id'] == commentsof and comments_after is not None:
+                answer_comments, answer_next = WebComment.list_comments(
+                    backend_service, answer['id'], after=comments_after)
+            comments.extend(answer_comments)
+            if answer_next is not None:
+                comments_next[answer['id']] = answer_next
+        return (thread, answers, comments, thread.get('next_cursor'), comments_next)
+
     @staticmethod
     def list_reports(backend_service: BackendService) -> List:
         """ Gets the list of discussions from the backend service.
@@ -1,7 +1,7 @@
 """ WebUser class module.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from flask import session
 from dms2223common.data.rest import ResponseData
 from dms2223frontend.data.rest.authservice import AuthService
@@ -12,20 +12,26 @@ class WebUser():
     """ Monostate class responsible of the user operation utilities.
     """
     @staticmethod
-    def list_users(auth_service: AuthService) -> List:
-        """ Gets the list of users from the authentication service.
+    def list_users(auth_service: AuthService, after: Optional[str] = None,
+                   prefix: Optional[str] = None) -> Tuple[List, Optional[str]]:
+        """ Gets a page of users, with their roles, from the authentication service.
 
         Args:
             - auth_service (AuthService): The authentication service.
+            - after (Optional[str]): The cursor of the page to fetch (`None` for the first one).
+            - prefix (Optional[str]): If given, only the users whose name starts with it.
 
         Returns:
-            - List: A list of user data dictionaries (the list may be empty)
+            - Tuple[List, Optional[str]]: A list of user data dictionaries (the list may be
+              empty) and the cursor of the next page (`None` if there are no more pages).
         """
-        response: ResponseData = auth_service.list_users(session.get('token'))
+        response: ResponseData = auth_service.list_users(
+            session.get('token'), after=after, prefix=prefix, with_roles=True)
         WebUtils.flash_response_messages(response)
-        if response.get_content() is not None and isinstance(response.get_content(), list):
-            return list(response.get_content())
-        return []
+        content = response.get_content()
+        if content is not None and isinstance(content, dict):
+            return (list(content.get('users', [])), content.get('next_cursor'))
+        return ([], None)
 
     @staticmethod
     def create_user(auth_service: AuthService, username: str, password: str) -> Optional[Dict]:
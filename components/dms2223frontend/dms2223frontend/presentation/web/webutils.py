@@ -1,6 +1,7 @@
 """ WebUtils class module.
 """
 
+from threading import Lock
 from flask import flash
 from dms2223common.data.rest import ResponseData
 
@@ -8,6 +9,10 @@ from dms2223common.data.rest import ResponseData
 class WebUtils():
     """ Monostate class responsible of various operation utilities.
     """
+
+    # Requests fanned out to several threads share the same session
+    __flash_lock: Lock = Lock()
+
     @staticmethod
     def flash_response_messages(response: ResponseData):
         """ "Flashes" the messages stored in a response if it was not successful.
@@ -16,5 +21,6 @@ class WebUtils():
             - response (ResponseData): The response data object.
         """
         if not response.is_successful():
-            for message in response.get_messages():
-                flash(message, 'error')
+            with WebUtils.__flash_lock:
+                for message in response.get_messages():
+                    flash(message, 'error')